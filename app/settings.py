@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -39,11 +40,16 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'rest_framework.authtoken',
-    'core',
-    'user'
+    'core.apps.CoreConfig',
+    'user.apps.UserConfig',
+    'menu.apps.MenuConfig',
+    'order.apps.OrderConfig',
+    'reminder',
+    'benchmark',
 ]
 
 MIDDLEWARE = [
+    'core.middleware.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -53,6 +59,9 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Per request query and latency instrumentation, see core.middleware.
+INSTRUMENTATION_ENABLED = os.environ.get('INSTRUMENTATION_ENABLED') == '1'
+
 ROOT_URLCONF = 'app.urls'
 
 TEMPLATES = [
@@ -73,17 +82,120 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'app.wsgi.application'
 
+# Threads running the blocking database work of the async views when the
+# project is served through app.asgi.
+ASYNC_DB_WORKERS = int(os.environ.get('ASYNC_DB_WORKERS', 8))
+
 
 # Database
 # https://docs.djangoproject.com/en/3.1/ref/settings/#databases
 
+# The primary database is configured from the environment. Connections are
+# kept open for DB_CONN_MAX_AGE seconds and checked before each request.
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'ENGINE': os.environ.get('DB_ENGINE', 'django.db.backends.sqlite3'),
+        'NAME': os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'),
+        'USER': os.environ.get('DB_USER', ''),
+        'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+        'HOST': os.environ.get('DB_HOST', ''),
+        'PORT': os.environ.get('DB_PORT', ''),
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+    }
+}
+
+# Ping the reused persistent connections when a request starts, closing
+# the ones the server dropped, like CONN_HEALTH_CHECKS in Django 4.1.
+DB_HEALTH_CHECKS = os.environ.get('DB_HEALTH_CHECKS') == '1'
+
+# The menu and option views read from the replicas listed in
+# DB_REPLICA_HOSTS, until the request writes to the primary, see
+# core.routers.
+
+DATABASE_REPLICAS = []
+
+for index, host in enumerate(
+    filter(None, os.environ.get('DB_REPLICA_HOSTS', '').split(','))
+):
+    DATABASES[f'replica{index}'] = dict(
+        DATABASES['default'], HOST=host, TEST={'MIRROR': 'default'}
+    )
+    DATABASE_REPLICAS.append(f'replica{index}')
+
+DATABASE_ROUTERS = ['core.routers.ReplicaRouter']
+
+# Single node installs may run SQLite in WAL mode, so readers do not block
+# the writer. The pragmas are set on every new connection.
+
+SQLITE_WAL_ENABLED = os.environ.get('SQLITE_WAL_ENABLED') == '1'
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'busy_timeout': 5000,
+    'cache_size': -20000,
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/3.1/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            'CACHE_BACKEND',
+            'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'app'),
     }
 }
 
+# Serialized menu payloads are cached in this alias. Workers waiting for
+# another worker to rebuild an entry give up after the lock timeout.
+MENU_CACHE_ALIAS = 'default'
+MENU_CACHE_TIMEOUT = 60 * 60
+MENU_CACHE_LOCK_TIMEOUT = 10
+
+# Today's menu is memoized in each process until the local midnight, a
+# menu change, or this many seconds for changes made by other processes.
+MENU_TODAY_TTL = 60
+
+# Menus planned in a single request to the bulk endpoint.
+MENU_BULK_MAX_SIZE = 1000
+
+# Option searches rank this many of the latest matches by relevance.
+MENU_SEARCH_CANDIDATES = 1000
+
+# Serve menu and option reads with the values() based serializers of
+# menu.fast_serializers instead of the model serializers.
+MENU_FAST_SERIALIZERS = os.environ.get('MENU_FAST_SERIALIZERS') == '1'
+
+# Users authenticated by token are kept in an in-process LRU, or only in
+# the given cache alias when TOKEN_AUTH_SHARED_CACHE is set. Deployments
+# with several workers need the shared cache for revocations to apply
+# everywhere at once.
+TOKEN_AUTH_CACHE_SIZE = 10000
+TOKEN_AUTH_CACHE_TTL = 5 * 60
+TOKEN_AUTH_SHARED_CACHE = os.environ.get('TOKEN_AUTH_SHARED_CACHE')
+
+
+# Django REST framework
+# JSON is rendered and parsed with orjson when it is installed, and with the
+# stdlib json otherwise.
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.1/ref/settings/#auth-password-validators
@@ -104,6 +216,49 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/3.1/topics/auth/passwords/
+# PASSWORD_HASHER picks the hasher used for new passwords. Hashes made with
+# another hasher or cost are upgraded transparently on the next login.
+# bcrypt and argon2 require the bcrypt and argon2-cffi packages.
+
+PASSWORD_HASHER = os.environ.get('PASSWORD_HASHER', 'pbkdf2')
+
+PASSWORD_PBKDF2_ITERATIONS = int(
+    os.environ.get('PASSWORD_PBKDF2_ITERATIONS', 216000)
+)
+
+PASSWORD_BCRYPT_ROUNDS = int(os.environ.get('PASSWORD_BCRYPT_ROUNDS', 12))
+
+PASSWORD_ARGON2_TIME_COST = int(
+    os.environ.get('PASSWORD_ARGON2_TIME_COST', 2)
+)
+
+PASSWORD_ARGON2_MEMORY_COST = int(
+    os.environ.get('PASSWORD_ARGON2_MEMORY_COST', 102400)
+)
+
+PASSWORD_ARGON2_PARALLELISM = int(
+    os.environ.get('PASSWORD_ARGON2_PARALLELISM', 8)
+)
+
+_PASSWORD_HASHERS = {
+    'pbkdf2': 'user.hashers.TunablePBKDF2PasswordHasher',
+    'argon2': 'user.hashers.TunableArgon2PasswordHasher',
+    'bcrypt': 'user.hashers.TunableBCryptSHA256PasswordHasher',
+}
+
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    hasher for name, hasher in _PASSWORD_HASHERS.items()
+    if name != PASSWORD_HASHER
+] + [
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+# Login attempts allowed per email address, see user.throttling.
+LOGIN_THROTTLE_RATE = os.environ.get('LOGIN_THROTTLE_RATE', '10/minute')
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/3.1/topics/i18n/
 
@@ -118,6 +273,61 @@ USE_L10N = True
 USE_TZ = True
 
 
+# Employees may choose their meal until this local time on the menu's date.
+
+ORDER_TIME_ZONE = 'America/Santiago'
+
+ORDER_CUTOFF_TIME = '11:00'
+
+ORDER_BATCH_MAX_SIZE = 5000
+
+# Keep core.OrderSummary up to date on order writes and serve the order
+# report from it. Run order.summary.rebuild_summary() when turning it on.
+ORDER_SUMMARY_ENABLED = os.environ.get('ORDER_SUMMARY_ENABLED') == '1'
+
+# Rows fetched from the cursor and written per chunk by the order export.
+ORDER_EXPORT_CHUNK_SIZE = 2000
+
+
+# Slack reminders
+# The transport is pluggable; deliveries are spread over a pool of workers
+# and throttled with a token bucket of SLACK_RATE_LIMIT messages per second.
+
+SLACK_REMINDER_ENABLED = os.environ.get('SLACK_REMINDER_ENABLED') == '1'
+
+SLACK_TRANSPORT = 'reminder.transport.SlackTransport'
+
+SLACK_API_URL = os.environ.get(
+    'SLACK_API_URL', 'https://slack.com/api/chat.postMessage'
+)
+
+# Recipients are messaged by Slack user id, looked up once per email and
+# cached for SLACK_USER_CACHE_TIMEOUT seconds.
+SLACK_LOOKUP_URL = os.environ.get(
+    'SLACK_LOOKUP_URL', 'https://slack.com/api/users.lookupByEmail'
+)
+
+SLACK_USER_CACHE_TIMEOUT = 24 * 60 * 60
+
+SLACK_TOKEN = os.environ.get('SLACK_TOKEN', '')
+
+SLACK_TIMEOUT = 5
+
+SLACK_WORKERS = 8
+
+SLACK_RATE_LIMIT = 50
+
+SLACK_BURST = 50
+
+SLACK_RETRIES = 3
+
+SLACK_BACKOFF = 0.5
+
+SLACK_CHUNK_SIZE = 500
+
+PUBLIC_MENU_URL = 'https://nora.cornershop.io/menu/{uuid}'
+
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/3.1/howto/static-files/
 
@@ -1,6 +1,13 @@
 from django.urls import path, include
 
+from core.views import StatsView
+from menu.views import PublicMenuView
+
 urlpatterns = [
     path('api/user/', include('user.urls')),
     path('api/menu/', include('menu.urls')),
+    path('api/async/menu/', include('menu.async_urls')),
+    path('api/order/', include('order.urls')),
+    path('api/stats/', StatsView.as_view(), name='stats'),
+    path('menu/<uuid:uuid>', PublicMenuView.as_view(), name='public-menu'),
 ]
@@ -0,0 +1,78 @@
+import time
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+
+from .runner import seed, summarize
+
+PATHS = ('menu:menu-list', 'menu:option-list')
+
+
+def run_handler(path, token, requests, max_age):
+    """Serve a path through the WSGI handler with a connection max age"""
+    # Unlike the test client, the handler closes obsolete connections
+    handler = WSGIHandler()
+    environ = RequestFactory()._base_environ(
+        PATH_INFO=path,
+        REQUEST_METHOD='GET',
+        HTTP_AUTHORIZATION=f'Token {token}',
+    )
+    conn = connections['default']
+    previous = conn.settings_dict['CONN_MAX_AGE']
+    opened = []
+
+    def count(sender, connection, **kwargs):
+        if connection.alias == 'default':
+            opened.append(connection)
+
+    def start_response(status, headers):
+        if not status.startswith('200'):
+            raise RuntimeError(f'{path} responded {status}')
+
+    conn.close()
+    conn.settings_dict['CONN_MAX_AGE'] = max_age
+    connection_created.connect(count)
+    latencies = []
+    try:
+        start = time.perf_counter()
+        for _ in range(requests):
+            request_start = time.perf_counter()
+            response = handler(dict(environ), start_response)
+            b''.join(response)
+            response.close()
+            latencies.append(time.perf_counter() - request_start)
+        elapsed = time.perf_counter() - start
+    finally:
+        connection_created.disconnect(count)
+        conn.settings_dict['CONN_MAX_AGE'] = previous
+        conn.close()
+
+    stats = summarize(latencies, elapsed)
+    stats['mean_ms'] = round(sum(latencies) / len(latencies) * 1000, 3)
+    stats['connections'] = len(opened)
+    return stats
+
+
+def compare_connections(requests=200, max_age=60):
+    """Benchmark new connections per request against persistent ones"""
+    fixtures = seed()
+    results = {}
+    with override_settings(ALLOWED_HOSTS=['*']):
+        for name in PATHS:
+            path = reverse(name)
+            fresh = run_handler(path, fixtures['token'], requests, 0)
+            persistent = run_handler(
+                path, fixtures['token'], requests, max_age
+            )
+            results[name] = {
+                'fresh': fresh,
+                'persistent': persistent,
+                'saved_ms': round(
+                    fresh['mean_ms'] - persistent['mean_ms'], 3
+                ),
+            }
+
+    return results
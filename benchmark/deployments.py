@@ -0,0 +1,84 @@
+import asyncio
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+
+from .runner import seed, summarize
+
+# Each pair maps a WSGI view to its async counterpart served under ASGI.
+PAIRS = (
+    ('menu-detail', 'menu:menu-detail', 'menu-async:menu-detail'),
+    ('option-list', 'menu:option-list', 'menu-async:option-list'),
+)
+
+
+def url(name, fixtures):
+    if name.endswith('menu-detail'):
+        return reverse(name, args=[fixtures['menu_id']])
+    return reverse(name)
+
+
+def run_wsgi(path, token, requests, concurrency):
+    """Hit a path through the WSGI handler from a pool of threads"""
+    latencies = []
+    counter = itertools.count()
+
+    def worker():
+        client = Client(HTTP_AUTHORIZATION=f'Token {token}')
+        while next(counter) < requests:
+            start = time.perf_counter()
+            res = client.get(path)
+            latencies.append(time.perf_counter() - start)
+            if res.status_code != 200:
+                raise RuntimeError(f'{path} responded {res.status_code}')
+        connections.close_all()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+
+    return summarize(latencies, time.perf_counter() - start)
+
+
+def run_asgi(path, token, requests, concurrency):
+    """Hit a path through the ASGI handler from concurrent coroutines"""
+    latencies = []
+    counter = itertools.count()
+
+    async def worker():
+        client = AsyncClient()
+        while next(counter) < requests:
+            start = time.perf_counter()
+            res = await client.get(path, authorization=f'Token {token}')
+            b''.join(res.streaming_content)
+            latencies.append(time.perf_counter() - start)
+            if res.status_code != 200:
+                raise RuntimeError(f'{path} responded {res.status_code}')
+
+    async def main():
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    return summarize(latencies, time.perf_counter() - start)
+
+
+def compare_deployments(requests=200, concurrency=16):
+    """Benchmark the WSGI views side by side with their async versions"""
+    fixtures = seed()
+    results = {}
+    with override_settings(ALLOWED_HOSTS=['*']):
+        for name, wsgi_name, asgi_name in PAIRS:
+            results[name] = {
+                'wsgi': run_wsgi(url(wsgi_name, fixtures),
+                                 fixtures['token'], requests, concurrency),
+                'asgi': run_asgi(url(asgi_name, fixtures),
+                                 fixtures['token'], requests, concurrency),
+            }
+
+    return results
@@ -0,0 +1,24 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from benchmark.connections import compare_connections
+
+
+class Command(BaseCommand):
+    """Measure the latency saved by persistent database connections"""
+    help = ('Benchmark the menu endpoints opening a connection per request '
+            'and reusing persistent connections')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200,
+                            help='Requests made to each endpoint')
+        parser.add_argument('--max-age', type=int, default=60,
+                            help='CONN_MAX_AGE of the persistent run')
+
+    def handle(self, *args, **options):
+        results = compare_connections(
+            requests=options['requests'],
+            max_age=options['max_age'],
+        )
+        self.stdout.write(json.dumps(results, indent=2))
@@ -0,0 +1,24 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from benchmark.rendering import SIZES, compare_renderers
+
+
+class Command(BaseCommand):
+    """Compare the JSON renderers over menu detail payloads"""
+    help = ('Time rendering and parsing lists of serialized menus with '
+            "DRF's JSON renderer and the fast renderer")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=SIZES,
+                            help='Number of menus of each payload')
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='Runs per measure, the fastest is kept')
+
+    def handle(self, *args, **options):
+        results = compare_renderers(
+            sizes=options['sizes'],
+            repeat=options['repeat'],
+        )
+        self.stdout.write(json.dumps(results, indent=2))
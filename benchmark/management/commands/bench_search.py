@@ -0,0 +1,37 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from benchmark.search import QUERIES, compare_search, populate
+from menu import search
+
+
+class Command(BaseCommand):
+    """Compare option substring scans with the search index"""
+    help = ('Time searching options with substring scans and with the '
+            'search index, adding synthetic options to the database up '
+            'to the requested count first')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--options', type=int, default=1000000,
+                            help='Options in the database when searching')
+        parser.add_argument('--queries', nargs='+', default=QUERIES,
+                            help='Search queries timed')
+        parser.add_argument('--limit', type=int, default=50,
+                            help='Matches returned by each search')
+        parser.add_argument('--repeat', type=int, default=3,
+                            help='Runs per measure, the fastest is kept')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        count = populate(options['options'], seed=options['seed'])
+        results = compare_search(
+            queries=options['queries'],
+            limit=options['limit'],
+            repeat=options['repeat'],
+        )
+        self.stdout.write(json.dumps({
+            'options': count,
+            'backend': search.backend(),
+            'queries': results,
+        }, indent=2))
@@ -0,0 +1,28 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmark.serialization import compare_serializers
+from core.models import Menu
+
+
+class Command(BaseCommand):
+    """Compare the model and fast menu serializers"""
+    help = ('Report the menus serialized per second, queries included, by '
+            'the model serializers and the values() based ones')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=1000,
+                            help='Number of latest menus serialized')
+        parser.add_argument('--repeat', type=int, default=3,
+                            help='Runs per measure, the fastest is kept')
+
+    def handle(self, *args, **options):
+        if not Menu.objects.exists():
+            raise CommandError('There are no menus, run seed_data first')
+
+        results = compare_serializers(
+            limit=options['limit'],
+            repeat=options['repeat'],
+        )
+        self.stdout.write(json.dumps(results, indent=2))
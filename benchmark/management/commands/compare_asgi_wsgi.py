@@ -0,0 +1,23 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from benchmark.deployments import compare_deployments
+
+
+class Command(BaseCommand):
+    """Compare the WSGI menu views with the async ASGI read path"""
+    help = 'Benchmark the menu read path under WSGI and ASGI side by side'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200,
+                            help='Requests made to each endpoint')
+        parser.add_argument('--concurrency', type=int, default=16,
+                            help='Number of concurrent clients')
+
+    def handle(self, *args, **options):
+        results = compare_deployments(
+            requests=options['requests'],
+            concurrency=options['concurrency'],
+        )
+        self.stdout.write(json.dumps(results, indent=2))
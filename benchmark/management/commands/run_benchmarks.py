@@ -0,0 +1,53 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmark import runner
+
+
+class Command(BaseCommand):
+    """Benchmark the API endpoints against the local database"""
+    help = ('Report latency percentiles, requests per second and queries '
+            'per request of every API endpoint as JSON')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=100,
+                            help='Requests made to each endpoint')
+        parser.add_argument('--concurrency', type=int, default=4,
+                            help='Number of concurrent clients')
+        parser.add_argument('--endpoint', action='append', dest='endpoints',
+                            help='Only benchmark this URL name')
+        parser.add_argument('--output', help='Write the results to a file')
+        parser.add_argument('--compare', metavar='BASELINE',
+                            help='Flag regressions against a baseline file')
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help='Tolerated relative regression')
+
+    def handle(self, *args, **options):
+        results = runner.run(
+            requests=options['requests'],
+            concurrency=options['concurrency'],
+            names=options['endpoints'],
+        )
+        report = json.dumps({
+            'requests': options['requests'],
+            'concurrency': options['concurrency'],
+            'endpoints': results,
+        }, indent=2)
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                output.write(report)
+        self.stdout.write(report)
+
+        if options['compare']:
+            with open(options['compare']) as baseline_file:
+                baseline = json.load(baseline_file)['endpoints']
+            regressions = runner.compare(
+                results, baseline, options['threshold']
+            )
+            if regressions:
+                raise CommandError(
+                    'Regressions found:\n' + '\n'.join(regressions)
+                )
+            self.stdout.write('No regressions against the baseline')
@@ -0,0 +1,82 @@
+import datetime
+import io
+import time
+
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.models import Menu, Option
+from core.renderers import FastJSONParser, FastJSONRenderer
+from menu.serializers import MenuDetailSerializer
+
+SIZES = (10, 100, 1000, 10000)
+OPTIONS_PER_MENU = 4
+
+
+def menu_payload(size):
+    """Serialize some unsaved menus with prefetched options"""
+    created_at = timezone.now()
+    menus = []
+    for i in range(1, size + 1):
+        menu = Menu(
+            id=i,
+            name=f'Menú del día {i}',
+            date=datetime.date(2021, 1, 1) + datetime.timedelta(days=i),
+            created_at=created_at,
+        )
+        options = Option.objects.none()
+        options._result_cache = [
+            Option(id=i * OPTIONS_PER_MENU + j,
+                   description=f'Corn pie, Salad and Dessert {j}')
+            for j in range(OPTIONS_PER_MENU)
+        ]
+        menu._prefetched_objects_cache = {'options': options}
+        menus.append(menu)
+
+    return MenuDetailSerializer(menus, many=True).data
+
+
+def best_time(func, repeat):
+    """Return the fastest of some runs of a function in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return round(min(timings) * 1000, 3)
+
+
+def compare_renderers(sizes=SIZES, repeat=5):
+    """Time DRF's JSON renderer and parser against the fast ones"""
+    results = {}
+    for size in sizes:
+        data = menu_payload(size)
+        body = JSONRenderer().render(data)
+        if FastJSONRenderer().render(data) != body:
+            raise RuntimeError(f'Rendered {size} menus differently')
+
+        stats = {
+            'bytes': len(body),
+            'render_ms': best_time(
+                lambda: JSONRenderer().render(data), repeat
+            ),
+            'fast_render_ms': best_time(
+                lambda: FastJSONRenderer().render(data), repeat
+            ),
+            'parse_ms': best_time(
+                lambda: JSONParser().parse(io.BytesIO(body)), repeat
+            ),
+            'fast_parse_ms': best_time(
+                lambda: FastJSONParser().parse(io.BytesIO(body)), repeat
+            ),
+        }
+        stats['render_speedup'] = round(
+            stats['render_ms'] / (stats['fast_render_ms'] or 0.001), 2
+        )
+        stats['parse_speedup'] = round(
+            stats['parse_ms'] / (stats['fast_parse_ms'] or 0.001), 2
+        )
+        results[size] = stats
+
+    return results
@@ -0,0 +1,193 @@
+import itertools
+import math
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from core.cutoff import local_today
+from core.models import Menu, Option
+
+BENCH_EMAIL = 'bench@cornershop.cl'
+BENCH_PASSWORD = 'bench-password'
+CREATED_EMAIL_DOMAIN = 'bench.cornershop.cl'
+
+
+class Endpoint:
+    """A request made against one of the API endpoints"""
+
+    def __init__(self, name, method='get', authenticated=False):
+        self.name = name
+        self.method = method
+        self.authenticated = authenticated
+
+    def url(self, fixtures):
+        if self.name == 'menu:menu-detail':
+            return reverse(self.name, args=[fixtures['menu_id']])
+        return reverse(self.name)
+
+    def payload(self, fixtures):
+        if self.name == 'user:create':
+            return {
+                'email': f'{uuid.uuid4().hex}@{CREATED_EMAIL_DOMAIN}',
+                'password': BENCH_PASSWORD,
+                'name': 'Benchmark',
+            }
+        if self.name == 'user:token':
+            return {'email': BENCH_EMAIL, 'password': BENCH_PASSWORD}
+        return None
+
+
+ENDPOINTS = [
+    Endpoint('user:create', method='post'),
+    Endpoint('user:token', method='post'),
+    Endpoint('user:me', authenticated=True),
+    Endpoint('menu:option-list', authenticated=True),
+    Endpoint('menu:menu-list'),
+    Endpoint('menu:menu-detail'),
+]
+
+
+def seed():
+    """Make sure the fixtures the benchmark needs exist"""
+    user_model = get_user_model()
+    user = user_model.objects.filter(email=BENCH_EMAIL).first()
+    if user is None:
+        user = user_model.objects.create_user(BENCH_EMAIL, BENCH_PASSWORD,
+                                              is_staff=True)
+    token, _ = Token.objects.get_or_create(user=user)
+
+    menu = Menu.objects.for_today()
+    if menu is None:
+        menu = Menu.objects.create(date=local_today())
+        menu.options.add(*[
+            Option.objects.intern(f'Benchmark option {i}')
+            for i in range(4)
+        ])
+
+    return {'token': token.key, 'menu_id': menu.pk}
+
+
+def cleanup():
+    """Delete the users created while benchmarking"""
+    get_user_model().objects.filter(
+        email__endswith=f'@{CREATED_EMAIL_DOMAIN}'
+    ).delete()
+
+
+def percentile(values, percent):
+    """Return the nearest-rank percentile of some sorted values"""
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(values)))
+    return values[rank - 1]
+
+
+def summarize(latencies, elapsed, queries=None):
+    """Return the latency, throughput and query stats of a run"""
+    latencies = sorted(latencies)
+    count = len(latencies)
+    stats = {
+        'requests': count,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        'rps': round(count / elapsed, 2) if elapsed else 0.0,
+    }
+    if queries is not None:
+        stats['queries_per_request'] = round(sum(queries) / count, 2)
+
+    return stats
+
+
+def run_endpoint(endpoint, fixtures, requests, concurrency):
+    """Hit an endpoint a number of times and summarize the results"""
+    latencies = []
+    queries = []
+    lock = threading.Lock()
+    counter = itertools.count()
+
+    def worker():
+        client = Client()
+        headers = {}
+        if endpoint.authenticated:
+            headers['HTTP_AUTHORIZATION'] = f"Token {fixtures['token']}"
+        send = getattr(client, endpoint.method)
+        url = endpoint.url(fixtures)
+
+        while next(counter) < requests:
+            payload = endpoint.payload(fixtures)
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                res = send(url, payload, **headers)
+                latency = time.perf_counter() - start
+            if res.status_code >= 400:
+                raise RuntimeError(
+                    f'{endpoint.name} responded {res.status_code}'
+                )
+            with lock:
+                latencies.append(latency)
+                queries.append(len(captured.captured_queries))
+
+        if concurrency > 1:
+            connections.close_all()
+
+    start = time.perf_counter()
+    with override_settings(LOGIN_THROTTLE_RATE=None, ALLOWED_HOSTS=['*']):
+        if concurrency == 1:
+            worker()
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                for future in [pool.submit(worker)
+                               for _ in range(concurrency)]:
+                    future.result()
+
+    return summarize(latencies, time.perf_counter() - start, queries)
+
+
+def run(requests=100, concurrency=4, names=None):
+    """Benchmark the endpoints and return the results of each one"""
+    fixtures = seed()
+    endpoints = [e for e in ENDPOINTS if not names or e.name in names]
+    try:
+        return {
+            endpoint.name: run_endpoint(
+                endpoint, fixtures, requests, concurrency
+            )
+            for endpoint in endpoints
+        }
+    finally:
+        cleanup()
+
+
+def compare(results, baseline, threshold=0.2):
+    """Return the regressions of some results against a baseline"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        if current['p95_ms'] > previous['p95_ms'] * (1 + threshold):
+            regressions.append(
+                f"{name}: p95 {previous['p95_ms']}ms -> "
+                f"{current['p95_ms']}ms"
+            )
+        if current['rps'] < previous['rps'] * (1 - threshold):
+            regressions.append(
+                f"{name}: rps {previous['rps']} -> {current['rps']}"
+            )
+        if current['queries_per_request'] > previous['queries_per_request']:
+            regressions.append(
+                f"{name}: queries {previous['queries_per_request']} -> "
+                f"{current['queries_per_request']}"
+            )
+
+    return regressions
@@ -0,0 +1,74 @@
+import random
+import time
+from functools import reduce
+from operator import and_
+
+from django.db.models import Q
+
+from core.management.commands.seed_data import DESSERTS, MAINS, SIDES
+from core.models import Option
+from menu import search
+
+QUERIES = ('chicken', 'vegetarian', 'corn pie', 'rice salad')
+STYLES = (
+    'Homemade', 'Grilled', 'Spicy', 'Vegetarian', 'Baked', 'Classic',
+    'Roasted', 'Creamy',
+)
+
+
+def populate(count, seed=42, chunk_size=10000):
+    """Add synthetic options up to a count of them and index them all"""
+    rng = random.Random(seed)
+    number = total = Option.objects.count()
+    while total < count:
+        options = []
+        size = min(count - total, chunk_size)
+        for number in range(number + 1, number + size + 1):
+            option = Option(description=(
+                f'{rng.choice(STYLES)} {rng.choice(MAINS).lower()}, '
+                f'{rng.choice(SIDES)} and {rng.choice(DESSERTS)} #{number}'
+            ))
+            option.set_description_hash()
+            options.append(option)
+        Option.objects.bulk_create(options, ignore_conflicts=True)
+        total = Option.objects.count()
+
+    search.rebuild_index()
+    return Option.objects.count()
+
+
+def milliseconds(func, repeat):
+    """Return the best time in milliseconds of some runs of a function"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best * 1000, 3)
+
+
+def scan(query, limit):
+    """Return the options matching every term of a query by substring"""
+    terms = search.search_terms(query)
+    return list(Option.objects.filter(reduce(and_, (
+        Q(description__icontains=term) for term in terms
+    ))).order_by('-description')[:limit])
+
+
+def compare_search(queries=QUERIES, limit=50, repeat=3):
+    """Time substring scans against the search index for some queries"""
+    results = {}
+    for query in queries:
+        scanned = milliseconds(lambda: scan(query, limit), repeat)
+        indexed = milliseconds(
+            lambda: list(search.search(Option.objects.all(), query, limit)),
+            repeat
+        )
+        results[query] = {
+            'scan_ms': scanned,
+            'index_ms': indexed,
+            'speedup': round(scanned / indexed, 2) if indexed else 0.0,
+        }
+
+    return results
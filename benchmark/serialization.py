@@ -0,0 +1,59 @@
+import time
+
+from django.db.models import Prefetch
+
+from core.models import Menu, Option
+from menu import fast_serializers, serializers
+
+# Each case pairs a model serializer with its fast counterpart, along with
+# the options prefetched by the menu views for it.
+CASES = (
+    ('menu-list', serializers.MenuSerializer,
+     fast_serializers.MenuValuesSerializer, ('id',)),
+    ('menu-detail', serializers.MenuDetailSerializer,
+     fast_serializers.MenuDetailValuesSerializer, ('id', 'description')),
+)
+
+
+def objects_per_second(func, count, repeat):
+    """Return the best objects per second of some runs of a function"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return round(count / best, 1) if best else 0.0
+
+
+def compare_serializers(limit=1000, repeat=3):
+    """Serialize the latest menus with the model and fast serializers"""
+    ids = list(Menu.objects.order_by('-date', '-id').values_list(
+        'id', flat=True
+    )[:limit])
+    menus = Menu.objects.filter(id__in=ids).order_by('-date', '-id').only(
+        'id', 'name', 'date', 'cutoff_time', 'cutoff_at', 'created_at'
+    )
+
+    results = {}
+    for name, serializer_class, fast_class, option_fields in CASES:
+        options = Option.objects.only(*option_fields).order_by('id')
+        queryset = menus.prefetch_related(
+            Prefetch('options', queryset=options)
+        )
+        model = objects_per_second(
+            lambda: serializer_class(queryset.all(), many=True).data,
+            len(ids), repeat
+        )
+        fast = objects_per_second(
+            lambda: fast_class(fast_class.values(menus), many=True).data,
+            len(ids), repeat
+        )
+        results[name] = {
+            'objects': len(ids),
+            'model_per_second': model,
+            'fast_per_second': fast,
+            'speedup': round(fast / model, 2) if model else 0.0,
+        }
+
+    return results
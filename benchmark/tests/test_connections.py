@@ -0,0 +1,21 @@
+from django.core.cache import cache
+from django.test import TransactionTestCase
+
+from benchmark.connections import PATHS, compare_connections
+
+
+class ConnectionBenchmarkTests(TransactionTestCase):
+    """Test the persistent connections benchmark"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_compare_connections(self):
+        """Test both connection modes are benchmarked for every path"""
+        results = compare_connections(requests=3)
+
+        self.assertEqual(set(results), set(PATHS))
+        for result in results.values():
+            self.assertEqual(result['fresh']['requests'], 3)
+            self.assertEqual(result['persistent']['requests'], 3)
+            self.assertIn('saved_ms', result)
@@ -0,0 +1,20 @@
+from django.core.cache import cache
+from django.test import TransactionTestCase
+
+from benchmark.deployments import PAIRS, compare_deployments
+
+
+class DeploymentComparisonTests(TransactionTestCase):
+    """Test the WSGI and ASGI side by side benchmark"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_compare_deployments(self):
+        """Test every pair is benchmarked under both handlers"""
+        results = compare_deployments(requests=4, concurrency=2)
+
+        self.assertEqual(set(results), {name for name, _, _ in PAIRS})
+        for pair in results.values():
+            self.assertEqual(pair['wsgi']['requests'], 4)
+            self.assertEqual(pair['asgi']['requests'], 4)
@@ -0,0 +1,24 @@
+from django.test import SimpleTestCase
+
+from benchmark.rendering import (OPTIONS_PER_MENU, compare_renderers,
+                                 menu_payload)
+
+
+class RenderingBenchmarkTests(SimpleTestCase):
+    """Test the JSON renderers benchmark"""
+
+    def test_menu_payload(self):
+        """Test the payload is made of serialized menu details"""
+        data = menu_payload(3)
+
+        self.assertEqual(len(data), 3)
+        self.assertEqual(len(data[0]['options']), OPTIONS_PER_MENU)
+
+    def test_compare_renderers(self):
+        """Test every payload size is measured"""
+        results = compare_renderers(sizes=(1, 10), repeat=1)
+
+        self.assertEqual(set(results), {1, 10})
+        for stats in results.values():
+            self.assertGreater(stats['bytes'], 0)
+            self.assertIn('render_speedup', stats)
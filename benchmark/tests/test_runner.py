@@ -0,0 +1,69 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from benchmark import runner
+from core.models import Menu
+
+import datetime
+
+
+class RunnerTests(TestCase):
+    """Test the API benchmark runner"""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles"""
+        values = list(range(1, 101))
+
+        self.assertEqual(runner.percentile(values, 50), 50)
+        self.assertEqual(runner.percentile(values, 99), 99)
+        self.assertEqual(runner.percentile([], 50), 0.0)
+
+    def test_run_every_endpoint(self):
+        """Test every endpoint is benchmarked and reported"""
+        results = runner.run(requests=3, concurrency=1)
+
+        self.assertEqual(
+            set(results), {endpoint.name for endpoint in runner.ENDPOINTS}
+        )
+        for stats in results.values():
+            self.assertEqual(stats['requests'], 3)
+            self.assertGreater(stats['rps'], 0)
+            self.assertLessEqual(stats['p50_ms'], stats['p99_ms'])
+        self.assertFalse(get_user_model().objects.filter(
+            email__endswith=runner.CREATED_EMAIL_DOMAIN
+        ).exists())
+
+    def test_seed_on_a_new_day(self):
+        """Test seeding a later day reuses the benchmark options"""
+        runner.seed()
+        menu = Menu.objects.get()
+        menu.date -= datetime.timedelta(days=1)
+        menu.save()
+
+        menu_id = runner.seed()['menu_id']
+
+        self.assertNotEqual(menu_id, menu.id)
+        self.assertEqual(
+            set(Menu.objects.get(id=menu_id).options.all()),
+            set(menu.options.all())
+        )
+
+    def test_compare_flags_regressions(self):
+        """Test slower, lower throughput or chattier endpoints are flagged"""
+        baseline = {
+            'menu:menu-list': {
+                'p95_ms': 10, 'rps': 100, 'queries_per_request': 2,
+            },
+            'user:me': {'p95_ms': 10, 'rps': 100, 'queries_per_request': 1},
+        }
+        results = {
+            'menu:menu-list': {
+                'p95_ms': 11, 'rps': 95, 'queries_per_request': 2,
+            },
+            'user:me': {'p95_ms': 20, 'rps': 50, 'queries_per_request': 2},
+        }
+
+        regressions = runner.compare(results, baseline, threshold=0.2)
+
+        self.assertEqual(len(regressions), 3)
+        self.assertTrue(all(r.startswith('user:me') for r in regressions))
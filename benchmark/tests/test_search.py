@@ -0,0 +1,43 @@
+from django.core.management import call_command
+from django.test import TestCase
+
+from benchmark.search import compare_search, populate
+from core.models import Option
+from menu import search
+
+import io
+import json
+
+
+class SearchBenchmarkTests(TestCase):
+    """Test the option search benchmark"""
+
+    def test_populate(self):
+        """Test options are added up to the count and indexed"""
+        Option.objects.create(description='Corn pie')
+
+        self.assertEqual(populate(30, chunk_size=7), 30)
+        self.assertEqual(populate(10), 30)
+
+        ids = search.ranked_ids(Option.objects.all(), ['and'], 100)
+        self.assertEqual(len(ids), 29)
+
+    def test_compare_search(self):
+        """Test scans and searches are timed for every query"""
+        populate(50)
+
+        results = compare_search(queries=('chicken', 'corn'), repeat=1)
+
+        self.assertEqual(set(results), {'chicken', 'corn'})
+        for stats in results.values():
+            self.assertGreater(stats['index_ms'], 0)
+
+    def test_command(self):
+        """Test the command reports the options searched"""
+        out = io.StringIO()
+
+        call_command('bench_search', options=20, repeat=1, stdout=out)
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['options'], 20)
+        self.assertEqual(report['backend'], 'fts5')
@@ -0,0 +1,31 @@
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from benchmark.serialization import CASES, compare_serializers
+from core.models import Menu, Option
+
+import datetime
+
+
+class SerializationBenchmarkTests(TestCase):
+    """Test the menu serializers benchmark"""
+
+    def test_compare_serializers(self):
+        """Test both serializers are measured for every case"""
+        for i in range(3):
+            menu = Menu.objects.create(
+                date=datetime.date(2021, 1, 4) + datetime.timedelta(days=i)
+            )
+            menu.options.add(Option.objects.intern('Corn pie'))
+
+        results = compare_serializers(limit=2, repeat=1)
+
+        self.assertEqual(set(results), {name for name, *_ in CASES})
+        for stats in results.values():
+            self.assertEqual(stats['objects'], 2)
+            self.assertGreater(stats['fast_per_second'], 0)
+
+    def test_requires_menus(self):
+        """Test the command asks for data when there are no menus"""
+        with self.assertRaises(CommandError):
+            call_command('bench_serializers')
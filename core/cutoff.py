@@ -0,0 +1,34 @@
+import datetime
+
+import pytz
+from django.conf import settings
+from django.utils import timezone
+
+
+def order_timezone():
+    """Return the time zone where the order cutoff is defined"""
+    return pytz.timezone(settings.ORDER_TIME_ZONE)
+
+
+def local_now(now=None):
+    """Return the current time in the order time zone"""
+    return timezone.localtime(now or timezone.now(), order_timezone())
+
+
+def local_today(now=None):
+    """Return the current date in the order time zone"""
+    return local_now(now).date()
+
+
+def default_cutoff_time():
+    """Return the local time when ordering closes, unless a menu says so"""
+    return datetime.time.fromisoformat(settings.ORDER_CUTOFF_TIME)
+
+
+def cutoff_at(date, cutoff_time=None):
+    """Return the aware instant when ordering closes for a menu date"""
+    if cutoff_time is None:
+        cutoff_time = default_cutoff_time()
+
+    local = datetime.datetime.combine(date, cutoff_time)
+    return order_timezone().localize(local)
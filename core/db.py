@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from .routers import release_primary
+
+
+@receiver(request_started)
+def reset_routing(**kwargs):
+    """Route the reads of every request to the primary until it opts in"""
+    release_primary()
+
+
+@receiver(request_started)
+def check_connections(**kwargs):
+    """Close the persistent connections that stopped working"""
+    if not settings.DB_HEALTH_CHECKS:
+        return
+
+    # Django only checks connections that raised, a connection the server
+    # dropped while idle would fail the first query of the request
+    for conn in connections.all():
+        if conn.connection is None or conn.in_atomic_block:
+            continue
+        if not conn.is_usable():
+            conn.close()
+
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    """Apply the SQLite pragmas to every new connection"""
+    if connection.vendor != 'sqlite' or not settings.SQLITE_WAL_ENABLED:
+        return
+
+    with connection.cursor() as cursor:
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
@@ -0,0 +1,74 @@
+from collections import Counter
+
+from django.apps import apps as global_apps
+from django.db.models import Count, F, Min
+
+
+def find_duplicates(limit, apps=global_apps):
+    """Return up to limit duplicate option ids mapped to the oldest one"""
+    Option = apps.get_model('core', 'Option')
+    kept = dict(
+        Option.objects.values('description_hash')
+        .annotate(total=Count('id'), kept=Min('id'))
+        .filter(total__gt=1)
+        .order_by()
+        .values_list('description_hash', 'kept')[:limit]
+    )
+    rows = Option.objects.filter(description_hash__in=kept).order_by(
+        'id'
+    ).values_list('id', 'description_hash')
+    replacements = {}
+    for option_id, digest in rows.iterator():
+        if option_id == kept[digest]:
+            continue
+        replacements[option_id] = kept[digest]
+        if len(replacements) == limit:
+            break
+    return replacements
+
+
+def merge_options(replacements, apps=global_apps):
+    """Merge duplicate options, return the ids of the menus rewritten"""
+    Menu = apps.get_model('core', 'Menu')
+    Option = apps.get_model('core', 'Option')
+    Order = apps.get_model('core', 'Order')
+    OrderSummary = apps.get_model('core', 'OrderSummary')
+    Link = Menu.options.through
+    duplicate_ids = list(replacements)
+
+    links = Link.objects.filter(option_id__in=duplicate_ids)
+    menu_options = list(links.values_list('menu_id', 'option_id'))
+    Link.objects.bulk_create([
+        Link(menu_id=menu_id, option_id=replacements[option_id])
+        for menu_id, option_id in menu_options
+    ], ignore_conflicts=True)
+    links.delete()
+
+    merged = {}
+    for duplicate_id, kept_id in replacements.items():
+        merged.setdefault(kept_id, []).append(duplicate_id)
+    # Only option ids change, no order moves to another (user, menu) pair
+    for kept_id, ids in merged.items():
+        Order.objects.filter(option_id__in=ids).update(option_id=kept_id)
+
+    summaries = OrderSummary.objects.filter(option_id__in=duplicate_ids)
+    deltas = Counter()
+    for menu_id, option_id, observation, count in summaries.values_list(
+            'menu_id', 'option_id', 'observation', 'count'):
+        deltas[menu_id, replacements[option_id], observation] += count
+    summaries.delete()
+    for (menu_id, option_id, observation), count in deltas.items():
+        lookup = {
+            'menu_id': menu_id,
+            'option_id': option_id,
+            'observation': observation,
+        }
+        if not OrderSummary.objects.filter(**lookup).update(
+                count=F('count') + count):
+            OrderSummary.objects.create(count=count, **lookup)
+
+    # Nothing references the duplicates anymore, skip the collector
+    duplicates = Option.objects.filter(id__in=duplicate_ids)
+    duplicates._raw_delete(duplicates.db)
+
+    return {menu_id for menu_id, _ in menu_options}
@@ -0,0 +1,14 @@
+import hashlib
+import unicodedata
+
+
+def normalize_description(description):
+    """Return the form of a description shared by all its spellings"""
+    text = unicodedata.normalize('NFKC', description)
+    return ' '.join(text.split()).casefold()
+
+
+def description_hash(description):
+    """Return the hash identifying the option of a description"""
+    normalized = normalize_description(description)
+    return hashlib.sha256(normalized.encode()).hexdigest()
@@ -0,0 +1,111 @@
+import threading
+from contextvars import ContextVar
+from time import perf_counter
+
+current_stats = ContextVar('current_stats', default=None)
+
+BUCKETS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, float('inf'))
+
+
+class RequestStats:
+    """Queries and timings recorded while serving a request"""
+
+    def __init__(self):
+        self.endpoint = None
+        self.queries = 0
+        self.sql_time = 0.0
+        self.serializer_time = 0.0
+        self.wall_time = 0.0
+        self.serializing = False
+
+    def __call__(self, execute, sql, params, many, context):
+        """Execute a query, recording its duration"""
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.sql_time += perf_counter() - start
+
+    def server_timing(self):
+        """Return the value of the Server-Timing header"""
+        return ', '.join([
+            f'db;dur={self.sql_time * 1000:.2f};desc="{self.queries} queries"',
+            f'serializer;dur={self.serializer_time * 1000:.2f}',
+            f'total;dur={self.wall_time * 1000:.2f}',
+        ])
+
+
+class TimedSerializerMixin:
+    """Record the time spent serializing into the current request stats"""
+
+    def to_representation(self, instance):
+        stats = current_stats.get()
+        if stats is None or stats.serializing:
+            return super().to_representation(instance)
+
+        stats.serializing = True
+        start = perf_counter()
+        try:
+            return super().to_representation(instance)
+        finally:
+            stats.serializer_time += perf_counter() - start
+            stats.serializing = False
+
+
+class Histogram:
+    """In-process latency histogram aggregated per endpoint"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, stats):
+        """Add the stats of a request to its endpoint"""
+        wall_ms = stats.wall_time * 1000
+        with self._lock:
+            entry = self._endpoints.setdefault(stats.endpoint, {
+                'count': 0,
+                'queries': 0,
+                'sql_ms': 0.0,
+                'serializer_ms': 0.0,
+                'wall_ms': 0.0,
+                'buckets': [0] * len(BUCKETS),
+            })
+            entry['count'] += 1
+            entry['queries'] += stats.queries
+            entry['sql_ms'] += stats.sql_time * 1000
+            entry['serializer_ms'] += stats.serializer_time * 1000
+            entry['wall_ms'] += wall_ms
+            for i, bound in enumerate(BUCKETS):
+                if wall_ms <= bound:
+                    entry['buckets'][i] += 1
+                    break
+
+    def snapshot(self):
+        """Return the aggregated stats of every endpoint"""
+        with self._lock:
+            endpoints = {}
+            for endpoint, entry in self._endpoints.items():
+                count = entry['count']
+                endpoints[endpoint] = {
+                    'count': count,
+                    'avg_queries': entry['queries'] / count,
+                    'avg_sql_ms': entry['sql_ms'] / count,
+                    'avg_serializer_ms': entry['serializer_ms'] / count,
+                    'avg_wall_ms': entry['wall_ms'] / count,
+                    'buckets': {
+                        str(bound): hits
+                        for bound, hits in zip(BUCKETS, entry['buckets'])
+                    },
+                }
+
+        return endpoints
+
+    def reset(self):
+        """Drop every recorded request"""
+        with self._lock:
+            self._endpoints = {}
+
+
+histogram = Histogram()
@@ -0,0 +1,41 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.dedupe import find_duplicates, merge_options
+from menu import search
+from menu.signals import menus_changed, touch_menus
+
+
+class Command(BaseCommand):
+    """Merge options sharing a normalized description"""
+    help = ('Merge duplicate options into the oldest one in short batches, '
+            'moving their menus, orders and order summaries')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500,
+                            help='Duplicate options merged per transaction')
+        parser.add_argument('--pause', type=float, default=0,
+                            help='Seconds to wait between batches')
+
+    def handle(self, *args, **options):
+        merged = batches = 0
+        while True:
+            replacements = find_duplicates(options['chunk_size'])
+            if not replacements:
+                break
+
+            with transaction.atomic():
+                menu_ids = merge_options(replacements)
+                search.remove_options(replacements)
+                touch_menus(menu_ids)
+            menus_changed(menu_ids)
+
+            merged += len(replacements)
+            batches += 1
+            time.sleep(options['pause'])
+
+        self.stdout.write(
+            f'Merged {merged} duplicate options in {batches} batches'
+        )
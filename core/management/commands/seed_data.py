@@ -0,0 +1,204 @@
+import datetime
+import itertools
+import random
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.core.management.color import no_style
+from django.db import connection
+from django.db.models import Max
+
+from core.cutoff import local_today
+from core.descriptions import description_hash
+from core.models import Menu, Option, Order
+from menu import search
+from order.summary import rebuild_summary
+
+MAINS = (
+    'Corn pie', 'Chicken Nugget Rice', 'Rice with hamburger',
+    'Premium chicken', 'Beef stew', 'Vegetable lasagna', 'Salmon',
+    'Chickpea curry', 'Pork loin', 'Mushroom risotto', 'Fish and chips',
+    'Lentil stew', 'Beef empanadas', 'Tofu stir fry', 'Chicken casserole',
+)
+SIDES = ('Salad', 'Mashed potatoes', 'Rice', 'Roasted vegetables')
+DESSERTS = ('Dessert', 'Fruit', 'Flan')
+OBSERVATIONS = (
+    'No tomatoes in the salad', 'Extra rice', 'No onion', 'Gluten free',
+    'Sauce on the side', 'Vegan dessert',
+)
+# Menu UUIDs are derived from the seed and the menu id, so they are
+# reproducible and do not collide with the menus of previous runs.
+MENU_NAMESPACE = uuid.UUID('6f1c2b8e-2d1a-4c57-9a3e-5b0d7c4e8a91')
+
+
+def chunked(iterable, size):
+    """Yield lists of up to size items from an iterable"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def next_id(model):
+    """Return the first free primary key of a model"""
+    return (model.objects.aggregate(last=Max('id'))['last'] or 0) + 1
+
+
+class Command(BaseCommand):
+    """Bulk load users, menus, options and orders for scale testing"""
+    help = 'Generate a deterministic synthetic dataset in chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=50000)
+        parser.add_argument('--days', type=int, default=730,
+                            help='Days of menus ending today')
+        parser.add_argument('--min-options', type=int, default=4)
+        parser.add_argument('--max-options', type=int, default=8)
+        parser.add_argument('--participation', type=float, default=0.1,
+                            help='Share of the users ordering each menu')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument('--password', default='password123',
+                            help='Password shared by every generated user')
+
+    def handle(self, *args, **options):
+        self.seed = options['seed']
+        self.rng = random.Random(self.seed)
+        self.chunk_size = options['chunk_size']
+
+        user_ids = self.seed_users(options['users'], options['password'])
+        option_ids = self.seed_options()
+        menus, orders = self.seed_menus(
+            options['days'],
+            user_ids,
+            option_ids,
+            options['min_options'],
+            options['max_options'],
+            options['participation'],
+        )
+
+        self.reset_sequences()
+        if settings.ORDER_SUMMARY_ENABLED:
+            rebuild_summary()
+        self.stdout.write(
+            f'Created {len(user_ids)} users, {len(option_ids)} options, '
+            f'{menus} menus and {orders} orders'
+        )
+
+    def insert(self, model, objects):
+        """Insert a stream of objects in chunks and return their count"""
+        count = 0
+        for chunk in chunked(objects, self.chunk_size):
+            model.objects.bulk_create(chunk)
+            count += len(chunk)
+
+        return count
+
+    def seed_users(self, count, password):
+        """Create the users sharing a single precomputed password hash"""
+        user_model = get_user_model()
+        first = next_id(user_model)
+        encoded = make_password(password)
+        self.insert(user_model, (
+            user_model(
+                id=first + i,
+                email=f'employee{first + i}@seed.cornershop.cl',
+                name=f'Employee {first + i}',
+                password=encoded,
+            )
+            for i in range(count)
+        ))
+        return range(first, first + count)
+
+    def seed_options(self):
+        """Create the catalog of dishes missing from previous runs"""
+        first = next_id(Option)
+        dishes = {
+            description_hash(description): description
+            for description in (
+                f'{main}, {side} and {dessert}'
+                for main in MAINS for side in SIDES for dessert in DESSERTS
+            )
+        }
+        existing = dict(Option.objects.filter(
+            description_hash__in=dishes
+        ).values_list('description_hash', 'id'))
+        missing = [digest for digest in dishes if digest not in existing]
+        self.insert(Option, (
+            Option(id=first + i, description=dishes[digest],
+                   description_hash=digest)
+            for i, digest in enumerate(missing)
+        ))
+        created = range(first, first + len(missing))
+        search.index_options(created)
+        return [*existing.values(), *created]
+
+    def seed_menus(self, days, user_ids, option_ids, min_options,
+                   max_options, participation):
+        """Create a menu per day with its options and orders"""
+        first_menu = next_id(Menu)
+        first_day = local_today() - datetime.timedelta(days=days - 1)
+        per_menu = round(len(user_ids) * participation)
+        menus = orders = 0
+
+        plan = (
+            (first_menu + day, first_day + datetime.timedelta(days=day))
+            for day in range(days)
+        )
+        for chunk in chunked(plan, max(1, self.chunk_size // 100)):
+            menu_options = {
+                menu_id: self.rng.sample(
+                    option_ids, self.rng.randint(min_options, max_options)
+                )
+                for menu_id, _ in chunk
+            }
+            menus += self.insert(Menu, (
+                self.new_menu(menu_id, date) for menu_id, date in chunk
+            ))
+            self.insert(Menu.options.through, (
+                Menu.options.through(menu_id=menu_id, option_id=option_id)
+                for menu_id, choices in menu_options.items()
+                for option_id in choices
+            ))
+            orders += self.insert(Order, (
+                Order(
+                    user_id=user_id,
+                    menu_id=menu_id,
+                    option_id=self.rng.choice(choices),
+                    observation=self.observation(),
+                )
+                for menu_id, choices in menu_options.items()
+                for user_id in self.rng.sample(user_ids, per_menu)
+            ))
+
+        return menus, orders
+
+    def new_menu(self, menu_id, date):
+        """Return an unsaved menu with its cutoff computed"""
+        menu = Menu(
+            id=menu_id,
+            date=date,
+            uuid=uuid.uuid5(MENU_NAMESPACE, f'{self.seed}-{menu_id}'),
+        )
+        menu.set_cutoff_at()
+        return menu
+
+    def observation(self):
+        """Return a random customization, most orders having none"""
+        if self.rng.random() < 0.7:
+            return ''
+        return self.rng.choice(OBSERVATIONS)
+
+    def reset_sequences(self):
+        """Move the id sequences past the explicitly assigned ids"""
+        statements = connection.ops.sequence_reset_sql(
+            no_style(), [get_user_model(), Menu, Option]
+        )
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
@@ -0,0 +1,47 @@
+from contextlib import ExitStack
+from time import perf_counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .instrumentation import RequestStats, current_stats, histogram
+
+
+class InstrumentationMiddleware:
+    """Record queries and timings of every request"""
+
+    def __init__(self, get_response):
+        # Django drops the middleware from the chain at startup
+        if not settings.INSTRUMENTATION_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = RequestStats()
+        token = current_stats.set(stats)
+        start = perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(stats))
+                response = self.get_response(request)
+        finally:
+            current_stats.reset(token)
+
+        stats.wall_time = perf_counter() - start
+        if stats.endpoint is not None:
+            histogram.record(stats)
+        response['Server-Timing'] = stats.server_timing()
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Name the endpoint after the view and its action"""
+        stats = current_stats.get()
+        method = request.method.lower()
+        view_class = getattr(view_func, 'cls', None)
+        actions = getattr(view_func, 'actions', None) or {}
+
+        name = view_class.__name__ if view_class else view_func.__name__
+        stats.endpoint = f'{name}.{actions.get(method, method)}'
@@ -0,0 +1,21 @@
+# Generated by Django 3.1.14 on 2026-10-18 09:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='menu',
+            index=models.Index(fields=['date', 'id'], name='core_menu_date_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='option',
+            index=models.Index(fields=['created_at', 'id'], name='core_option_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.1.14 on 2026-10-18 09:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='option',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='core.option'),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='observation',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 3.1.14 on 2026-10-18 09:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def gen_uuid(apps, schema_editor):
+    Menu = apps.get_model('core', 'Menu')
+    for menu in Menu.objects.only('id').iterator():
+        menu.uuid = uuid.uuid4()
+        menu.save(update_fields=['uuid'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_order_option'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='menu',
+            name='uuid',
+            field=models.UUIDField(editable=False, null=True),
+        ),
+        migrations.RunPython(gen_uuid, reverse_code=migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='menu',
+            name='uuid',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+        ),
+        migrations.CreateModel(
+            name='MenuSnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uuid', models.UUIDField(unique=True)),
+                ('body', models.TextField()),
+                ('etag', models.CharField(max_length=64)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('menu', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='snapshot', to='core.menu')),
+            ],
+        ),
+    ]
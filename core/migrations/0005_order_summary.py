@@ -0,0 +1,28 @@
+# Generated by Django 3.1.14 on 2026-10-18 09:54
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_menu_uuid_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderSummary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('observation', models.CharField(blank=True, max_length=255)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('menu', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.menu')),
+                ('option', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.option')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='ordersummary',
+            constraint=models.UniqueConstraint(fields=('menu', 'option', 'observation'), name='core_ordersummary_unique_key'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 3.1.14 on 2026-10-18 10:01
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max
+import django.db.models.deletion
+
+
+def remove_duplicate_orders(apps, schema_editor):
+    """Keep only the latest order of every user for a menu"""
+    Order = apps.get_model('core', 'Order')
+    OrderSummary = apps.get_model('core', 'OrderSummary')
+    duplicates = (
+        Order.objects.values('user_id', 'menu_id')
+        .annotate(total=Count('id'), latest=Max('id'))
+        .filter(total__gt=1)
+    )
+    removed = 0
+    for row in duplicates.iterator():
+        removed += Order.objects.filter(
+            user_id=row['user_id'], menu_id=row['menu_id'],
+            id__lt=row['latest']
+        ).delete()[0]
+    if not removed:
+        return
+    OrderSummary.objects.all().delete()
+    rows = (
+        Order.objects.filter(option__isnull=False)
+        .values('menu_id', 'option_id', 'observation')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    OrderSummary.objects.bulk_create(
+        OrderSummary(**row) for row in rows.iterator()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_order_summary'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_orders, migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['menu', 'user'], name='core_order_menu_user_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='order',
+            constraint=models.UniqueConstraint(fields=('user', 'menu'), name='core_order_unique_user_menu'),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='menu',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='core.menu'),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX core_menu_options_option_menu_idx '
+            'ON core_menu_options (option_id, menu_id)',
+            'DROP INDEX core_menu_options_option_menu_idx',
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 3.1.14 on 2026-10-18 10:40
+
+import core.cutoff
+from django.db import migrations, models
+
+
+def compute_cutoffs(apps, schema_editor):
+    """Precompute the cutoff instant of the existing menus"""
+    Menu = apps.get_model('core', 'Menu')
+    menus = list(Menu.objects.only('id', 'date', 'cutoff_time'))
+    for menu in menus:
+        menu.cutoff_at = core.cutoff.cutoff_at(menu.date, menu.cutoff_time)
+    Menu.objects.bulk_update(menus, ['cutoff_at'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='menu',
+            name='cutoff_time',
+            field=models.TimeField(default=core.cutoff.default_cutoff_time),
+        ),
+        migrations.AddField(
+            model_name='menu',
+            name='cutoff_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunPython(compute_cutoffs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='menu',
+            name='cutoff_at',
+            field=models.DateTimeField(editable=False),
+        ),
+    ]
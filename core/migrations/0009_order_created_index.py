@@ -0,0 +1,17 @@
+# Generated by Django 3.1.14 on 2026-10-18 10:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_menu_cutoff'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['created_at', 'id'], name='core_order_created_id_idx'),
+        ),
+    ]
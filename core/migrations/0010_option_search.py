@@ -0,0 +1,52 @@
+# Generated by Django 3.1.14 on 2026-10-18 10:22
+
+from django.db import migrations, transaction
+from django.db.utils import OperationalError
+
+
+def create_search_index(apps, schema_editor):
+    """Create the option search index supported by the database"""
+    connection = schema_editor.connection
+    if connection.vendor == 'sqlite':
+        try:
+            with transaction.atomic(using=connection.alias):
+                schema_editor.execute(
+                    'CREATE VIRTUAL TABLE core_option_fts USING fts5('
+                    "description, tokenize='unicode61 remove_diacritics 2', "
+                    "prefix='2 3')"
+                )
+        except OperationalError:
+            # SQLite built without FTS5, searches scan the options
+            return
+        schema_editor.execute(
+            'INSERT INTO core_option_fts (rowid, description) '
+            'SELECT id, description FROM core_option'
+        )
+    elif connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        schema_editor.execute(
+            'CREATE INDEX core_option_description_trgm_idx '
+            'ON core_option USING gin (description gin_trgm_ops)'
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    """Drop the option search index"""
+    connection = schema_editor.connection
+    if connection.vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE IF EXISTS core_option_fts')
+    elif connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'DROP INDEX IF EXISTS core_option_description_trgm_idx'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_order_created_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 3.1.14 on 2026-10-18 10:23
+
+import core.descriptions
+from django.db import migrations, models
+
+
+def hash_descriptions(apps, schema_editor):
+    """Compute the description hash of the existing options"""
+    Option = apps.get_model('core', 'Option')
+    last_id = 0
+    while True:
+        options = list(Option.objects.filter(id__gt=last_id).order_by(
+            'id'
+        ).only('id', 'description')[:1000])
+        if not options:
+            return
+        for option in options:
+            option.description_hash = core.descriptions.description_hash(
+                option.description
+            )
+        Option.objects.bulk_update(
+            options, ['description_hash'], batch_size=500
+        )
+        last_id = options[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_option_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='option',
+            name='description_hash',
+            field=models.CharField(db_index=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.RunPython(hash_descriptions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 3.1.14 on 2026-10-18 10:24
+
+import core.dedupe
+from django.db import migrations, models
+
+
+def merge_duplicates(apps, schema_editor):
+    """Merge the duplicates left by merge_duplicate_options"""
+    merged = []
+    while True:
+        replacements = core.dedupe.find_duplicates(500, apps)
+        if not replacements:
+            break
+        core.dedupe.merge_options(replacements, apps)
+        merged.extend(replacements)
+
+    connection = schema_editor.connection
+    if merged and connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            tables = connection.introspection.table_names(cursor)
+            if 'core_option_fts' not in tables:
+                return
+            for start in range(0, len(merged), 500):
+                chunk = merged[start:start + 500]
+                cursor.execute(
+                    'DELETE FROM core_option_fts WHERE rowid IN (%s)'
+                    % ', '.join(['%s'] * len(chunk)),
+                    chunk
+                )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_option_description_hash'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='option',
+            name='description_hash',
+            field=models.CharField(editable=False, max_length=64, unique=True),
+        ),
+    ]
@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 
 from django.contrib.auth.models import (AbstractBaseUser, BaseUserManager,
@@ -5,6 +7,9 @@ from django.contrib.auth.models import (AbstractBaseUser, BaseUserManager,
 
 from django.conf import settings
 
+from .cutoff import cutoff_at, default_cutoff_time, local_today
+from .descriptions import description_hash
+
 
 class UserManager(BaseUserManager):
     """User Manager"""
@@ -33,35 +38,167 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
 
 
+class OptionQuerySet(models.QuerySet):
+    """Option lookups by normalized description"""
+
+    def intern(self, description):
+        """Return the option of a description, creating it if missing"""
+        option, created = self.get_or_create(
+            description_hash=description_hash(description),
+            defaults={'description': description},
+        )
+        return option
+
+
 class Option(models.Model):
     """Option to be used for a menu"""
     description = models.TextField()
+    description_hash = models.CharField(
+        max_length=64,
+        unique=True,
+        editable=False
+    )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = OptionQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id'],
+                         name='core_option_created_id_idx'),
+        ]
 
     def __str__(self):
         return self.description
 
+    def set_description_hash(self):
+        """Identify the option by its normalized description"""
+        self.description_hash = description_hash(self.description)
+
+    def save(self, *args, **kwargs):
+        self.set_description_hash()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'description' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'description_hash'}
+        super().save(*args, **kwargs)
+
+
+class MenuQuerySet(models.QuerySet):
+    """Menu lookups by local date"""
+
+    def for_local_date(self, date):
+        """Return the latest menu planned for a date, if any"""
+        return self.filter(date=date).order_by('-id').first()
+
+    def for_today(self, now=None):
+        """Return the menu of the current date in the order time zone"""
+        return self.for_local_date(local_today(now))
+
 
 class Menu(models.Model):
     """Menu object"""
+    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     name = models.CharField(default="Today's menu", max_length=255)
     date = models.DateField()
+    cutoff_time = models.TimeField(default=default_cutoff_time)
+    cutoff_at = models.DateTimeField(editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     options = models.ManyToManyField('Option')
 
+    objects = MenuQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['date', 'id'], name='core_menu_date_id_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
+    def set_cutoff_at(self):
+        """Compute the instant when ordering from this menu closes"""
+        date = self._meta.get_field('date').to_python(self.date)
+        cutoff_time = self._meta.get_field('cutoff_time').to_python(
+            self.cutoff_time
+        )
+        self.cutoff_at = cutoff_at(date, cutoff_time)
+
+    def save(self, *args, **kwargs):
+        self.set_cutoff_at()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'date', 'cutoff_time'} & set(
+                update_fields):
+            kwargs['update_fields'] = {*update_fields, 'cutoff_at'}
+        super().save(*args, **kwargs)
+
+
+class MenuSnapshot(models.Model):
+    """Precomputed public representation of a menu"""
+    menu = models.OneToOneField(
+        Menu,
+        on_delete=models.CASCADE,
+        related_name='snapshot'
+    )
+    uuid = models.UUIDField(unique=True)
+    body = models.TextField()
+    etag = models.CharField(max_length=64)
+    updated_at = models.DateTimeField(auto_now=True)
+
 
 class Order(models.Model):
     """Order created by an user"""
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False
     )
     menu = models.ForeignKey(
         Menu,
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False
+    )
+    option = models.ForeignKey(
+        Option,
+        on_delete=models.CASCADE,
+        null=True
     )
-    observation = models.CharField(max_length=255)
+    observation = models.CharField(max_length=255, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'menu'],
+                name='core_order_unique_user_menu'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['menu', 'user'],
+                         name='core_order_menu_user_idx'),
+            models.Index(fields=['created_at', 'id'],
+                         name='core_order_created_id_idx'),
+        ]
+
+
+class OrderSummary(models.Model):
+    """Materialized count of the orders per menu, option and observation"""
+    menu = models.ForeignKey(
+        Menu,
+        on_delete=models.CASCADE
+    )
+    option = models.ForeignKey(
+        Option,
+        on_delete=models.CASCADE
+    )
+    observation = models.CharField(max_length=255, blank=True)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['menu', 'option', 'observation'],
+                name='core_ordersummary_unique_key'
+            ),
+        ]
@@ -0,0 +1,49 @@
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+
+# Set once the current request has written to the primary, so it reads its
+# own writes instead of possibly stale replicas.
+pinned_to_primary = ContextVar('pinned_to_primary', default=False)
+
+# Set by the views that tolerate replica lag. Anything else, background
+# threads included, reads from the primary.
+replica_reads = ContextVar('replica_reads', default=False)
+
+REPLICA_MODELS = {'core.menu', 'core.option', 'core.menu_options'}
+
+
+def read_from_replicas():
+    """Let the current request read menus and options from replicas"""
+    replica_reads.set(True)
+
+
+def release_primary():
+    """Send the reads of the next request to the primary again"""
+    pinned_to_primary.set(False)
+    replica_reads.set(False)
+
+
+class ReplicaRouter:
+    """Send menu and option reads of the views allowing it to replicas"""
+
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        if (replicas and replica_reads.get() and not pinned_to_primary.get()
+                and model._meta.label_lower in REPLICA_MODELS):
+            return random.choice(replicas)
+        return None
+
+    def db_for_write(self, model, **hints):
+        pinned_to_primary.set(True)
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {'default', *settings.DATABASE_REPLICAS}
+        if {obj1._state.db, obj2._state.db} <= databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):
+        return db not in settings.DATABASE_REPLICAS
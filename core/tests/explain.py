@@ -0,0 +1,39 @@
+from django.db import connection
+
+import re
+import unittest
+
+sqlite_only = unittest.skipUnless(
+    connection.vendor == 'sqlite', 'Query plans are checked on SQLite'
+)
+
+
+def query_plan(queryset):
+    """Return the lines of the SQLite query plan of a queryset"""
+    return [
+        re.sub(r'^(\d+ ){3}', '', line)
+        for line in queryset.explain().splitlines()
+    ]
+
+
+class QueryPlanMixin:
+    """Assertions on the indexes SQLite picks for a queryset"""
+
+    def assertUsesIndex(self, queryset, index=None, table=None):
+        """Assert a table is searched through an index, not scanned"""
+        table = table or queryset.model._meta.db_table
+        plan = query_plan(queryset)
+        searches = [
+            line for line in plan
+            if re.match(rf'SEARCH (TABLE )?{table}\b', line)
+        ]
+        self.assertFalse(
+            [line for line in plan
+             if re.match(rf'SCAN (TABLE )?{table}\b', line)],
+            f'{table} is fully scanned: {plan}'
+        )
+        pattern = rf'USING (COVERING )?INDEX {index or ""}'
+        self.assertTrue(
+            any(re.search(pattern, line) for line in searches),
+            f'{table} is not searched with index {index}: {plan}'
+        )
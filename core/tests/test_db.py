@@ -0,0 +1,153 @@
+from django.contrib.auth import get_user_model
+from django.core.signals import request_started
+from django.db import connection
+from django.test import (SimpleTestCase, TestCase, TransactionTestCase,
+                         override_settings)
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from core.db import configure_sqlite
+from core.models import Menu, Order
+from core.routers import (ReplicaRouter, read_from_replicas,
+                          release_primary)
+
+from unittest import mock
+import threading
+
+
+@override_settings(DATABASE_REPLICAS=['replica0'])
+class ReplicaRouterTests(SimpleTestCase):
+    """Test reads are routed to the replicas"""
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+        release_primary()
+        read_from_replicas()
+
+    def tearDown(self):
+        release_primary()
+
+    def test_menu_reads_go_to_replicas(self):
+        """Test menus, options and their links are read from replicas"""
+        self.assertEqual(self.router.db_for_read(Menu), 'replica0')
+        self.assertEqual(
+            self.router.db_for_read(Menu.options.through), 'replica0'
+        )
+        self.assertIsNone(self.router.db_for_read(Order))
+
+    def test_reads_pinned_after_write(self):
+        """Test a write pins the reads to primary for the request"""
+        self.assertEqual(self.router.db_for_write(Menu), 'default')
+        self.assertIsNone(self.router.db_for_read(Menu))
+
+    def test_replica_reads_scoped_to_request(self):
+        """Test the next request reads from primary unless it opts in"""
+        request_started.send(sender=self.__class__)
+        self.assertIsNone(self.router.db_for_read(Menu))
+
+        read_from_replicas()
+        self.assertEqual(self.router.db_for_read(Menu), 'replica0')
+
+    def test_background_threads_read_primary(self):
+        """Test threads started by a request read from primary"""
+        databases = []
+        thread = threading.Thread(
+            target=lambda: databases.append(self.router.db_for_read(Menu))
+        )
+        thread.start()
+        thread.join()
+
+        self.assertEqual(databases, [None])
+
+    def test_no_migrations_on_replicas(self):
+        """Test the schema is only migrated on the primary"""
+        self.assertTrue(self.router.allow_migrate('default', 'core'))
+        self.assertFalse(self.router.allow_migrate('replica0', 'core'))
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas(self):
+        """Test everything is read from primary without replicas"""
+        self.assertIsNone(self.router.db_for_read(Menu))
+
+
+class HealthCheckTests(TransactionTestCase):
+    """Test the persistent connections are checked by each request"""
+
+    def setUp(self):
+        connection.ensure_connection()
+
+    @override_settings(DB_HEALTH_CHECKS=True)
+    def test_dropped_connections_closed(self):
+        """Test a connection that stopped working is closed"""
+        with mock.patch.object(connection, 'is_usable',
+                               return_value=False), \
+                mock.patch.object(connection, 'close') as close:
+            request_started.send(sender=self.__class__)
+
+        close.assert_called_once_with()
+
+    @override_settings(DB_HEALTH_CHECKS=True)
+    def test_working_connections_kept(self):
+        """Test a working connection is reused"""
+        raw = connection.connection
+
+        request_started.send(sender=self.__class__)
+
+        self.assertIs(connection.connection, raw)
+
+    def test_disabled(self):
+        """Test connections are not pinged unless enabled"""
+        with mock.patch.object(connection, 'is_usable') as is_usable:
+            request_started.send(sender=self.__class__)
+
+        is_usable.assert_not_called()
+
+
+class ConnectionTests(TestCase):
+    """Test the SQLite tuning"""
+
+    @override_settings(SQLITE_WAL_ENABLED=True,
+                       SQLITE_PRAGMAS={'busy_timeout': 1234})
+    def test_sqlite_pragmas(self):
+        """Test the pragmas are applied to new SQLite connections"""
+        self.addCleanup(self.set_busy_timeout, self.busy_timeout())
+
+        configure_sqlite(sender=None, connection=connection)
+
+        self.assertEqual(self.busy_timeout(), 1234)
+
+    def busy_timeout(self):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA busy_timeout')
+            return cursor.fetchone()[0]
+
+    def set_busy_timeout(self, value):
+        with connection.cursor() as cursor:
+            cursor.execute(f'PRAGMA busy_timeout = {value}')
+
+
+class ReplicaViewTests(TestCase):
+    """Test which views read from the replicas"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(get_user_model().objects.create_user(
+            'nora@cornershop.cl', 'testpass', is_staff=True
+        ))
+
+    def test_menu_reads_use_replicas(self):
+        """Test the menu and option listings read from replicas"""
+        for url in (reverse('menu:menu-list'), reverse('menu:option-list')):
+            with mock.patch('menu.views.read_from_replicas') as read:
+                self.client.get(url)
+
+            read.assert_called_once_with()
+
+    def test_menu_writes_use_primary(self):
+        """Test creating options does not read from replicas"""
+        with mock.patch('menu.views.read_from_replicas') as read:
+            self.client.post(reverse('menu:option-list'),
+                             {'description': 'Corn pie'})
+
+        read.assert_not_called()
@@ -0,0 +1,80 @@
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+from core.models import Menu, Option, Order, OrderSummary
+from menu import search
+
+from io import StringIO
+import datetime
+
+BEFORE_UNIQUE = [('core', '0011_option_description_hash')]
+
+
+def migrate(targets=None):
+    """Migrate the test database to some migrations, or the latest"""
+    executor = MigrationExecutor(connection)
+    executor.migrate(targets or executor.loader.graph.leaf_nodes())
+
+
+class MergeDuplicateOptionsTests(TransactionTestCase):
+    """Test merging options that share a normalized description"""
+
+    def setUp(self):
+        migrate(BEFORE_UNIQUE)
+        self.user = get_user_model().objects.create_user(
+            'employee@cornershop.cl', 'testpass'
+        )
+        self.kept = Option.objects.create(description='Corn pie')
+        self.duplicate = Option.objects.create(description='corn  PIE')
+        self.other = Option.objects.create(description='CORN pie ')
+        self.menu = Menu.objects.create(date=datetime.date(2021, 1, 4))
+        self.menu.options.add(self.duplicate, self.kept)
+        self.later = Menu.objects.create(date=datetime.date(2021, 1, 5))
+        self.later.options.add(self.other)
+        Order.objects.create(
+            user=self.user, menu=self.menu, option=self.duplicate
+        )
+        OrderSummary.objects.create(
+            menu=self.menu, option=self.kept, count=2
+        )
+        OrderSummary.objects.create(
+            menu=self.menu, option=self.duplicate, count=1
+        )
+
+    def tearDown(self):
+        migrate()
+        search.rebuild_index()
+
+    def assertMerged(self):
+        """Assert the duplicates were merged into the oldest option"""
+        self.assertEqual(list(Option.objects.all()), [self.kept])
+        self.assertEqual(list(self.menu.options.all()), [self.kept])
+        self.assertEqual(list(self.later.options.all()), [self.kept])
+        self.assertEqual(Order.objects.get().option, self.kept)
+        summary = OrderSummary.objects.get()
+        self.assertEqual(
+            (summary.option, summary.count), (self.kept, 3)
+        )
+
+    def test_command(self):
+        """Test duplicates are merged in batches"""
+        out = StringIO()
+
+        call_command('merge_duplicate_options', chunk_size=1, stdout=out)
+
+        self.assertMerged()
+        self.assertIn('Merged 2 duplicate options in 2 batches',
+                      out.getvalue())
+        self.assertEqual(
+            search.ranked_ids(Option.objects.all(), ['corn'], 10),
+            [self.kept.id]
+        )
+
+    def test_migration_merges_leftovers(self):
+        """Test the unique index migration merges remaining duplicates"""
+        migrate()
+
+        self.assertMerged()
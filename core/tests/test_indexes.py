@@ -0,0 +1,57 @@
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError
+from django.test import TestCase
+
+from core.models import Menu, Option, Order
+from core.tests.explain import QueryPlanMixin, sqlite_only
+
+import datetime
+
+
+@sqlite_only
+class IndexUsageTests(QueryPlanMixin, TestCase):
+    """Test the hot lookups are served by an index"""
+
+    def test_menu_by_date(self):
+        """Test looking up the menu of a day uses the date index"""
+        queryset = Menu.objects.filter(date=datetime.date(2021, 1, 4))
+
+        self.assertUsesIndex(queryset, 'core_menu_date_id_idx')
+
+    def test_orders_by_menu(self):
+        """Test the orders of a menu are searched by menu and user"""
+        queryset = Order.objects.filter(menu_id=1)
+
+        self.assertUsesIndex(queryset, 'core_order_menu_user_idx')
+
+    def test_order_of_user_for_menu(self):
+        """Test the order of an user for a menu is an index lookup"""
+        queryset = Order.objects.filter(user_id=1, menu_id=1)
+
+        self.assertUsesIndex(queryset)
+
+    def test_menus_by_option(self):
+        """Test the menus of an option are found through the index"""
+        queryset = Menu.options.through.objects.filter(
+            option_id=1
+        ).values('menu_id')
+
+        self.assertUsesIndex(
+            queryset, 'core_menu_options_option_menu_idx'
+        )
+
+
+class OrderConstraintTests(TestCase):
+    """Test the constraints of the orders table"""
+
+    def test_one_order_per_user_and_menu(self):
+        """Test an user can not order twice for the same menu"""
+        user = get_user_model().objects.create_user(
+            'employee@cornershop.cl', 'testpass'
+        )
+        menu = Menu.objects.create(date=datetime.date(2021, 1, 4))
+        option = Option.objects.create(description='Corn pie')
+        Order.objects.create(user=user, menu=menu, option=option)
+
+        with self.assertRaises(IntegrityError):
+            Order.objects.create(user=user, menu=menu, option=option)
@@ -0,0 +1,79 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.instrumentation import histogram
+from core.models import Menu, Option
+
+import datetime
+
+MENUS_URL = reverse('menu:menu-list')
+STATS_URL = reverse('stats')
+
+
+@override_settings(INSTRUMENTATION_ENABLED=True)
+class InstrumentationTests(TestCase):
+    """Test the per request instrumentation middleware"""
+
+    def setUp(self):
+        histogram.reset()
+        self.client = APIClient()
+        menu = Menu.objects.create(date=datetime.date.today())
+        menu.options.add(Option.objects.create(description='Corn pie'))
+
+    def test_server_timing_header(self):
+        """Test responses report queries and timings"""
+        res = self.client.get(MENUS_URL)
+
+        timing = res['Server-Timing']
+        self.assertIn('db;dur=', timing)
+        self.assertIn('desc="3 queries"', timing)
+        self.assertIn('serializer;dur=', timing)
+        self.assertIn('total;dur=', timing)
+
+    def test_histogram_per_action(self):
+        """Test requests are aggregated per view and action"""
+        self.client.get(MENUS_URL)
+        self.client.get(MENUS_URL)
+
+        stats = histogram.snapshot()['MenuViewSet.list']
+        self.assertEqual(stats['count'], 2)
+        self.assertEqual(stats['avg_queries'], 3)
+        self.assertEqual(sum(stats['buckets'].values()), 2)
+
+    def test_stats_endpoint_limited_to_staff(self):
+        """Test only staff users can read the stats"""
+        user = get_user_model().objects.create_user(
+            'employee@cornershop.cl', 'testpass'
+        )
+        self.client.force_authenticate(user)
+
+        res = self.client.get(STATS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_stats_endpoint(self):
+        """Test the stats endpoint exposes the histogram"""
+        user = get_user_model().objects.create_user(
+            'nora@cornershop.cl', 'testpass', is_staff=True
+        )
+        self.client.get(MENUS_URL)
+        self.client.force_authenticate(user)
+
+        res = self.client.get(STATS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn('MenuViewSet.list', res.data)
+
+
+class InstrumentationDisabledTests(TestCase):
+    """Test the middleware stays out of the way when disabled"""
+
+    def test_no_server_timing(self):
+        """Test responses carry no Server-Timing header"""
+        res = APIClient().get(MENUS_URL)
+
+        self.assertNotIn('Server-Timing', res)
@@ -2,6 +2,7 @@ from django.test import TestCase
 from django.contrib.auth import get_user_model
 
 from core import models
+from core.descriptions import description_hash
 
 import datetime
 
@@ -39,6 +40,38 @@ class ModelTests(TestCase):
 
         self.assertEqual(str(option), option.description)
 
+    def test_option_description_hash(self):
+        """Test spellings of a description share the option hash"""
+        option = models.Option.objects.create(
+            description='Corn pie, Salad and Dessert'
+        )
+
+        self.assertEqual(
+            option.description_hash,
+            description_hash(' corn PIE,  salad and dessert')
+        )
+        self.assertNotEqual(
+            option.description_hash, description_hash('Corn pie')
+        )
+
+    def test_option_description_hash_follows_changes(self):
+        """Test changing the description changes the hash"""
+        option = models.Option.objects.create(description='Corn pie')
+        option.description = 'Beef stew'
+        option.save(update_fields=['description'])
+        option.refresh_from_db()
+
+        self.assertEqual(option.description_hash,
+                         description_hash('Beef stew'))
+
+    def test_option_intern(self):
+        """Test interning a description reuses its option"""
+        option = models.Option.objects.intern('Corn pie')
+
+        self.assertEqual(models.Option.objects.intern('CORN pie ').id,
+                         option.id)
+        self.assertEqual(models.Option.objects.count(), 1)
+
     def test_menu_str(self):
         """Test the ingrediente string representation"""
         menu = models.Menu.objects.create(
@@ -47,3 +80,27 @@ class ModelTests(TestCase):
         )
 
         self.assertEqual(str(menu), menu.name)
+
+    def test_menu_cutoff_at(self):
+        """Test the menu cutoff is stored as an instant in UTC"""
+        menu = models.Menu.objects.create(
+            date=datetime.date.fromisoformat("2021-01-04")
+        )
+        menu.refresh_from_db()
+
+        self.assertEqual(menu.cutoff_time, datetime.time(11, 0))
+        self.assertEqual(menu.cutoff_at.isoformat(),
+                         '2021-01-04T14:00:00+00:00')
+
+    def test_menu_cutoff_at_follows_changes(self):
+        """Test changing the date or cutoff time moves the cutoff"""
+        menu = models.Menu.objects.create(
+            date=datetime.date.fromisoformat("2021-01-04")
+        )
+        menu.date = datetime.date.fromisoformat("2021-07-05")
+        menu.cutoff_time = datetime.time(10, 30)
+        menu.save(update_fields=['date', 'cutoff_time'])
+        menu.refresh_from_db()
+
+        self.assertEqual(menu.cutoff_at.isoformat(),
+                         '2021-07-05T14:30:00+00:00')
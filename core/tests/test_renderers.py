@@ -0,0 +1,100 @@
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core import renderers
+from core.renderers import FastJSONParser, FastJSONRenderer
+
+from unittest import mock
+import datetime
+import decimal
+import io
+import uuid
+
+PAYLOAD = {
+    'date': datetime.date(2021, 1, 4),
+    'created_at': timezone.make_aware(
+        datetime.datetime(2021, 1, 4, 10, 30, 15, 123456),
+        timezone.utc
+    ),
+    'naive': datetime.datetime(2021, 1, 4, 10, 30),
+    'time': datetime.time(11, 0),
+    'message': _('Unable to authenticate with provided credentials'),
+    'price': decimal.Decimal('1500.50'),
+    'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'counts': {1: 'one', 2: 'two'},
+    'text': 'Menú del día\u2028Ensalada\u2029',
+    'options': [{'id': 1, 'description': 'Corn pie'}, None, True, 1.5],
+}
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    """Test the fast renderer renders the same bytes as DRF"""
+
+    def test_same_bytes_as_drf(self):
+        """Test dates, lazy strings and other types render identically"""
+        self.assertEqual(
+            FastJSONRenderer().render(PAYLOAD),
+            JSONRenderer().render(PAYLOAD)
+        )
+
+    def test_indent_falls_back(self):
+        """Test indented responses are rendered by DRF"""
+        media_type = 'application/json; indent=2'
+
+        self.assertEqual(
+            FastJSONRenderer().render(PAYLOAD, media_type),
+            JSONRenderer().render(PAYLOAD, media_type)
+        )
+
+    def test_without_orjson(self):
+        """Test the renderer and parser work without orjson"""
+        with mock.patch.object(renderers, 'orjson', None):
+            body = FastJSONRenderer().render(PAYLOAD)
+            data = FastJSONParser().parse(io.BytesIO(body))
+
+        self.assertEqual(body, JSONRenderer().render(PAYLOAD))
+        self.assertEqual(data, JSONParser().parse(io.BytesIO(body)))
+
+    def test_parse(self):
+        """Test the parser reads what DRF's parser reads"""
+        body = JSONRenderer().render(PAYLOAD)
+
+        self.assertEqual(
+            FastJSONParser().parse(io.BytesIO(body)),
+            JSONParser().parse(io.BytesIO(body))
+        )
+
+    def test_parse_error(self):
+        """Test invalid JSON raises a parse error"""
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"menu": NaN}'))
+
+
+class FastJSONApiTests(TestCase):
+    """Test the API renders and parses with the fast renderer"""
+
+    def test_token_error(self):
+        """Test the lazily translated login errors are rendered"""
+        get_user_model().objects.create_user(
+            'test@cornershop.cl', 'testpass'
+        )
+        client = APIClient()
+
+        res = client.post(
+            reverse('user:token'),
+            b'{"email": "test@cornershop.cl", "password": "wrong"}',
+            content_type='application/json'
+        )
+
+        self.assertEqual(res['Content-Type'], 'application/json')
+        self.assertEqual(
+            res.json()['non_field_errors'],
+            ['Unable to authenticate with provided credentials']
+        )
@@ -0,0 +1,110 @@
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models import Count
+from django.test import TestCase
+
+from core.models import Menu, Option, Order
+
+from io import StringIO
+
+
+def seed(**options):
+    """Run the seeding command quietly with small volumes"""
+    defaults = {
+        'users': 20,
+        'days': 6,
+        'participation': 0.5,
+        'seed': 7,
+        'chunk_size': 7,
+        'stdout': StringIO(),
+    }
+    defaults.update(options)
+    call_command('seed_data', **defaults)
+
+
+def snapshot():
+    """Return the generated data relative to the first ids"""
+    first_user = get_user_model().objects.order_by('id').first().id
+    first_option = Option.objects.order_by('id').first().id
+    return [
+        (user_id - first_user, option_id - first_option, observation)
+        for user_id, option_id, observation in Order.objects.order_by(
+            'menu__date', 'user_id'
+        ).values_list('user_id', 'option_id', 'observation')
+    ]
+
+
+class SeedDataTests(TestCase):
+    """Test the synthetic data generator"""
+
+    def test_seed_volumes(self):
+        """Test the requested volumes are generated"""
+        seed()
+
+        self.assertEqual(get_user_model().objects.count(), 20)
+        self.assertEqual(Menu.objects.count(), 6)
+        self.assertEqual(Order.objects.count(), 60)
+        option_counts = Menu.objects.annotate(
+            total=Count('options')
+        ).values_list('total', flat=True)
+        self.assertTrue(all(4 <= total <= 8 for total in option_counts))
+
+    def test_seed_reuses_options(self):
+        """Test seeding again reuses the dishes already created"""
+        seed()
+        options = Option.objects.count()
+
+        seed(days=2)
+
+        self.assertEqual(Option.objects.count(), options)
+        self.assertEqual(Menu.objects.count(), 8)
+
+    def test_seed_twice(self):
+        """Test seeding again with the same seed appends new data"""
+        seed()
+
+        seed()
+
+        self.assertEqual(get_user_model().objects.count(), 40)
+        self.assertEqual(Menu.objects.count(), 12)
+        self.assertEqual(
+            Menu.objects.values('uuid').distinct().count(), 12
+        )
+
+    def test_orders_use_menu_options(self):
+        """Test every order chooses one of its menu options"""
+        seed()
+
+        choices = set(Menu.options.through.objects.values_list(
+            'menu_id', 'option_id'
+        ))
+        orders = Order.objects.values_list('menu_id', 'option_id')
+        self.assertTrue(all(order in choices for order in orders))
+
+    def test_users_share_a_working_password(self):
+        """Test generated users can log in with the shared password"""
+        seed(password='secret123')
+
+        user = get_user_model().objects.first()
+        self.assertTrue(user.check_password('secret123'))
+
+    def test_seed_is_deterministic(self):
+        """Test the same seed generates the same data"""
+        seed()
+        first = snapshot()
+        Order.objects.all().delete()
+        Menu.objects.all().delete()
+        Option.objects.all().delete()
+        get_user_model().objects.all().delete()
+
+        seed()
+
+        self.assertEqual(snapshot(), first)
+
+    def test_ids_continue_after_seeding(self):
+        """Test rows created afterwards get fresh ids"""
+        seed()
+
+        option = Option.objects.create(description='Corn pie')
+
+        self.assertEqual(option.id, Option.objects.count())
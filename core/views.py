@@ -0,0 +1,15 @@
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from user.authentication import CachedTokenAuthentication
+from .instrumentation import histogram
+
+
+class StatsView(APIView):
+    """Show the per endpoint stats recorded by the instrumentation"""
+    authentication_classes = (CachedTokenAuthentication,)
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request):
+        return Response(histogram.snapshot())
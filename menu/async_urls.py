@@ -0,0 +1,11 @@
+from django.urls import path
+
+from . import async_views
+
+app_name = 'menu-async'
+
+urlpatterns = [
+    path('today/', async_views.today_menu, name='menu-today'),
+    path('options/', async_views.option_list, name='option-list'),
+    path('menus/<int:pk>/', async_views.menu_detail, name='menu-detail'),
+]
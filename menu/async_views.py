@@ -0,0 +1,140 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Prefetch
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+
+from core.models import Menu, Option
+from core.renderers import FastJSONRenderer
+from user.authentication import CachedTokenAuthentication
+from . import cache
+from .serializers import MenuDetailSerializer, OptionSerializer
+from .today import get_today_payload
+
+CHUNK_SIZE = 16 * 1024
+
+_executor = None
+
+
+def get_executor():
+    """Return the bounded pool running the blocking database work"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.ASYNC_DB_WORKERS,
+            thread_name_prefix='async-db'
+        )
+    return _executor
+
+
+async def run_blocking(func, *args):
+    """Run a blocking call in the database pool"""
+    def call():
+        close_old_connections()
+        try:
+            return func(*args)
+        finally:
+            close_old_connections()
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), call)
+
+
+def stream_json(body):
+    """Return a response streaming a rendered JSON body in chunks"""
+    chunks = (
+        body[start:start + CHUNK_SIZE]
+        for start in range(0, len(body), CHUNK_SIZE)
+    )
+    return StreamingHttpResponse(chunks, content_type='application/json')
+
+
+def render(payload):
+    return FastJSONRenderer().render(payload)
+
+
+def menu_detail_body(menu_id):
+    """Return the rendered detail of a menu"""
+    def build():
+        options = Option.objects.only('id', 'description').order_by('id')
+        menu = Menu.objects.prefetch_related(
+            Prefetch('options', queryset=options)
+        ).filter(pk=menu_id).first()
+        if menu is None:
+            raise Http404
+        return MenuDetailSerializer(menu).data
+
+    return render(cache.get_menu_payload(menu_id, build))
+
+
+def today_menu_body():
+    """Return the rendered detail of today's menu"""
+    payload = get_today_payload()
+    if payload is None:
+        raise Http404
+
+    return render(payload)
+
+
+def option_list_body(authorization):
+    """Authenticate a token and return the rendered list of options"""
+    # Parsed like TokenAuthentication, without building a DRF request
+    auth = authorization.split()
+    keyword = CachedTokenAuthentication.keyword
+    if not auth or auth[0].lower() != keyword.lower():
+        raise exceptions.NotAuthenticated()
+    if len(auth) != 2:
+        raise exceptions.AuthenticationFailed(
+            _('Invalid token header. No credentials provided.')
+            if len(auth) == 1 else
+            _('Invalid token header. Token string should not contain '
+              'spaces.')
+        )
+    CachedTokenAuthentication().authenticate_credentials(auth[1])
+
+    options = Option.objects.order_by('-description')
+    return render(OptionSerializer(options, many=True).data)
+
+
+def async_view(func):
+    """Turn API errors raised by the blocking work into JSON responses"""
+    @functools.wraps(func)
+    async def view(request, *args, **kwargs):
+        try:
+            return await func(request, *args, **kwargs)
+        except Http404:
+            return JsonResponse({'detail': 'Not found.'}, status=404)
+        except exceptions.APIException as exc:
+            response = JsonResponse({'detail': exc.detail},
+                                    status=exc.status_code)
+            if isinstance(exc, (exceptions.NotAuthenticated,
+                                exceptions.AuthenticationFailed)):
+                response['WWW-Authenticate'] = (
+                    CachedTokenAuthentication().authenticate_header(request)
+                )
+            return response
+    return view
+
+
+@async_view
+async def today_menu(request):
+    """Return today's menu in America/Santiago"""
+    return stream_json(await run_blocking(today_menu_body))
+
+
+@async_view
+async def menu_detail(request, pk):
+    """Return a menu with its options"""
+    return stream_json(await run_blocking(menu_detail_body, pk))
+
+
+@async_view
+async def option_list(request):
+    """Return every option to an authenticated user"""
+    authorization = request.headers.get('Authorization', '')
+    return stream_json(await run_blocking(option_list_body, authorization))
@@ -0,0 +1,64 @@
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+from core.cutoff import local_today
+
+LOCK_POLL_INTERVAL = 0.05
+
+
+def get_cache():
+    """Return the cache used for menu payloads"""
+    return caches[settings.MENU_CACHE_ALIAS]
+
+
+def menu_cache_key(menu_id, date=None):
+    """Return the cache key of a menu payload served on a given date"""
+    date = date or local_today()
+    return f'menu:detail:{menu_id}:{date.isoformat()}'
+
+
+def get_menu_payload(menu_id, build):
+    """Return the cached payload of a menu, building it on a miss"""
+    cache = get_cache()
+    key = menu_cache_key(menu_id)
+    payload = cache.get(key)
+    if payload is not None:
+        return payload
+
+    lock_key = f'{key}:lock'
+    token = uuid.uuid4().hex
+    if cache.add(lock_key, token, settings.MENU_CACHE_LOCK_TIMEOUT):
+        try:
+            payload = build()
+            # An invalidation drops the lock, the stale payload is not kept
+            if cache.get(lock_key) == token:
+                cache.set(key, payload, settings.MENU_CACHE_TIMEOUT)
+        finally:
+            cache.delete(lock_key)
+        return payload
+
+    # Another worker is rebuilding, wait for its payload
+    deadline = time.monotonic() + settings.MENU_CACHE_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        payload = cache.get(key)
+        if payload is not None:
+            return payload
+        if cache.get(lock_key) is None:
+            break
+
+    return build()
+
+
+def invalidate_menus(menu_ids):
+    """Drop the cached payloads and pending rebuilds of some menus"""
+    keys = []
+    for menu_id in menu_ids:
+        key = menu_cache_key(menu_id)
+        keys.extend((key, f'{key}:lock'))
+
+    if keys:
+        get_cache().delete_many(keys)
@@ -0,0 +1,92 @@
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import exceptions, status
+from rest_framework.response import Response
+
+
+class NotModified(exceptions.APIException):
+    status_code = status.HTTP_304_NOT_MODIFIED
+    default_detail = 'Not modified.'
+
+
+class PreconditionFailed(exceptions.APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = 'Precondition failed.'
+
+
+class ConditionalGetMixin:
+    """Answer GET requests with 304 when the client copy is still fresh"""
+    cache_policies = {}
+
+    def get_validators(self):
+        """Return the ETag and last modification time of the response"""
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == 'retrieve':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            try:
+                queryset = queryset.filter(
+                    **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+                )
+            except (TypeError, ValueError):
+                return None, None
+
+        # A single aggregate decides the response before serializing
+        state = queryset.prefetch_related(None).order_by().aggregate(
+            count=Count('id'), last=Max('updated_at')
+        )
+        if self.action == 'retrieve' and not state['count']:
+            return None, None
+
+        last = state['last']
+        version = int(last.timestamp() * 10 ** 6) if last else 0
+        etag = (f'"{self.request.accepted_renderer.format}-'
+                f'{state["count"]}-{version}"')
+        # Deleting an older object does not move the latest updated_at,
+        # so lists are only validated by the ETag, which has the count
+        if self.action != 'retrieve':
+            return etag, None
+        return etag, last
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.etag = self.last_modified = None
+        if (request.method not in ('GET', 'HEAD')
+                or self.action not in self.cache_policies):
+            return
+
+        self.etag, self.last_modified = self.get_validators()
+        if self.etag is None:
+            return
+
+        response = get_conditional_response(
+            request,
+            etag=self.etag,
+            last_modified=int(self.last_modified.timestamp())
+            if self.last_modified else None,
+        )
+        if response is None:
+            return
+        if response.status_code == status.HTTP_304_NOT_MODIFIED:
+            raise NotModified()
+        raise PreconditionFailed()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=exc.status_code)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(
+            request, response, *args, **kwargs
+        )
+        etag = getattr(self, 'etag', None)
+        if etag is not None and response.status_code in (
+                status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response['ETag'] = etag
+            if self.last_modified is not None:
+                response['Last-Modified'] = http_date(
+                    self.last_modified.timestamp()
+                )
+            response['Cache-Control'] = self.cache_policies[self.action]
+        return response
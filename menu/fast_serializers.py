@@ -0,0 +1,111 @@
+from collections import defaultdict
+
+from rest_framework import serializers as drf_serializers
+
+from core.instrumentation import TimedSerializerMixin
+from core.models import Menu
+from . import serializers
+
+
+class ValuesSerializer:
+    """Render values() rows like serializer_class, without instances"""
+    serializer_class = None
+    extra_values = ()
+
+    def __init__(self, instance, many=False):
+        self.instance = instance
+        self.many = many
+
+    @classmethod
+    def get_fields(cls):
+        """Return the columns to read and the formatters of each column"""
+        if '_columns' not in cls.__dict__:
+            fields = cls.serializer_class().fields
+            cls._columns = [
+                name for name, field in fields.items()
+                if not isinstance(field, (drf_serializers.ManyRelatedField,
+                                          drf_serializers.ListSerializer))
+            ]
+            # Strings and integers come out of the database as they are
+            cls._formatters = {
+                name: fields[name].to_representation
+                for name in cls._columns
+                if not isinstance(fields[name],
+                                  (drf_serializers.CharField,
+                                   drf_serializers.IntegerField))
+            }
+        return cls._columns, cls._formatters
+
+    @classmethod
+    def values(cls, queryset):
+        """Return the rows of a queryset this serializer reads"""
+        columns, _ = cls.get_fields()
+        return queryset.prefetch_related(None).values(
+            *columns, *cls.extra_values
+        )
+
+    def get_related(self, rows):
+        """Return the related data of the rows, keyed by column name"""
+        return {}
+
+    def to_representation(self, rows):
+        fields = self.serializer_class.Meta.fields
+        _, formatters = self.get_fields()
+        related = self.get_related(rows)
+        data = []
+        for row in rows:
+            item = {}
+            for name in fields:
+                if name in related:
+                    value = related[name].get(row['id'], [])
+                else:
+                    value = row[name]
+                    if value is not None and name in formatters:
+                        value = formatters[name](value)
+                item[name] = value
+            data.append(item)
+        return data
+
+    @property
+    def data(self):
+        if self.many:
+            return self.to_representation(list(self.instance))
+        return self.to_representation([self.instance])[0]
+
+
+class OptionValuesSerializer(TimedSerializerMixin, ValuesSerializer):
+    """Fast read-only version of OptionSerializer"""
+    serializer_class = serializers.OptionSerializer
+    extra_values = ('created_at',)
+
+
+class MenuValuesSerializer(TimedSerializerMixin, ValuesSerializer):
+    """Fast read-only version of MenuSerializer"""
+    serializer_class = serializers.MenuSerializer
+
+    def get_related(self, rows):
+        options = defaultdict(list)
+        links = Menu.options.through.objects.filter(
+            menu_id__in=[row['id'] for row in rows]
+        ).order_by('option_id').values_list('menu_id', 'option_id')
+        for menu_id, option_id in links:
+            options[menu_id].append(option_id)
+        return {'options': options}
+
+
+class MenuDetailValuesSerializer(TimedSerializerMixin, ValuesSerializer):
+    """Fast read-only version of MenuDetailSerializer"""
+    serializer_class = serializers.MenuDetailSerializer
+
+    def get_related(self, rows):
+        options = defaultdict(list)
+        links = Menu.options.through.objects.filter(
+            menu_id__in=[row['id'] for row in rows]
+        ).order_by('option_id').values_list(
+            'menu_id', 'option_id', 'option__description'
+        )
+        for menu_id, option_id, description in links:
+            options[menu_id].append(
+                {'id': option_id, 'description': description}
+            )
+        return {'options': options}
@@ -0,0 +1,114 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Paginate newest first over an (ordering field, id) keyset"""
+    ordering_field = None
+    always_paginate = False
+    page_size = 50
+    max_page_size = 500
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        # Unless always_paginate, lists are paged only when asked to
+        if (not self.always_paginate and
+                self.cursor_query_param not in params and
+                self.page_size_query_param not in params):
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        field = self.ordering_field
+
+        queryset = queryset.order_by(f'-{field}', '-id')
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            value, pk = position
+            queryset = queryset.filter(**{f'{field}__lte': value}).exclude(
+                **{field: value, 'id__gte': pk}
+            )
+
+        results = list(queryset[:self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        """Return the page size requested, bounded by max_page_size"""
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        return max(1, min(size, self.max_page_size))
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+    def get_next_link(self):
+        """Return the URL of the next page, if any"""
+        if not self.has_next:
+            return None
+
+        last = self.page[-1]
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(
+            url, self.page_size_query_param, self.page_size
+        )
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(last)
+        )
+
+    def encode_cursor(self, obj):
+        """Encode the keyset position of an object or values() row"""
+        if isinstance(obj, dict):
+            value, pk = obj[self.ordering_field], obj['id']
+        else:
+            value, pk = getattr(obj, self.ordering_field), obj.id
+        position = json.dumps([value.isoformat(), pk])
+        return base64.urlsafe_b64encode(position.encode()).decode()
+
+    def decode_cursor(self, request, model):
+        """Decode the keyset position sent by the client"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(encoded))
+            field = model._meta.get_field(self.ordering_field)
+            return field.to_python(value), int(pk)
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class MenuPagination(KeysetPagination):
+    """Paginate menus by (date, id)"""
+    ordering_field = 'date'
+
+
+class OptionPagination(KeysetPagination):
+    """Paginate options by (created_at, id)"""
+    ordering_field = 'created_at'
@@ -0,0 +1,169 @@
+import re
+from functools import reduce
+from operator import and_
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Case, IntegerField, Q, When
+from django.db.models.expressions import RawSQL
+
+from core.models import Option
+
+FTS_TABLE = 'core_option_fts'
+CHUNK_SIZE = 500
+
+# Search backend of each database alias, found on first use.
+_backends = {}
+
+
+def backend(using='default'):
+    """Return the search backend of a database: fts5, trigram or None"""
+    # None falls back to substring scans
+    if using not in _backends:
+        connection = connections[using]
+        kind = None
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                tables = connection.introspection.table_names(cursor)
+            kind = 'fts5' if FTS_TABLE in tables else None
+        elif connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"
+                )
+                kind = 'trigram' if cursor.fetchone() else None
+        _backends[using] = kind
+
+    return _backends[using]
+
+
+def chunks(ids):
+    """Yield lists of ids small enough for a single statement"""
+    ids = list(ids)
+    for start in range(0, len(ids), CHUNK_SIZE):
+        yield ids[start:start + CHUNK_SIZE]
+
+
+def search_terms(query):
+    """Return the words of a search query"""
+    return re.findall(r'\w+', query)
+
+
+def match_expression(terms):
+    """Return an FTS5 query matching every term, the last as a prefix"""
+    return ' '.join(f'"{term}"' for term in terms) + '*'
+
+
+def ranked_ids(queryset, terms, limit):
+    """Return the ids of the best matches of a queryset, best first"""
+    kind = backend(queryset.db)
+    if kind == 'fts5':
+        where, params = f'{FTS_TABLE} MATCH %s', [match_expression(terms)]
+        if queryset.query.where:
+            query = queryset.order_by().values('id').query
+            sql, extra = query.sql_with_params()
+            where += f' AND rowid IN ({sql})'
+            params.extend(extra)
+        # Only the latest candidates are ranked, scoring every match of a
+        # common word costs more than scanning the options
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM {FTS_TABLE} WHERE {where} '
+                f'AND rowid >= (SELECT MIN(rowid) FROM ('
+                f'SELECT rowid FROM {FTS_TABLE} WHERE {where} '
+                f'ORDER BY rowid DESC LIMIT %s)) '
+                f'ORDER BY bm25({FTS_TABLE}) LIMIT %s',
+                (*params, *params, settings.MENU_SEARCH_CANDIDATES, limit)
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    if kind == 'trigram':
+        text = ' '.join(terms)
+        table = Option._meta.db_table
+        queryset = queryset.filter(id__in=RawSQL(
+            f'SELECT id FROM {table} WHERE %s <%% description', (text,)
+        )).annotate(search_rank=RawSQL(
+            f'word_similarity(%s, {table}.description)', (text,)
+        )).order_by('-search_rank', '-id')
+    else:
+        queryset = queryset.filter(reduce(and_, (
+            Q(description__icontains=term) for term in terms
+        ))).order_by('-id')
+
+    return list(queryset.values_list('id', flat=True)[:limit])
+
+
+def search(queryset, query, limit):
+    """Return the options of a queryset matching a query, best first"""
+    terms = search_terms(query)
+    if not terms:
+        return queryset.none()
+
+    ids = ranked_ids(queryset, terms, limit)
+    if not ids:
+        return queryset.none()
+
+    return queryset.filter(id__in=ids).order_by(Case(
+        *[When(id=pk, then=position) for position, pk in enumerate(ids)],
+        output_field=IntegerField(),
+    ))
+
+
+def index_option(option, using='default'):
+    """Add or replace an option in the search index"""
+    if backend(using) != 'fts5':
+        return
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f'INSERT OR REPLACE INTO {FTS_TABLE} (rowid, description) '
+            f'VALUES (%s, %s)',
+            (option.pk, option.description)
+        )
+
+
+def index_options(option_ids, using='default'):
+    """Add or replace some options in the search index"""
+    if backend(using) != 'fts5':
+        return
+
+    table = Option._meta.db_table
+    with connections[using].cursor() as cursor:
+        for chunk in chunks(option_ids):
+            placeholders = ', '.join(['%s'] * len(chunk))
+            cursor.execute(
+                f'INSERT OR REPLACE INTO {FTS_TABLE} (rowid, description) '
+                f'SELECT id, description FROM {table} '
+                f'WHERE id IN ({placeholders})',
+                chunk
+            )
+
+
+def remove_options(option_ids, using='default'):
+    """Drop some options from the search index"""
+    if backend(using) != 'fts5':
+        return
+
+    with connections[using].cursor() as cursor:
+        for chunk in chunks(option_ids):
+            placeholders = ', '.join(['%s'] * len(chunk))
+            cursor.execute(
+                f'DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})',
+                chunk
+            )
+
+
+def rebuild_index(using='default'):
+    """Index every option again from scratch"""
+    if backend(using) != 'fts5':
+        return
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE}')
+        cursor.execute(
+            f'INSERT INTO {FTS_TABLE} (rowid, description) '
+            f'SELECT id, description FROM {Option._meta.db_table}'
+        )
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')"
+        )
@@ -1,8 +1,18 @@
+import uuid
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.translation import ugettext_lazy as _
 from rest_framework import serializers
+from core.cutoff import default_cutoff_time
+from core.descriptions import description_hash
+from core.instrumentation import TimedSerializerMixin
 from core.models import Option, Menu
+from . import search
 
 
-class OptionSerializer(serializers.ModelSerializer):
+class OptionSerializer(TimedSerializerMixin,
+                       serializers.ModelSerializer):
     """Serializer for option objects"""
 
     class Meta:
@@ -10,8 +20,13 @@ class OptionSerializer(serializers.ModelSerializer):
         fields = ('id', 'description')
         read_only_fields = ('id',)
 
+    def create(self, validated_data):
+        """Return the option of the description, creating it if missing"""
+        return Option.objects.intern(validated_data['description'])
+
 
-class MenuSerializer(serializers.ModelSerializer):
+class MenuSerializer(TimedSerializerMixin,
+                     serializers.ModelSerializer):
     """Serialize a menu"""
     options = serializers.PrimaryKeyRelatedField(
         many=True,
@@ -21,10 +36,114 @@ class MenuSerializer(serializers.ModelSerializer):
     class Meta:
         model = Menu
         fields = (
-            'id', 'name', 'date', 'options', 'created_at',
+            'id', 'name', 'date', 'cutoff_time', 'cutoff_at', 'options',
+            'created_at',
         )
-        read_only_fields = ('id',)
+        read_only_fields = ('id', 'cutoff_at')
 
 
 class MenuDetailSerializer(MenuSerializer):
     options = OptionSerializer(many=True, read_only=True)
+
+
+class PublicMenuSerializer(TimedSerializerMixin,
+                           serializers.ModelSerializer):
+    """Serialize the public page of a menu"""
+    options = OptionSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Menu
+        fields = ('uuid', 'name', 'date', 'options')
+        read_only_fields = fields
+
+
+class MenuBulkItemSerializer(serializers.Serializer):
+    """Serializer for one of the menus planned in bulk"""
+    name = serializers.CharField(max_length=255, default="Today's menu")
+    date = serializers.DateField()
+    cutoff_time = serializers.TimeField(default=default_cutoff_time)
+    options = serializers.ListField(
+        child=serializers.CharField(),
+        default=list
+    )
+
+
+class MenuBulkSerializer(serializers.Serializer):
+    """Serializer for planning many menus with their options at once"""
+    menus = MenuBulkItemSerializer(many=True, allow_empty=False)
+
+    def validate_menus(self, menus):
+        """Limit the number of menus planned in a request"""
+        max_size = settings.MENU_BULK_MAX_SIZE
+        if len(menus) > max_size:
+            msg = _('Ensure this list has no more than {max_size} menus')
+            raise serializers.ValidationError(
+                msg.format(max_size=max_size), code='max_length'
+            )
+
+        return menus
+
+    def upsert_options(self, descriptions):
+        """Return the option ids of some descriptions, creating missing ones"""
+        hashes = {
+            description: description_hash(description)
+            for description in descriptions
+        }
+        option_ids = dict(Option.objects.filter(
+            description_hash__in=hashes.values()
+        ).values_list('description_hash', 'id'))
+
+        missing = {}
+        for description, digest in hashes.items():
+            if digest not in option_ids:
+                missing.setdefault(digest, description)
+        Option.objects.bulk_create((
+            Option(description=description, description_hash=digest)
+            for digest, description in missing.items()
+        ), ignore_conflicts=True)
+        created = dict(Option.objects.filter(
+            description_hash__in=missing
+        ).values_list('description_hash', 'id'))
+        search.index_options(created.values())
+        option_ids.update(created)
+
+        return {
+            description: option_ids[digest]
+            for description, digest in hashes.items()
+        }
+
+    def create(self, validated_data):
+        """Insert the menus, options and links in a single transaction"""
+        planned = validated_data['menus']
+        descriptions = list(dict.fromkeys(
+            description
+            for menu in planned for description in menu['options']
+        ))
+        menus = [
+            Menu(uuid=uuid.uuid4(), name=menu['name'], date=menu['date'],
+                 cutoff_time=menu['cutoff_time'])
+            for menu in planned
+        ]
+        for menu in menus:
+            menu.set_cutoff_at()
+
+        with transaction.atomic():
+            option_ids = self.upsert_options(descriptions)
+            Menu.objects.bulk_create(menus)
+            # Only some backends return the primary keys of bulk inserts
+            menu_ids = dict(Menu.objects.filter(
+                uuid__in=[menu.uuid for menu in menus]
+            ).values_list('uuid', 'id'))
+            for menu in menus:
+                menu.pk = menu_ids[menu.uuid]
+
+            Menu.options.through.objects.bulk_create(
+                Menu.options.through(menu_id=menu.pk, option_id=option_id)
+                for menu, data in zip(menus, planned)
+                for option_id in dict.fromkeys(
+                    option_ids[description]
+                    for description in data['options']
+                )
+            )
+
+        return menus
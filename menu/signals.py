@@ -0,0 +1,86 @@
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_delete)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from core.models import Menu, Option
+from . import cache, search, snapshots
+from .today import today_menu
+
+
+def option_menu_ids(option_ids):
+    """Return the ids of the menus using any of the given options"""
+    return list(Menu.options.through.objects.filter(
+        option_id__in=option_ids
+    ).values_list('menu_id', flat=True).distinct())
+
+
+def touch_menus(menu_ids):
+    """Mark some menus as modified by a change of their options"""
+    Menu.objects.filter(id__in=menu_ids).update(updated_at=timezone.now())
+
+
+def menus_changed(menu_ids, deleted=False):
+    """Drop cached payloads and regenerate snapshots of some menus"""
+    cache.invalidate_menus(menu_ids)
+    today_menu.invalidate()
+    if not deleted:
+        snapshots.refresh_snapshots(menu_ids)
+
+
+@receiver(post_save, sender=Menu)
+def menu_saved(sender, instance, **kwargs):
+    """Refresh a menu when it is saved"""
+    menus_changed([instance.pk])
+
+
+@receiver(post_delete, sender=Menu)
+def menu_deleted(sender, instance, **kwargs):
+    """Invalidate a menu when it is deleted"""
+    menus_changed([instance.pk], deleted=True)
+
+
+@receiver(m2m_changed, sender=Menu.options.through)
+def menu_options_changed(sender, instance, action, reverse, pk_set,
+                         **kwargs):
+    """Refresh the menus whose options were added or removed"""
+    if reverse and action == 'pre_clear':
+        instance._cleared_menu_ids = option_menu_ids([instance.pk])
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        menu_ids = [instance.pk]
+    elif action == 'post_clear':
+        menu_ids = instance.__dict__.pop('_cleared_menu_ids', [])
+    else:
+        menu_ids = pk_set
+    touch_menus(menu_ids)
+    menus_changed(menu_ids)
+
+
+@receiver(post_save, sender=Option)
+def option_saved(sender, instance, created, using, update_fields,
+                 **kwargs):
+    """Index an option and refresh the menus showing it when it changes"""
+    if update_fields is None or 'description' in update_fields:
+        search.index_option(instance, using)
+    if not created:
+        menu_ids = option_menu_ids([instance.pk])
+        touch_menus(menu_ids)
+        menus_changed(menu_ids)
+
+
+@receiver(pre_delete, sender=Option)
+def option_deleting(sender, instance, **kwargs):
+    """Remember the menus showing an option about to be deleted"""
+    instance._deleted_menu_ids = option_menu_ids([instance.pk])
+
+
+@receiver(post_delete, sender=Option)
+def option_deleted(sender, instance, using, **kwargs):
+    """Unindex a deleted option and refresh the menus showing it"""
+    search.remove_options([instance.pk], using)
+    menu_ids = instance.__dict__.pop('_deleted_menu_ids', [])
+    touch_menus(menu_ids)
+    menus_changed(menu_ids)
@@ -0,0 +1,46 @@
+import hashlib
+
+from django.db.models import Prefetch
+
+from core.models import Menu, MenuSnapshot, Option
+from core.renderers import FastJSONRenderer
+from .serializers import PublicMenuSerializer
+
+
+def build_snapshot(menu):
+    """Return the rendered public body of a menu and its ETag"""
+    body = FastJSONRenderer().render(PublicMenuSerializer(menu).data)
+    return body.decode(), hashlib.sha1(body).hexdigest()
+
+
+def menus_with_options(menu_ids):
+    """Return some menus with the options shown on their public page"""
+    return Menu.objects.filter(id__in=menu_ids).prefetch_related(
+        Prefetch('options', queryset=Option.objects.order_by('id'))
+    )
+
+
+def create_snapshots(menu_ids):
+    """Generate the public snapshots of some new menus at once"""
+    snapshots = []
+    for menu in menus_with_options(menu_ids):
+        body, etag = build_snapshot(menu)
+        snapshots.append(MenuSnapshot(
+            menu=menu, uuid=menu.uuid, body=body, etag=etag
+        ))
+
+    return MenuSnapshot.objects.bulk_create(snapshots)
+
+
+def refresh_snapshots(menu_ids):
+    """Regenerate the public snapshots of some menus"""
+    snapshots = []
+    for menu in menus_with_options(menu_ids):
+        body, etag = build_snapshot(menu)
+        snapshot, _ = MenuSnapshot.objects.update_or_create(
+            menu=menu,
+            defaults={'uuid': menu.uuid, 'body': body, 'etag': etag}
+        )
+        snapshots.append(snapshot)
+
+    return snapshots
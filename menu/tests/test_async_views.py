@@ -0,0 +1,121 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import AsyncClient, TransactionTestCase
+from django.urls import reverse
+
+from asgiref.sync import async_to_sync
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from core.cutoff import local_today
+from core.models import Menu, Option
+from menu.serializers import MenuDetailSerializer
+
+import datetime
+import json
+
+TODAY_URL = reverse('menu-async:menu-today')
+OPTIONS_URL = reverse('menu-async:option-list')
+
+
+def detail_url(menu_id):
+    """Return the async menu detail URL"""
+    return reverse('menu-async:menu-detail', args=[menu_id])
+
+
+def async_get(client):
+    """Return a blocking version of an async client get"""
+    async def get(path, **extra):
+        return await client.get(path, **extra)
+
+    return async_to_sync(get)
+
+
+def read_json(response):
+    """Consume a streaming response and decode its JSON body"""
+    return json.loads(b''.join(response.streaming_content))
+
+
+class AsyncMenuApiTests(TransactionTestCase):
+    """Test the async read path of the menu API"""
+
+    def setUp(self):
+        cache.clear()
+        self.get = async_get(AsyncClient())
+        self.menu = Menu.objects.create(date=local_today())
+        self.menu.options.add(
+            Option.objects.create(description='Corn pie, Salad and Dessert'),
+            Option.objects.create(description='Premium chicken Salad')
+        )
+
+    def test_today_menu(self):
+        """Test today's menu is streamed with its options"""
+        res = self.get(TODAY_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        payload = read_json(res)
+        self.assertEqual(payload['id'], self.menu.id)
+        self.assertEqual(len(payload['options']), 2)
+
+    def test_no_menu_today(self):
+        """Test today's menu is not found when none was planned"""
+        self.menu.date = local_today() - datetime.timedelta(days=1)
+        self.menu.save()
+
+        res = self.get(TODAY_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_menu_detail_matches_sync_serializer(self):
+        """Test the async detail renders like MenuDetailSerializer"""
+        res = self.get(detail_url(self.menu.id))
+
+        self.assertEqual(read_json(res), json.loads(json.dumps(
+            MenuDetailSerializer(self.menu).data
+        )))
+
+    def test_missing_menu(self):
+        """Test an unknown menu returns not found"""
+        res = self.get(detail_url(self.menu.id + 100))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_options_require_token(self):
+        """Test the option list requires a valid token"""
+        res = self.get(OPTIONS_URL)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(res['WWW-Authenticate'], 'Token')
+
+        res = self.get(OPTIONS_URL, authorization='Token invalid')
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(res['WWW-Authenticate'], 'Token')
+
+        res = self.get(OPTIONS_URL, authorization='Token')
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_option_list(self):
+        """Test authenticated users get the options list"""
+        user = get_user_model().objects.create_user(
+            'employee@cornershop.cl', 'testpass'
+        )
+        token = Token.objects.create(user=user)
+
+        res = self.get(OPTIONS_URL, authorization=f'Token {token.key}')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [o['description'] for o in read_json(res)],
+            ['Premium chicken Salad', 'Corn pie, Salad and Dessert']
+        )
+
+    def test_option_list_keyword_case_insensitive(self):
+        """Test the token keyword is matched like the sync endpoint"""
+        user = get_user_model().objects.create_user(
+            'employee@cornershop.cl', 'testpass'
+        )
+        token = Token.objects.create(user=user)
+
+        res = self.get(OPTIONS_URL, authorization=f'token {token.key}')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
@@ -0,0 +1,135 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Menu, Option
+
+import datetime
+
+MENUS_URL = reverse('menu:menu-list')
+OPTIONS_URL = reverse('menu:option-list')
+
+
+def detail_url(menu_id):
+    return reverse('menu:menu-detail', args=[menu_id])
+
+
+class MenuConditionalGetTests(TestCase):
+    """Test conditional requests on the menus API"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.option = Option.objects.create(description='Corn pie')
+        self.menu = Menu.objects.create(date=datetime.date(2021, 1, 4))
+        self.menu.options.add(self.option)
+
+    def test_list_headers(self):
+        """Test the menu list carries validators and a cache policy"""
+        res = self.client.get(MENUS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', res)
+        self.assertNotIn('Last-Modified', res)
+        self.assertEqual(res['Cache-Control'],
+                         'public, max-age=0, must-revalidate')
+
+    def test_list_not_modified(self):
+        """Test an unchanged list is answered with one query"""
+        etag = self.client.get(MENUS_URL)['ETag']
+
+        with self.assertNumQueries(1):
+            res = self.client.get(MENUS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res.content, b'')
+        self.assertEqual(res['ETag'], etag)
+
+    def test_list_modified(self):
+        """Test new, changed and deleted menus change the list ETag"""
+        etags = [self.client.get(MENUS_URL)['ETag']]
+
+        other = Menu.objects.create(date=datetime.date(2021, 1, 5))
+        etags.append(self.client.get(MENUS_URL)['ETag'])
+        self.menu.options.add(Option.objects.create(description='Salad'))
+        etags.append(self.client.get(MENUS_URL)['ETag'])
+        self.option.description = 'Corn pie and Salad'
+        self.option.save()
+        etags.append(self.client.get(MENUS_URL)['ETag'])
+        other.delete()
+        etags.append(self.client.get(MENUS_URL)['ETag'])
+
+        self.assertEqual(len(set(etags)), len(etags))
+        res = self.client.get(MENUS_URL, HTTP_IF_NONE_MATCH=etags[0])
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_list_modified_since_deletion(self):
+        """Test deleting an older menu is not answered with 304"""
+        later = Menu.objects.create(date=datetime.date(2021, 1, 5))
+        since = self.client.get(detail_url(later.id))['Last-Modified']
+        self.menu.delete()
+
+        res = self.client.get(MENUS_URL, HTTP_IF_MODIFIED_SINCE=since)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 1)
+
+    def test_retrieve_not_modified_since(self):
+        """Test a menu unchanged since Last-Modified is not sent again"""
+        res = self.client.get(detail_url(self.menu.id))
+        self.assertEqual(res['Cache-Control'],
+                         'public, max-age=60, must-revalidate')
+
+        res = self.client.get(
+            detail_url(self.menu.id),
+            HTTP_IF_MODIFIED_SINCE=res['Last-Modified']
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve_missing(self):
+        """Test missing menus are not given validators"""
+        res = self.client.get(detail_url(self.menu.id + 1),
+                              HTTP_IF_NONE_MATCH='*')
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn('ETag', res)
+
+
+class OptionConditionalGetTests(TestCase):
+    """Test conditional requests on the options API"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            'employee@cornershop.cl', 'testpass'
+        )
+        Option.objects.create(description='Corn pie')
+
+    def test_login_required_before_validation(self):
+        """Test anonymous requests are rejected, not answered with 304"""
+        self.client.force_authenticate(self.user)
+        etag = self.client.get(OPTIONS_URL)['ETag']
+        self.client.force_authenticate(None)
+
+        res = self.client.get(OPTIONS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_list_not_modified(self):
+        """Test the options list is private and revalidated"""
+        self.client.force_authenticate(self.user)
+        res = self.client.get(OPTIONS_URL)
+        self.assertEqual(res['Cache-Control'],
+                         'private, max-age=0, must-revalidate')
+
+        res = self.client.get(OPTIONS_URL, HTTP_IF_NONE_MATCH=res['ETag'])
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Option.objects.create(description='Salad')
+        res = self.client.get(OPTIONS_URL, HTTP_IF_NONE_MATCH=res['ETag'])
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
@@ -0,0 +1,122 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework.renderers import JSONRenderer
+
+from core.models import Menu, Option
+from menu import fast_serializers, serializers
+from menu.tests import (test_menu_api, test_menu_cache, test_menu_queries,
+                        test_options_api, test_pagination, test_search)
+
+import datetime
+
+fast = override_settings(MENU_FAST_SERIALIZERS=True)
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+class FastSerializerTests(TestCase):
+    """Test the fast serializers render like the model serializers"""
+
+    def setUp(self):
+        self.menus = []
+        for i in range(3):
+            menu = Menu.objects.create(
+                name=f'Menú {i}' if i else '',
+                date=datetime.date(2021, 1, 4) + datetime.timedelta(days=i)
+            )
+            menu.options.add(*[
+                Option.objects.create(description=f'Corn pie {i}{j}')
+                for j in range(i + 1)
+            ])
+            self.menus.append(menu)
+        Menu.objects.create(date=datetime.date(2021, 1, 10))
+
+    def test_menu_list(self):
+        """Test menus render the same bytes as MenuSerializer"""
+        queryset = Menu.objects.order_by('id')
+        fast_serializer = fast_serializers.MenuValuesSerializer
+
+        self.assertEqual(
+            render(fast_serializer(
+                fast_serializer.values(queryset), many=True
+            ).data),
+            render(serializers.MenuSerializer(queryset, many=True).data)
+        )
+
+    def test_menu_detail(self):
+        """Test a menu renders the same bytes as MenuDetailSerializer"""
+        fast_serializer = fast_serializers.MenuDetailValuesSerializer
+        for menu in Menu.objects.all():
+            row = fast_serializer.values(
+                Menu.objects.filter(pk=menu.pk)
+            ).get()
+
+            self.assertEqual(
+                render(fast_serializer(row).data),
+                render(serializers.MenuDetailSerializer(menu).data)
+            )
+
+    def test_option_list(self):
+        """Test options render the same bytes as OptionSerializer"""
+        queryset = Option.objects.order_by('-description')
+        fast_serializer = fast_serializers.OptionValuesSerializer
+
+        self.assertEqual(
+            render(fast_serializer(
+                fast_serializer.values(queryset), many=True
+            ).data),
+            render(serializers.OptionSerializer(queryset, many=True).data)
+        )
+
+    @fast
+    def test_list_endpoint(self):
+        """Test the menu list endpoint serves the fast serializer"""
+        with override_settings(MENU_FAST_SERIALIZERS=False):
+            expected = self.client.get(reverse('menu:menu-list')).content
+
+        res = self.client.get(reverse('menu:menu-list'))
+
+        self.assertEqual(res.content, expected)
+
+
+@fast
+class FastPublicMenuApiTests(test_menu_api.PublicMenuApiTests):
+    pass
+
+
+@fast
+class FastPrivateMenuApiTest(test_menu_api.PrivateMenuApiTest):
+    pass
+
+
+@fast
+class FastPrivateOptionsApiTests(test_options_api.PrivateOptionsApiTests):
+    pass
+
+
+@fast
+class FastMenuCacheApiTests(test_menu_cache.MenuCacheApiTests):
+    pass
+
+
+@fast
+class FastMenuQueryCountTests(test_menu_queries.MenuQueryCountTests):
+    pass
+
+
+@fast
+class FastMenuPaginationTests(test_pagination.MenuPaginationTests):
+    pass
+
+
+@fast
+class FastOptionPaginationTests(test_pagination.OptionPaginationTests):
+    pass
+
+
+@fast
+class FastOptionSearchTests(test_search.OptionSearchTests):
+    pass
@@ -16,10 +16,9 @@ MENUS_URL = reverse('menu:menu-list')
 
 def sample_menu(**params):
     """Create and return a sample menu"""
-    option1 = Option.objects.create(
-        description='Corn pie, Salad and Dessert')
-    option2 = Option.objects.create(
-        description='Chicken Nugget Rice, Salad and Dessert')
+    option1 = Option.objects.intern('Corn pie, Salad and Dessert')
+    option2 = Option.objects.intern(
+        'Chicken Nugget Rice, Salad and Dessert')
 
     defaults = {
         'name': "Today's Menu",
@@ -35,7 +34,7 @@ def sample_menu(**params):
 
 def sample_option(description='Chicken Nugget Rice, Salad and Dessert'):
     """Create and return a sample option"""
-    return Option.objects.create(description=description)
+    return Option.objects.intern(description)
 
 
 def sample_order(user, menu):
@@ -109,7 +108,7 @@ class PrivateMenuApiTest(TestCase):
     def test_create_menu_with_options(self):
         """Test creating a menu with options"""
         option1 = sample_option()
-        option2 = sample_option()
+        option2 = sample_option('Corn pie, Salad and Dessert')
         payload = {
             'name': "Today's Menu",
             'date': datetime.date.today(),
@@ -129,7 +128,7 @@ class PrivateMenuApiTest(TestCase):
         """Test updating a menu with patch"""
         menu = sample_menu()
         menu.options.add(sample_option())
-        new_option = sample_option()
+        new_option = sample_option('Vegetable lasagna, Salad and Fruit')
 
         payload = {'name': 'Vegan Menu', 'options': [new_option.id]}
         url = detail_url(menu.id)
@@ -0,0 +1,134 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Menu, MenuSnapshot, Option
+
+import datetime
+import time
+
+BULK_URL = reverse('menu:menu-bulk')
+
+
+def plan(days, options=('Corn pie', 'Salad'), start=datetime.date(2021, 1, 4)):
+    """Return a bulk payload planning some consecutive days"""
+    return {'menus': [
+        {
+            'name': f'Menu {day}',
+            'date': start + datetime.timedelta(days=day),
+            'options': [f'{option} {day % 7}' for option in options],
+        }
+        for day in range(days)
+    ]}
+
+
+class MenuBulkPermissionTests(TestCase):
+    """Test who can plan menus in bulk"""
+
+    def test_staff_required(self):
+        """Test employees can not plan menus in bulk"""
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(
+            'employee@cornershop.cl', 'testpass'
+        ))
+
+        res = client.post(BULK_URL, plan(1), format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Menu.objects.exists())
+
+
+class MenuBulkApiTests(TestCase):
+    """Test planning menus in bulk"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(get_user_model().objects.create_user(
+            'nora@cornershop.cl', 'testpass', is_staff=True
+        ))
+
+    def test_bulk_create(self):
+        """Test menus are created with their options and snapshots"""
+        existing = Option.objects.create(description='Corn pie')
+        payload = {'menus': [
+            {'date': '2021-01-04', 'options': ['Corn pie', 'Salad']},
+            {'name': 'Vegan', 'date': '2021-01-05',
+             'options': ['Salad', 'Salad', 'Hummus']},
+            {'date': '2021-01-06'},
+        ]}
+
+        res = self.client.post(BULK_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        menus = [Menu.objects.get(id=pk) for pk in res.data['ids']]
+        self.assertEqual(
+            [str(menu.date) for menu in menus],
+            ['2021-01-04', '2021-01-05', '2021-01-06']
+        )
+        self.assertEqual(menus[1].name, 'Vegan')
+        self.assertEqual(Option.objects.count(), 3)
+        self.assertIn(existing, menus[0].options.all())
+        self.assertEqual(
+            sorted(menus[1].options.values_list('description', flat=True)),
+            ['Hummus', 'Salad']
+        )
+        self.assertFalse(menus[2].options.exists())
+        self.assertEqual(
+            MenuSnapshot.objects.filter(menu__in=menus).count(), 3
+        )
+
+    def test_bulk_interns_options(self):
+        """Test spellings of the same description share one option"""
+        existing = Option.objects.create(description='Corn pie')
+        payload = {'menus': [
+            {'date': '2021-01-04', 'options': ['corn  PIE', 'Salad']},
+            {'date': '2021-01-05', 'options': [' salad ', 'Corn pie']},
+        ]}
+
+        res = self.client.post(BULK_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Option.objects.count(), 2)
+        for pk in res.data['ids']:
+            menu = Menu.objects.get(id=pk)
+            self.assertEqual(menu.options.count(), 2)
+            self.assertIn(existing, menu.options.all())
+
+    @override_settings(MENU_BULK_MAX_SIZE=2)
+    def test_bulk_max_size(self):
+        """Test too many menus are rejected"""
+        res = self.client.post(BULK_URL, plan(3), format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Menu.objects.exists())
+
+    def test_bulk_invalid_menu(self):
+        """Test one invalid menu rejects the whole plan"""
+        payload = plan(2)
+        payload['menus'][1]['date'] = 'tomorrow'
+
+        res = self.client.post(BULK_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('date', res.data['menus'][1])
+        self.assertFalse(Option.objects.exists())
+
+    def test_bulk_year_benchmark(self):
+        """Test a year of menus is planned fast with batched queries"""
+        payload = plan(365)
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            res = self.client.post(BULK_URL, payload, format='json')
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(res.data['ids']), 365)
+        self.assertEqual(Option.objects.count(), 14)
+        self.assertEqual(Menu.options.through.objects.count(), 730)
+        self.assertLess(len(queries), 20)
+        self.assertLess(elapsed, 1.0)
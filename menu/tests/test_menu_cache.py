@@ -0,0 +1,132 @@
+from django.core.cache import cache as default_cache
+from django.urls import reverse
+from django.test import TestCase
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Menu, Option
+from menu import cache
+
+from unittest import mock
+import datetime
+import threading
+
+
+def detail_url(menu_id):
+    """Return menu detail URL"""
+    return reverse('menu:menu-detail', args=[menu_id])
+
+
+def sample_menu():
+    """Create and return a menu with one option"""
+    menu = Menu.objects.create(date=datetime.date.today())
+    menu.options.add(
+        Option.objects.create(description='Corn pie, Salad and Dessert')
+    )
+    return menu
+
+
+class MenuCacheApiTests(TestCase):
+    """Test the menu detail read-through cache"""
+
+    def setUp(self):
+        default_cache.clear()
+        self.client = APIClient()
+        self.menu = sample_menu()
+
+    def test_retrieve_served_from_cache(self):
+        """Test a second retrieve only checks the menu is unchanged"""
+        self.client.get(detail_url(self.menu.id))
+
+        with self.assertNumQueries(1):
+            res = self.client.get(detail_url(self.menu.id))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['id'], self.menu.id)
+
+    def test_menu_save_invalidates(self):
+        """Test saving a menu drops its cached payload"""
+        self.client.get(detail_url(self.menu.id))
+
+        self.menu.name = 'Vegan Menu'
+        self.menu.save()
+        res = self.client.get(detail_url(self.menu.id))
+
+        self.assertEqual(res.data['name'], 'Vegan Menu')
+
+    def test_menu_options_change_invalidates(self):
+        """Test adding or removing menu options drops the payload"""
+        self.client.get(detail_url(self.menu.id))
+
+        option = Option.objects.create(description='Premium chicken Salad')
+        self.menu.options.add(option)
+        res = self.client.get(detail_url(self.menu.id))
+        self.assertEqual(len(res.data['options']), 2)
+
+        option.menu_set.clear()
+        res = self.client.get(detail_url(self.menu.id))
+        self.assertEqual(len(res.data['options']), 1)
+
+    def test_option_change_invalidates(self):
+        """Test editing an option drops the menus showing it"""
+        self.client.get(detail_url(self.menu.id))
+
+        option = self.menu.options.get()
+        option.description = 'Corn pie and Dessert'
+        option.save()
+        res = self.client.get(detail_url(self.menu.id))
+
+        self.assertEqual(
+            res.data['options'][0]['description'], option.description
+        )
+
+    def test_missing_menu(self):
+        """Test retrieving a missing menu returns not found"""
+        res = self.client.get(detail_url(self.menu.id + 1))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class MenuCacheStampedeTests(TestCase):
+    """Test only one worker rebuilds a missing payload"""
+
+    def setUp(self):
+        default_cache.clear()
+
+    def test_waiting_worker_reuses_rebuilt_payload(self):
+        """Test a worker waits for the payload built by the lock holder"""
+        key = cache.menu_cache_key(1)
+        cache.get_cache().add(f'{key}:lock', 'other-worker')
+        timer = threading.Timer(
+            0.1, cache.get_cache().set, args=(key, {'id': 1})
+        )
+        timer.start()
+
+        def build():
+            raise AssertionError('The payload must not be rebuilt')
+
+        payload = cache.get_menu_payload(1, build)
+        timer.join()
+
+        self.assertEqual(payload, {'id': 1})
+
+    def test_key_uses_local_date(self):
+        """Test entries roll over at midnight in the order time zone"""
+        now = datetime.datetime(2021, 1, 5, 1, 0, tzinfo=datetime.timezone.utc)
+
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            key = cache.menu_cache_key(1)
+
+        self.assertEqual(key, 'menu:detail:1:2021-01-04')
+
+    def test_invalidated_rebuild_not_stored(self):
+        """Test a rebuild interrupted by an invalidation is not cached"""
+        def build():
+            cache.invalidate_menus([1])
+            return {'id': 1, 'name': 'stale'}
+
+        payload = cache.get_menu_payload(1, build)
+
+        self.assertEqual(payload['name'], 'stale')
+        self.assertIsNone(cache.get_cache().get(cache.menu_cache_key(1)))
@@ -0,0 +1,88 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Menu, Option
+
+import datetime
+
+MENUS_URL = reverse('menu:menu-list')
+
+
+def detail_url(menu_id):
+    """Return menu detail URL"""
+    return reverse('menu:menu-detail', args=[menu_id])
+
+
+def create_menus(count, options_per_menu=3):
+    """Create and return menus, each one with its own options"""
+    menus = []
+    for i in range(count):
+        menu = Menu.objects.create(
+            name=f'Menu {i}',
+            date=datetime.date(2020, 11, 1) + datetime.timedelta(days=i)
+        )
+        menu.options.add(*[
+            Option.objects.intern(f'Option {i}.{j}')
+            for j in range(options_per_menu)
+        ])
+        menus.append(menu)
+
+    return menus
+
+
+class MenuQueryCountTests(TestCase):
+    """Test the number of queries issued by the menu API"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_list_query_count_is_constant(self):
+        """Test listing menus does not issue a query per menu"""
+        create_menus(2)
+        with self.assertNumQueries(3):
+            res = self.client.get(MENUS_URL)
+        self.assertEqual(len(res.data), 2)
+
+        create_menus(10)
+        with self.assertNumQueries(3):
+            res = self.client.get(MENUS_URL)
+        self.assertEqual(len(res.data), 12)
+
+    def test_retrieve_query_count(self):
+        """Test retrieving a menu fetches its options in one query"""
+        menu = create_menus(1, options_per_menu=8)[0]
+
+        with self.assertNumQueries(3):
+            res = self.client.get(detail_url(menu.id))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data['options']), 8)
+
+    def test_filter_by_options_returns_unique_menus(self):
+        """Test filtering by several options does not duplicate menus"""
+        menu1, menu2 = create_menus(2)
+        option_ids = [o.id for o in menu1.options.all()]
+
+        res = self.client.get(
+            MENUS_URL, {'options': ','.join(map(str, option_ids))}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([m['id'] for m in res.data], [menu1.id])
+
+    def test_filter_by_options_query_count(self):
+        """Test the options filter is resolved with a subquery"""
+        menus = create_menus(5)
+        option_ids = [
+            o.id for menu in menus for o in menu.options.all()
+        ]
+
+        with self.assertNumQueries(3):
+            res = self.client.get(
+                MENUS_URL, {'options': ','.join(map(str, option_ids))}
+            )
+
+        self.assertEqual(len(res.data), 5)
@@ -76,6 +76,19 @@ class PrivateOptionsApiTests(TestCase):
 
         self.assertTrue(exists)
 
+    def test_create_option_existing(self):
+        """Test creating an option returns the existing one"""
+        option = Option.objects.create(
+            description='Rice with hamburger, Salad and Dessert'
+        )
+        payload = {'description': ' rice with Hamburger,  salad and dessert'}
+        res = self.client.post(OPTIONS_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data['id'], option.id)
+        self.assertEqual(res.data['description'], option.description)
+        self.assertEqual(Option.objects.count(), 1)
+
     def test_create_option_invalid(self):
         """Test creating a new option with invalid payload"""
         payload = {'description': ''}
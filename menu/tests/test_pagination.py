@@ -0,0 +1,115 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.test import TestCase
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Menu, Option
+
+import datetime
+
+MENUS_URL = reverse('menu:menu-list')
+OPTIONS_URL = reverse('menu:option-list')
+
+
+def create_menu(day, name="Today's Menu"):
+    """Create and return a menu for the given day of November 2020"""
+    return Menu.objects.create(
+        name=name,
+        date=datetime.date(2020, 11, day)
+    )
+
+
+class MenuPaginationTests(TestCase):
+    """Test keyset pagination of the menus API"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_unpaginated_by_default(self):
+        """Test menus are returned as a plain list without parameters"""
+        create_menu(1)
+
+        res = self.client.get(MENUS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(res.data, list)
+
+    def test_paginate_menus_newest_first(self):
+        """Test walking all pages returns every menu once, newest first"""
+        menus = [create_menu(day) for day in (1, 2, 2, 3, 4)]
+
+        ids = []
+        res = self.client.get(MENUS_URL, {'page_size': 2})
+        while True:
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(res.data['results']), 2)
+            ids.extend(m['id'] for m in res.data['results'])
+            if not res.data['next']:
+                break
+            res = self.client.get(res.data['next'])
+
+        expected = sorted(menus, key=lambda m: (m.date, m.id), reverse=True)
+        self.assertEqual(ids, [m.id for m in expected])
+
+    def test_pages_stable_under_inserts(self):
+        """Test menus created while paging do not shift the next page"""
+        for day in range(1, 5):
+            create_menu(day)
+
+        res = self.client.get(MENUS_URL, {'page_size': 2})
+        create_menu(10, name='Newer menu')
+        res = self.client.get(res.data['next'])
+
+        dates = [m['date'] for m in res.data['results']]
+        self.assertEqual(dates, ['2020-11-02', '2020-11-01'])
+        self.assertIsNone(res.data['next'])
+
+    def test_page_query_count(self):
+        """Test a later page costs the same queries as the first one"""
+        for day in range(1, 7):
+            create_menu(day)
+
+        with self.assertNumQueries(3):
+            res = self.client.get(MENUS_URL, {'page_size': 2})
+        with self.assertNumQueries(3):
+            self.client.get(res.data['next'])
+
+    def test_invalid_cursor(self):
+        """Test an invalid cursor returns not found"""
+        res = self.client.get(MENUS_URL, {'cursor': 'not-a-cursor'})
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class OptionPaginationTests(TestCase):
+    """Test keyset pagination of the options API"""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            'nora@cornershop.com',
+            'testpass'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_paginate_options(self):
+        """Test options are paginated by creation, newest first"""
+        options = [
+            Option.objects.create(description=f'Option {i}')
+            for i in range(5)
+        ]
+
+        res = self.client.get(OPTIONS_URL, {'page_size': 3})
+        self.assertEqual(
+            [o['id'] for o in res.data['results']],
+            [o.id for o in reversed(options[2:])]
+        )
+
+        res = self.client.get(res.data['next'])
+        self.assertEqual(
+            [o['id'] for o in res.data['results']],
+            [o.id for o in reversed(options[:2])]
+        )
+        self.assertIsNone(res.data['next'])
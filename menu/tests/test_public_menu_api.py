@@ -0,0 +1,92 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+
+from core.models import Menu, MenuSnapshot, Option
+
+import datetime
+import uuid
+
+
+def public_url(menu_uuid):
+    """Return the public menu URL"""
+    return reverse('public-menu', args=[menu_uuid])
+
+
+def sample_menu():
+    """Create and return a menu with two options"""
+    menu = Menu.objects.create(date=datetime.date.today())
+    menu.options.add(
+        Option.objects.create(description='Corn pie, Salad and Dessert'),
+        Option.objects.create(description='Premium chicken Salad')
+    )
+    return menu
+
+
+class PublicMenuPageTests(TestCase):
+    """Test the unauthenticated menu page"""
+
+    def setUp(self):
+        self.menu = sample_menu()
+
+    def test_view_public_menu(self):
+        """Test the page is served without authentication"""
+        res = self.client.get(public_url(self.menu.uuid))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        payload = res.json()
+        self.assertEqual(payload['uuid'], str(self.menu.uuid))
+        self.assertEqual(
+            [o['description'] for o in payload['options']],
+            ['Corn pie, Salad and Dessert', 'Premium chicken Salad']
+        )
+        self.assertTrue(res['ETag'].startswith('"'))
+
+    def test_served_with_a_single_query(self):
+        """Test the snapshot is served without serializing or joining"""
+        with self.assertNumQueries(1):
+            self.client.get(public_url(self.menu.uuid))
+
+    def test_not_modified(self):
+        """Test a matching If-None-Match returns 304"""
+        res = self.client.get(public_url(self.menu.uuid))
+
+        res = self.client.get(
+            public_url(self.menu.uuid), HTTP_IF_NONE_MATCH=res['ETag']
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res.content, b'')
+
+    def test_snapshot_regenerated_on_change(self):
+        """Test changing the menu options changes the page and its ETag"""
+        etag = self.client.get(public_url(self.menu.uuid))['ETag']
+
+        option = self.menu.options.order_by('id').first()
+        option.description = 'Corn pie and Dessert'
+        option.save()
+        res = self.client.get(
+            public_url(self.menu.uuid), HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res['ETag'], etag)
+        self.assertEqual(
+            res.json()['options'][0]['description'], option.description
+        )
+
+    def test_missing_snapshot_built_on_demand(self):
+        """Test a menu without snapshot gets one on its first visit"""
+        MenuSnapshot.objects.all().delete()
+
+        res = self.client.get(public_url(self.menu.uuid))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(MenuSnapshot.objects.filter(menu=self.menu).exists())
+
+    def test_unknown_menu(self):
+        """Test an unknown UUID returns not found"""
+        res = self.client.get(public_url(uuid.uuid4()))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
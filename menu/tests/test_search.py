@@ -0,0 +1,145 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Menu, Option
+from menu import search
+from menu.serializers import MenuBulkSerializer
+
+from unittest import mock
+import datetime
+
+OPTIONS_URL = reverse('menu:option-list')
+
+
+def descriptions(res):
+    """Return the descriptions of the options in a response"""
+    return [option['description'] for option in res.data]
+
+
+class OptionSearchTests(TestCase):
+    """Test searching options through the search index"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(get_user_model().objects.create_user(
+            'nora@cornershop.cl', 'testpass', is_staff=True
+        ))
+        self.curry = Option.objects.create(
+            description='Chickpea curry, Rice and Fruit'
+        )
+        self.chicken = Option.objects.create(
+            description='Premium chicken, Salad and Flan'
+        )
+        self.casserole = Option.objects.create(
+            description='Chicken casserole with chicken broth'
+        )
+        self.lasagna = Option.objects.create(
+            description='Vegetable lasagna, Salad and Dessert'
+        )
+
+    def test_ranks_matches(self):
+        """Test matching options are returned best first"""
+        res = self.client.get(OPTIONS_URL, {'search': 'chicken'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(descriptions(res), [
+            self.casserole.description, self.chicken.description,
+        ])
+
+    def test_matches_words_and_last_prefix(self):
+        """Test every term matches a word, the last one as a prefix"""
+        res = self.client.get(OPTIONS_URL, {'search': 'salad chick'})
+        self.assertEqual(descriptions(res), [self.chicken.description])
+
+        res = self.client.get(OPTIONS_URL, {'search': 'chick salad'})
+        self.assertEqual(res.data, [])
+
+    def test_ignores_diacritics_and_punctuation(self):
+        """Test accents and query syntax do not get in the way"""
+        Option.objects.create(description='Puré de papas')
+
+        res = self.client.get(OPTIONS_URL, {'search': 'pure "de'})
+
+        self.assertEqual(descriptions(res), ['Puré de papas'])
+
+    def test_empty_query(self):
+        """Test a query without words matches nothing"""
+        res = self.client.get(OPTIONS_URL, {'search': '"*'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, [])
+
+    def test_limited_to_page_size(self):
+        """Test only a page of the best matches is returned"""
+        res = self.client.get(OPTIONS_URL, {
+            'search': 'salad', 'page_size': 1,
+        })
+
+        self.assertEqual(len(res.data), 1)
+
+    def test_assigned_only(self):
+        """Test searching the options assigned to menus"""
+        menu = Menu.objects.create(date=datetime.date(2021, 1, 4))
+        menu.options.add(self.chicken)
+
+        res = self.client.get(OPTIONS_URL, {
+            'search': 'chicken', 'assigned_only': 1,
+        })
+
+        self.assertEqual(descriptions(res), [self.chicken.description])
+
+    def test_index_follows_changes(self):
+        """Test renamed and deleted options are reindexed"""
+        self.chicken.description = 'Premium beef, Salad and Flan'
+        self.chicken.save()
+        self.casserole.delete()
+
+        res = self.client.get(OPTIONS_URL, {'search': 'chicken'})
+        self.assertEqual(res.data, [])
+
+        res = self.client.get(OPTIONS_URL, {'search': 'beef'})
+        self.assertEqual(descriptions(res), [self.chicken.description])
+
+    def test_bulk_planned_options_indexed(self):
+        """Test options created by bulk planning are searchable"""
+        serializer = MenuBulkSerializer(data={'menus': [{
+            'date': '2021-01-04', 'options': ['Salmon, Rice and Fruit'],
+        }]})
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        res = self.client.get(OPTIONS_URL, {'search': 'salmon'})
+
+        self.assertEqual(descriptions(res), ['Salmon, Rice and Fruit'])
+
+    def test_rebuild_index(self):
+        """Test rebuilding indexes options created without signals"""
+        option = Option(description='Beef stew')
+        option.set_description_hash()
+        Option.objects.bulk_create([option])
+        self.assertEqual(
+            self.client.get(OPTIONS_URL, {'search': 'stew'}).data, []
+        )
+
+        search.rebuild_index()
+
+        res = self.client.get(OPTIONS_URL, {'search': 'stew'})
+        self.assertEqual(descriptions(res), ['Beef stew'])
+
+    def test_constant_queries(self):
+        """Test a search reads the index once"""
+        with self.assertNumQueries(3):
+            self.client.get(OPTIONS_URL, {'search': 'salad'})
+
+    @mock.patch('menu.search.backend', return_value=None)
+    def test_scan_fallback(self, backend):
+        """Test searching databases without a search index"""
+        res = self.client.get(OPTIONS_URL, {'search': 'chicken'})
+
+        self.assertEqual(descriptions(res), [
+            self.casserole.description, self.chicken.description,
+        ])
@@ -0,0 +1,142 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.cutoff import local_today
+from core.models import Menu, Option
+from menu.today import TodayMenu, today_menu
+
+import datetime
+
+TODAY_URL = reverse('menu:menu-today')
+
+
+class MenuManagerTests(TestCase):
+    """Test resolving menus by local date"""
+
+    def test_for_local_date(self):
+        """Test the latest menu of a date is returned"""
+        date = datetime.date(2021, 1, 4)
+        Menu.objects.create(date=date)
+        latest = Menu.objects.create(date=date)
+        Menu.objects.create(date=date + datetime.timedelta(days=1))
+
+        self.assertEqual(Menu.objects.for_local_date(date), latest)
+        self.assertIsNone(
+            Menu.objects.for_local_date(date - datetime.timedelta(days=1))
+        )
+
+    def test_for_today_in_chile(self):
+        """Test today is the date in Santiago, not in UTC"""
+        menu = Menu.objects.create(date=datetime.date(2021, 1, 4))
+        Menu.objects.create(date=datetime.date(2021, 1, 5))
+        now = timezone.make_aware(
+            datetime.datetime(2021, 1, 5, 2, 0), timezone.utc
+        )
+
+        self.assertEqual(Menu.objects.for_today(now), menu)
+
+
+class TodayMenuMemoTests(TestCase):
+    """Test the in-process memo of today's menu"""
+
+    def setUp(self):
+        self.memo = TodayMenu()
+        self.builds = []
+
+    def build(self, date):
+        self.builds.append(date)
+        return {'date': str(date)}
+
+    def test_memoized_until_midnight(self):
+        """Test the payload is rebuilt once the local date changes"""
+        before = timezone.make_aware(
+            datetime.datetime(2021, 1, 5, 2, 59), timezone.utc
+        )
+        after = before + datetime.timedelta(minutes=2)
+
+        self.memo.get(self.build, before)
+        self.memo.get(self.build, before)
+        payload = self.memo.get(self.build, after)
+
+        self.assertEqual(payload, {'date': '2021-01-05'})
+        self.assertEqual(
+            self.builds,
+            [datetime.date(2021, 1, 4), datetime.date(2021, 1, 5)]
+        )
+
+    @override_settings(MENU_TODAY_TTL=0)
+    def test_ttl(self):
+        """Test the payload expires after the configured seconds"""
+        self.memo.get(self.build)
+        self.memo.get(self.build)
+
+        self.assertEqual(len(self.builds), 2)
+
+    def test_invalidated_while_building(self):
+        """Test a payload built before an invalidation is not kept"""
+        def build(date):
+            self.memo.invalidate()
+            return self.build(date)
+
+        self.memo.get(build)
+        self.memo.get(self.build)
+
+        self.assertEqual(len(self.builds), 2)
+
+
+class TodayMenuApiTests(TestCase):
+    """Test the today's menu endpoint"""
+
+    def setUp(self):
+        today_menu.invalidate()
+        self.client = APIClient()
+
+    def test_today_memoized(self):
+        """Test today's menu is served without queries on repeat"""
+        menu = Menu.objects.create(date=local_today())
+        menu.options.add(Option.objects.create(description='Corn pie'))
+        self.client.get(TODAY_URL)
+
+        with self.assertNumQueries(0):
+            res = self.client.get(TODAY_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['id'], menu.id)
+        self.assertEqual(res.data['options'][0]['description'], 'Corn pie')
+
+    def test_changes_invalidate(self):
+        """Test menu and option changes drop the memoized menu"""
+        res = self.client.get(TODAY_URL)
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+        menu = Menu.objects.create(date=local_today())
+        option = Option.objects.create(description='Corn pie')
+        menu.options.add(option)
+        self.client.get(TODAY_URL)
+        option.description = 'Corn pie and Salad'
+        option.save()
+        res = self.client.get(TODAY_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.data['options'][0]['description'], 'Corn pie and Salad'
+        )
+
+    def test_bulk_planning_invalidates(self):
+        """Test menus planned in bulk for today are served"""
+        self.client.get(TODAY_URL)
+        self.client.force_authenticate(get_user_model().objects.create_user(
+            'nora@cornershop.cl', 'testpass', is_staff=True
+        ))
+
+        self.client.post(reverse('menu:menu-bulk'), {'menus': [
+            {'date': local_today(), 'options': ['Corn pie']},
+        ]}, format='json')
+        res = self.client.get(TODAY_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
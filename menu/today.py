@@ -0,0 +1,64 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import Prefetch
+
+from core.cutoff import local_today
+from core.models import Menu, Option
+from .serializers import MenuDetailSerializer
+
+
+class TodayMenu:
+    """In-process memo of the payload of today's menu"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._entry = None
+
+    def get(self, build, now=None):
+        """Return today's payload, building it when missing or stale"""
+        today = local_today(now)
+        entry = self._entry
+        if (entry is not None and entry[0] == today
+                and time.monotonic() < entry[1]):
+            return entry[2]
+
+        with self._lock:
+            generation = self._generation
+        payload = build(today)
+        with self._lock:
+            if generation == self._generation:
+                # Other processes miss our invalidations, so entries expire
+                expires = time.monotonic() + settings.MENU_TODAY_TTL
+                self._entry = (today, expires, payload)
+        return payload
+
+    def invalidate(self):
+        """Drop the memoized payload"""
+        with self._lock:
+            self._generation += 1
+            self._entry = None
+
+
+today_menu = TodayMenu()
+
+
+def build_payload(date):
+    """Return the detail of the menu planned for a date, or None"""
+    options = Option.objects.only('id', 'description').order_by('id')
+    menu = Menu.objects.only(
+        'id', 'name', 'date', 'cutoff_time', 'cutoff_at', 'created_at'
+    ).prefetch_related(
+        Prefetch('options', queryset=options)
+    ).for_local_date(date)
+    if menu is None:
+        return None
+
+    return MenuDetailSerializer(menu).data
+
+
+def get_today_payload(now=None):
+    """Return the detail of today's menu in the order time zone, or None"""
+    return today_menu.get(build_payload, now)
@@ -1,48 +1,154 @@
-from rest_framework import viewsets, mixins
-from rest_framework.authentication import TokenAuthentication
-from rest_framework.permissions import IsAuthenticated
+from django.conf import settings
+from django.db.models import Prefetch
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.views import View
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import (SAFE_METHODS, IsAdminUser,
+                                        IsAuthenticated)
+from rest_framework.response import Response
 
-from core.models import Option, Menu
-from . import serializers
+from core.cutoff import local_today
+from core.models import Option, Menu, MenuSnapshot
+from core.routers import read_from_replicas
+from reminder.dispatch import send_menu_reminder_async
+from user.authentication import CachedTokenAuthentication
+from . import cache, fast_serializers, search, serializers, snapshots
+from .conditional import ConditionalGetMixin
+from .pagination import MenuPagination, OptionPagination
+from .today import get_today_payload, today_menu
 
 
-class OptionViewSet(viewsets.GenericViewSet,
+class ReplicaReadMixin:
+    """Read menus and options from the replicas on safe requests"""
+
+    def initial(self, request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            read_from_replicas()
+        super().initial(request, *args, **kwargs)
+
+
+class FastReadMixin:
+    """Serve reads with values() based serializers when they are enabled"""
+    fast_serializer_classes = {}
+
+    def get_fast_serializer_class(self):
+        """Return the fast serializer of the current action, if any"""
+        if not settings.MENU_FAST_SERIALIZERS:
+            return None
+        return self.fast_serializer_classes.get(self.action)
+
+    def list(self, request, *args, **kwargs):
+        serializer_class = self.get_fast_serializer_class()
+        if serializer_class is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = serializer_class.values(
+            self.filter_queryset(self.get_queryset())
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(
+                serializer_class(page, many=True).data
+            )
+
+        return Response(serializer_class(queryset, many=True).data)
+
+
+class OptionViewSet(ReplicaReadMixin,
+                    FastReadMixin,
+                    ConditionalGetMixin,
+                    viewsets.GenericViewSet,
                     mixins.ListModelMixin,
                     mixins.CreateModelMixin):
     """Manage options in the database"""
-    authentication_classes = (TokenAuthentication,)
+    authentication_classes = (CachedTokenAuthentication,)
     permission_classes = (IsAuthenticated,)
     queryset = Option.objects.all()
     serializer_class = serializers.OptionSerializer
+    pagination_class = OptionPagination
+    fast_serializer_classes = {
+        'list': fast_serializers.OptionValuesSerializer,
+    }
+    cache_policies = {
+        'list': 'private, max-age=0, must-revalidate',
+    }
+    search_param = 'search'
+    search_results = None
 
     def get_queryset(self):
-        """Return objects"""
+        """Return objects, ranked by relevance when searching"""
         assigned_only = bool(
             int(self.request.query_params.get('assigned_only', 0))
         )
         queryset = self.queryset
         if assigned_only:
-            queryset = queryset.filter(menu__isnull=False)
+            assigned_ids = Menu.options.through.objects.values('option_id')
+            queryset = queryset.filter(id__in=assigned_ids)
+
+        query = self.request.query_params.get(self.search_param)
+        if query is None:
+            return queryset.order_by('-description')
 
-        return queryset.order_by('-description').distinct()
+        # The validators and the listing share the ranked matches
+        if self.search_results is None:
+            self.search_results = search.search(
+                queryset, query, self.paginator.get_page_size(self.request)
+            )
+        return self.search_results.all()
 
+    def paginate_queryset(self, queryset):
+        """Return search results whole, they are limited to a page"""
+        if self.search_param in self.request.query_params:
+            return None
+        return super().paginate_queryset(queryset)
 
-class MenuViewSet(viewsets.ModelViewSet):
+
+class MenuViewSet(ReplicaReadMixin, FastReadMixin, ConditionalGetMixin,
+                  viewsets.ModelViewSet):
     """Manage menus in the database"""
     serializer_class = serializers.MenuSerializer
     queryset = Menu.objects.all()
+    pagination_class = MenuPagination
+    fast_serializer_classes = {
+        'list': fast_serializers.MenuValuesSerializer,
+        'retrieve': fast_serializers.MenuDetailValuesSerializer,
+    }
+    cache_policies = {
+        'list': 'public, max-age=0, must-revalidate',
+        'retrieve': 'public, max-age=60, must-revalidate',
+    }
 
     def _params_to_ints(self, qs):
         """Convert a list of string IDs to a list of integers"""
         return [int(str_id) for str_id in qs.split(',')]
 
+    def _options_prefetch(self):
+        """Return the options prefetch needed by the current action"""
+        if self.action == 'retrieve':
+            options = Option.objects.only('id', 'description')
+        else:
+            options = Option.objects.only('id')
+
+        return Prefetch('options', queryset=options.order_by('id'))
+
     def get_queryset(self):
         """Retrieve the menus"""
         options = self.request.query_params.get('options')
         queryset = self.queryset
         if options:
             option_ids = self._params_to_ints(options)
-            queryset = queryset.filter(options__id__in=option_ids)
+            menu_ids = Menu.options.through.objects.filter(
+                option_id__in=option_ids
+            ).values('menu_id').distinct()
+            queryset = queryset.filter(id__in=menu_ids)
+
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.only(
+                'id', 'name', 'date', 'cutoff_time', 'cutoff_at',
+                'created_at'
+            ).prefetch_related(self._options_prefetch())
 
         return queryset
 
@@ -50,9 +156,95 @@ class MenuViewSet(viewsets.ModelViewSet):
         """Return appropriate serializer class"""
         if self.action == 'retrieve':
             return serializers.MenuDetailSerializer
+        if self.action == 'bulk':
+            return serializers.MenuBulkSerializer
 
         return self.serializer_class
 
+    def retrieve(self, request, *args, **kwargs):
+        """Return a menu from the read-through cache"""
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            menu_id = int(self.kwargs[lookup_url_kwarg])
+        except ValueError:
+            raise Http404
+
+        def build():
+            serializer_class = self.get_fast_serializer_class()
+            if serializer_class is None:
+                return self.get_serializer(self.get_object()).data
+
+            row = serializer_class.values(
+                self.get_queryset().filter(pk=menu_id)
+            ).first()
+            if row is None:
+                raise Http404
+            return serializer_class(row).data
+
+        return Response(cache.get_menu_payload(menu_id, build))
+
     def perform_create(self, serializer):
-        """Create a new menu"""
-        serializer.save()
+        """Create a new menu and remind employees when it is today's"""
+        menu = serializer.save()
+        if menu.date == local_today():
+            send_menu_reminder_async(menu)
+
+    @action(methods=['get'], detail=False)
+    def today(self, request):
+        """Return the menu of today in the order time zone"""
+        payload = get_today_payload()
+        if payload is None:
+            raise Http404
+
+        return Response(payload)
+
+    @action(methods=['post'], detail=False,
+            authentication_classes=(CachedTokenAuthentication,),
+            permission_classes=(IsAdminUser,))
+    def bulk(self, request):
+        """Plan many menus with their options at once"""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        menus = serializer.save()
+
+        menu_ids = [menu.pk for menu in menus]
+        snapshots.create_snapshots(menu_ids)
+        today_menu.invalidate()
+        today = local_today()
+        for menu in menus:
+            if menu.date == today:
+                send_menu_reminder_async(menu)
+
+        return Response({'ids': menu_ids}, status=status.HTTP_201_CREATED)
+
+
+class PublicMenuView(View):
+    """Serve the public page of a menu from its precomputed snapshot"""
+    cache_control = 'public, max-age=0, must-revalidate'
+
+    def get_snapshot(self, uuid):
+        """Return the body and ETag of a menu snapshot"""
+        snapshot = MenuSnapshot.objects.filter(uuid=uuid).values_list(
+            'body', 'etag'
+        ).first()
+        if snapshot is not None:
+            return snapshot
+
+        menu = Menu.objects.filter(uuid=uuid).first()
+        if menu is None:
+            raise Http404
+
+        snapshot = snapshots.refresh_snapshots([menu.pk])[0]
+        return snapshot.body, snapshot.etag
+
+    def get(self, request, uuid):
+        body, etag = self.get_snapshot(uuid)
+        etag = f'"{etag}"'
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(body, content_type='application/json')
+
+        response['ETag'] = etag
+        response['Cache-Control'] = self.cache_control
+        return response
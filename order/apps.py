@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class OrderConfig(AppConfig):
+    name = 'order'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,79 @@
+import csv
+import itertools
+import json
+
+from django.conf import settings
+
+from core.models import Order
+
+COLUMNS = (
+    'id', 'date', 'menu', 'user_name', 'user_email', 'option',
+    'observation', 'created_at',
+)
+
+
+class Echo:
+    """File-like object returning what is written to it"""
+
+    def write(self, value):
+        return value
+
+
+def export_queryset(start, end):
+    """Return the orders of a date range with the columns exported"""
+    return Order.objects.filter(
+        menu__date__range=(start, end)
+    ).select_related('user', 'menu', 'option').only(
+        'id', 'observation', 'created_at',
+        'user__name', 'user__email',
+        'menu__date', 'menu__name',
+        'option__description',
+    ).order_by('menu__date', 'id')
+
+
+def export_rows(queryset):
+    """Stream the exported values of each order from a server-side cursor"""
+    chunk_size = settings.ORDER_EXPORT_CHUNK_SIZE
+    for order in queryset.iterator(chunk_size=chunk_size):
+        yield (
+            order.id,
+            order.menu.date.isoformat(),
+            order.menu.name,
+            order.user.name,
+            order.user.email,
+            order.option.description if order.option_id else '',
+            order.observation,
+            order.created_at.isoformat(),
+        )
+
+
+def batched(rows):
+    """Group rows so each streamed chunk carries many of them"""
+    size = settings.ORDER_EXPORT_CHUNK_SIZE
+    while True:
+        batch = list(itertools.islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def csv_stream(rows):
+    """Yield the rows as CSV text, starting with a header"""
+    writer = csv.writer(Echo())
+    yield writer.writerow(COLUMNS)
+    for batch in batched(rows):
+        yield ''.join(writer.writerow(row) for row in batch)
+
+
+def ndjson_stream(rows):
+    """Yield the rows as newline delimited JSON objects"""
+    for batch in batched(rows):
+        yield ''.join(
+            json.dumps(dict(zip(COLUMNS, row))) + '\n' for row in batch
+        )
+
+
+FORMATS = {
+    'csv': ('text/csv', csv_stream),
+    'ndjson': ('application/x-ndjson', ndjson_stream),
+}
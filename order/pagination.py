@@ -0,0 +1,7 @@
+from menu.pagination import KeysetPagination
+
+
+class OrderPagination(KeysetPagination):
+    """Paginate orders newest first by (created_at, id), always"""
+    ordering_field = 'created_at'
+    always_paginate = True
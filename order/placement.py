@@ -0,0 +1,173 @@
+import sqlite3
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from core.models import Menu, Order
+from .summary import apply_deltas, order_key
+
+# Insert the order only while its menu is open and offers the option, and
+# replace the previous order of the user for the menu, in one statement.
+UPSERT_SQL = '''
+    INSERT INTO {order} (user_id, menu_id, option_id, observation, created_at)
+    SELECT %s, menu.id, %s, %s, %s FROM {menu} menu
+    WHERE menu.id = %s AND menu.cutoff_at > %s AND EXISTS (
+        SELECT 1 FROM {links} link
+        WHERE link.menu_id = menu.id AND link.option_id = %s
+    )
+    ON CONFLICT (user_id, menu_id) DO UPDATE
+    SET option_id = excluded.option_id, observation = excluded.observation
+    RETURNING id, user_id, menu_id, option_id, observation, created_at
+'''
+
+# The same statement for many orders, given as (user, menu, option,
+# observation) rows. VALUES columns are named column1 to column4.
+BATCH_UPSERT_SQL = '''
+    INSERT INTO {order} (user_id, menu_id, option_id, observation, created_at)
+    SELECT placed.column1, menu.id, placed.column3, placed.column4, %s
+    FROM (VALUES {rows}) placed, {menu} menu
+    WHERE menu.id = placed.column2 AND menu.cutoff_at > %s AND EXISTS (
+        SELECT 1 FROM {links} link
+        WHERE link.menu_id = menu.id AND link.option_id = placed.column3
+    )
+    ON CONFLICT (user_id, menu_id) DO UPDATE
+    SET option_id = excluded.option_id, observation = excluded.observation
+    RETURNING id, user_id, menu_id, option_id, observation, created_at
+'''
+BATCH_CHUNK_SIZE = 200
+
+
+def supports_conditional_upsert():
+    """Return whether the database runs UPSERT_SQL"""
+    if connection.vendor == 'postgresql':
+        return True
+    return (connection.vendor == 'sqlite'
+            and sqlite3.sqlite_version_info >= (3, 35, 0))
+
+
+def upsert_sql(template=UPSERT_SQL, **kwargs):
+    quote = connection.ops.quote_name
+    return template.format(
+        order=quote(Order._meta.db_table),
+        menu=quote(Menu._meta.db_table),
+        links=quote(Menu.options.through._meta.db_table),
+        **kwargs
+    )
+
+
+def place_order(user, menu_id, option_id, observation='', now=None):
+    """Place or replace the order of an user, None if it is rejected"""
+    now = now or timezone.now()
+    if not supports_conditional_upsert():
+        return place_order_with_lock(user, menu_id, option_id, observation,
+                                     now)
+
+    timestamp = connection.ops.adapt_datetimefield_value(now)
+    params = [
+        user.pk, option_id, observation, timestamp,
+        menu_id, timestamp, option_id,
+    ]
+    if not settings.ORDER_SUMMARY_ENABLED:
+        orders = list(Order.objects.raw(upsert_sql(), params))
+        return orders[0] if orders else None
+
+    # The statement skips the order signals keeping the summary up to date
+    with transaction.atomic():
+        previous = Order.objects.filter(
+            user=user, menu_id=menu_id
+        ).only('menu_id', 'option_id', 'observation').first()
+        orders = list(Order.objects.raw(upsert_sql(), params))
+        if not orders:
+            return None
+
+        deltas = Counter({order_key(orders[0]): 1})
+        if previous is not None:
+            deltas[order_key(previous)] -= 1
+        apply_deltas(deltas)
+
+    return orders[0]
+
+
+def place_orders(orders, now=None):
+    """Place the open orders of distinct users and menus, return them"""
+    # Orders are (user id, menu id, option id, observation) tuples
+    now = now or timezone.now()
+    orders = list(orders)
+    if not supports_conditional_upsert():
+        user_model = get_user_model()
+        placed = (
+            place_order_with_lock(user_model(pk=user_id), menu_id,
+                                  option_id, observation, now)
+            for user_id, menu_id, option_id, observation in orders
+        )
+        return [order for order in placed if order is not None]
+
+    timestamp = connection.ops.adapt_datetimefield_value(now)
+    placed = []
+    with transaction.atomic():
+        for start in range(0, len(orders), BATCH_CHUNK_SIZE):
+            chunk = orders[start:start + BATCH_CHUNK_SIZE]
+            previous = []
+            if settings.ORDER_SUMMARY_ENABLED:
+                keys = {(user_id, menu_id) for user_id, menu_id, *_ in chunk}
+                previous = [
+                    order for order in Order.objects.filter(
+                        user_id__in={user_id for user_id, _ in keys},
+                        menu_id__in={menu_id for _, menu_id in keys},
+                    ).only('user_id', 'menu_id', 'option_id', 'observation')
+                    if (order.user_id, order.menu_id) in keys
+                ]
+
+            sql = upsert_sql(
+                BATCH_UPSERT_SQL,
+                rows=', '.join(['(%s, %s, %s, %s)'] * len(chunk))
+            )
+            params = [timestamp, *(value for row in chunk for value in row),
+                      timestamp]
+            chunk_placed = list(Order.objects.raw(sql, params))
+            placed.extend(chunk_placed)
+
+            if settings.ORDER_SUMMARY_ENABLED:
+                accepted = {(o.user_id, o.menu_id) for o in chunk_placed}
+                deltas = Counter(map(order_key, chunk_placed))
+                for order in previous:
+                    if (order.user_id, order.menu_id) in accepted:
+                        deltas[order_key(order)] -= 1
+                apply_deltas(deltas)
+
+    return placed
+
+
+def place_order_with_lock(user, menu_id, option_id, observation, now):
+    """Place an order on databases without conditional upserts"""
+    menu = Menu.objects.select_for_update().filter(
+        pk=menu_id, cutoff_at__gt=now, options=option_id
+    ).first()
+    if menu is None:
+        return None
+
+    order, created = Order.objects.update_or_create(
+        user=user, menu=menu,
+        defaults={'option_id': option_id, 'observation': observation}
+    )
+    return order
+
+
+def rejection(menu_id, option_id, now=None):
+    """Return why an order for a menu and option was not placed"""
+    now = now or timezone.now()
+    menu = Menu.objects.filter(pk=menu_id).annotate(
+        offers_option=Exists(Menu.options.through.objects.filter(
+            menu_id=OuterRef('pk'), option_id=option_id
+        ))
+    ).values('cutoff_at', 'offers_option').first()
+
+    if menu is None:
+        return 'missing'
+    if now >= menu['cutoff_at'] or menu['offers_option']:
+        return 'closed'
+    return 'invalid_option'
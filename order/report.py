@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.db.models import Count, Sum
+
+from core.models import Order, OrderSummary
+
+GROUP_FIELDS = (
+    'menu_id', 'menu__name', 'menu__date',
+    'option_id', 'option__description', 'observation',
+)
+
+
+def order_counts(**filters):
+    """Return the order counts per menu, option and observation"""
+    if settings.ORDER_SUMMARY_ENABLED:
+        rows = OrderSummary.objects.filter(count__gt=0, **filters)
+        total = Sum('count')
+    else:
+        rows = Order.objects.filter(option__isnull=False, **filters)
+        total = Count('id')
+
+    return rows.values(*GROUP_FIELDS).annotate(orders=total).order_by(
+        'menu__date', 'menu_id', 'option_id', 'observation'
+    )
+
+
+def build_report(rows):
+    """Fold order counts into per menu and per option totals"""
+    menus = {}
+    for row in rows:
+        menu = menus.get(row['menu_id'])
+        if menu is None:
+            menu = menus[row['menu_id']] = {
+                'id': row['menu_id'],
+                'name': row['menu__name'],
+                'date': row['menu__date'],
+                'orders': 0,
+                'options': {},
+            }
+
+        option = menu['options'].get(row['option_id'])
+        if option is None:
+            option = menu['options'][row['option_id']] = {
+                'id': row['option_id'],
+                'description': row['option__description'],
+                'orders': 0,
+                'observations': [],
+            }
+
+        menu['orders'] += row['orders']
+        option['orders'] += row['orders']
+        if row['observation']:
+            option['observations'].append({
+                'text': row['observation'],
+                'count': row['orders'],
+            })
+
+    for menu in menus.values():
+        menu['options'] = list(menu['options'].values())
+
+    return list(menus.values())
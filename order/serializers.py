@@ -0,0 +1,159 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from core.instrumentation import TimedSerializerMixin
+from core.models import Menu, Order
+from .placement import place_order, place_orders, rejection
+
+CLOSED_MESSAGE = _('Orders for this menu are closed')
+INVALID_OPTION_MESSAGE = _('Option is not part of the menu')
+MISSING_MENU_MESSAGE = _('Invalid pk "{pk_value}" - object does not exist.')
+
+
+class OrderSerializer(TimedSerializerMixin,
+                      serializers.ModelSerializer):
+    """Serializer for order objects"""
+    menu = serializers.IntegerField(source='menu_id')
+    option = serializers.IntegerField(source='option_id')
+
+    class Meta:
+        model = Order
+        fields = (
+            'id', 'user', 'menu', 'option', 'observation', 'created_at',
+        )
+        read_only_fields = ('id', 'user', 'created_at')
+
+    def create(self, validated_data):
+        """Place the order, replacing the user's previous one for the menu"""
+        # The insert checks the menu, it is only read to explain rejections
+        menu_id = validated_data['menu_id']
+        option_id = validated_data['option_id']
+        order = place_order(
+            validated_data['user'], menu_id, option_id,
+            validated_data.get('observation', '')
+        )
+        if order is not None:
+            return order
+
+        reason = rejection(menu_id, option_id)
+        if reason == 'missing':
+            raise serializers.ValidationError({'menu': [
+                MISSING_MENU_MESSAGE.format(pk_value=menu_id)
+            ]}, code='does_not_exist')
+        if reason == 'closed':
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [CLOSED_MESSAGE]
+            }, code='closed')
+        raise serializers.ValidationError(
+            {'option': [INVALID_OPTION_MESSAGE]}, code='invalid'
+        )
+
+
+class OrderListSerializer(OrderSerializer):
+    """Serializer for listing orders with their employee and menu date"""
+    user_email = serializers.EmailField(source='user.email', read_only=True)
+    menu_date = serializers.DateField(source='menu.date', read_only=True)
+
+    class Meta(OrderSerializer.Meta):
+        fields = OrderSerializer.Meta.fields + ('user_email', 'menu_date')
+        read_only_fields = fields
+
+
+class OrderBatchItemSerializer(serializers.Serializer):
+    """Serializer for one of the orders placed in a batch"""
+    user = serializers.IntegerField()
+    menu = serializers.IntegerField()
+    option = serializers.IntegerField()
+    observation = serializers.CharField(
+        max_length=255,
+        allow_blank=True,
+        default=''
+    )
+
+
+class OrderBatchSerializer(serializers.Serializer):
+    """Serializer for placing the orders of many employees at once"""
+    orders = OrderBatchItemSerializer(many=True, allow_empty=False)
+
+    def validate_orders(self, orders):
+        """Validate every order with one query per related table"""
+        max_size = settings.ORDER_BATCH_MAX_SIZE
+        if len(orders) > max_size:
+            msg = _('Ensure this list has no more than {max_size} orders')
+            raise serializers.ValidationError(
+                msg.format(max_size=max_size), code='max_length'
+            )
+
+        choices = Menu.options.through.objects.filter(
+            menu_id__in={order['menu'] for order in orders}
+        ).values_list('menu_id', 'option_id', 'menu__cutoff_at')
+        user_ids = set(get_user_model().objects.filter(
+            id__in={order['user'] for order in orders},
+            is_active=True
+        ).values_list('id', flat=True))
+
+        now = timezone.now()
+        open_menus = set()
+        valid_choices = set()
+        for menu_id, option_id, cutoff in choices:
+            valid_choices.add((menu_id, option_id))
+            if now < cutoff:
+                open_menus.add(menu_id)
+
+        errors = []
+        for order in orders:
+            error = {}
+            if order['user'] not in user_ids:
+                error['user'] = [_('Invalid user')]
+            if (order['menu'], order['option']) not in valid_choices:
+                error['option'] = [INVALID_OPTION_MESSAGE]
+            elif order['menu'] not in open_menus:
+                error['menu'] = [CLOSED_MESSAGE]
+            errors.append(error)
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        return orders
+
+    def create(self, validated_data):
+        """Upsert every order of the batch in a single transaction"""
+        orders = validated_data['orders']
+        placed = {
+            (order['user'], order['menu']): order for order in orders
+        }
+        with transaction.atomic():
+            # The menus are checked again by the upsert itself, orders
+            # rejected since the validation cancel the whole batch
+            created = place_orders(
+                (user_id, menu_id, order['option'], order['observation'])
+                for (user_id, menu_id), order in placed.items()
+            )
+            if len(created) < len(placed):
+                accepted = {(order.user_id, order.menu_id)
+                            for order in created}
+                raise serializers.ValidationError({'orders': [
+                    {} if (order['user'], order['menu']) in accepted
+                    or placed[order['user'], order['menu']] is not order
+                    else self.rejection_error(order)
+                    for order in orders
+                ]})
+
+        return created
+
+    def rejection_error(self, order):
+        """Return the error of an order the upsert rejected"""
+        reason = rejection(order['menu'], order['option'])
+        if reason == 'invalid_option':
+            return {'option': [INVALID_OPTION_MESSAGE]}
+        if reason == 'missing':
+            return {'menu': [
+                MISSING_MENU_MESSAGE.format(pk_value=order['menu'])
+            ]}
+        return {'menu': [CLOSED_MESSAGE]}
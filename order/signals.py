@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.models import Order
+from .summary import apply_deltas, order_key, record_orders
+
+
+@receiver(pre_save, sender=Order)
+def order_saving(sender, instance, **kwargs):
+    """Remember where an existing order was counted before it changes"""
+    if settings.ORDER_SUMMARY_ENABLED and instance.pk:
+        instance._summary_key = Order.objects.filter(
+            pk=instance.pk
+        ).values_list('menu_id', 'option_id', 'observation').first()
+
+
+@receiver(post_save, sender=Order)
+def order_saved(sender, instance, created, **kwargs):
+    """Count a new or changed order in the summary"""
+    previous = instance.__dict__.pop('_summary_key', None)
+    if created or previous is None:
+        record_orders([instance])
+    elif previous != order_key(instance):
+        apply_deltas({previous: -1, order_key(instance): 1})
+
+
+@receiver(post_delete, sender=Order)
+def order_deleted(sender, instance, **kwargs):
+    """Discount a deleted order from the summary"""
+    record_orders([instance], sign=-1)
@@ -0,0 +1,61 @@
+from collections import Counter
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from core.models import Order, OrderSummary
+
+
+def order_key(order):
+    """Return the summary row an order is counted in"""
+    return order.menu_id, order.option_id, order.observation
+
+
+def apply_deltas(deltas):
+    """Add some count deltas to the summary, creating missing rows"""
+    for (menu_id, option_id, observation), delta in deltas.items():
+        if not delta or option_id is None:
+            continue
+
+        lookup = {
+            'menu_id': menu_id,
+            'option_id': option_id,
+            'observation': observation,
+        }
+        rows = OrderSummary.objects.filter(**lookup)
+        if rows.update(count=F('count') + delta) or delta < 0:
+            continue
+
+        try:
+            with transaction.atomic():
+                OrderSummary.objects.create(count=delta, **lookup)
+        except IntegrityError:
+            rows.update(count=F('count') + delta)
+
+
+def record_orders(orders, sign=1):
+    """Count some orders in the summary, when it is enabled"""
+    if settings.ORDER_SUMMARY_ENABLED:
+        apply_deltas(Counter({
+            key: sign * count
+            for key, count in Counter(map(order_key, orders)).items()
+        }))
+
+
+def rebuild_summary():
+    """Recompute the whole summary from the orders"""
+    rows = Order.objects.filter(option__isnull=False).values(
+        'menu_id', 'option_id', 'observation'
+    ).annotate(total=Count('id')).order_by()
+    with transaction.atomic():
+        OrderSummary.objects.all().delete()
+        OrderSummary.objects.bulk_create(
+            OrderSummary(
+                menu_id=row['menu_id'],
+                option_id=row['option_id'],
+                observation=row['observation'],
+                count=row['total'],
+            )
+            for row in rows.iterator()
+        )
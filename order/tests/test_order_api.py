@@ -0,0 +1,372 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.cutoff import local_today
+from core.models import Menu, Option, Order, OrderSummary
+from order.placement import place_orders
+
+from unittest import mock
+import datetime
+import time
+
+ORDERS_URL = reverse('order:order-list')
+BATCH_URL = reverse('order:order-batch')
+
+
+def sample_menu(days=1, options=('Corn pie, Salad and Dessert',)):
+    """Create and return a menu some days away from today"""
+    menu = Menu.objects.create(
+        date=local_today() + datetime.timedelta(days=days)
+    )
+    menu.options.add(*[
+        Option.objects.intern(description)
+        for description in options
+    ])
+    return menu
+
+
+def create_users(count):
+    """Create and return many users without hashing passwords"""
+    get_user_model().objects.bulk_create([
+        get_user_model()(email=f'employee{i}@cornershop.cl', password='!')
+        for i in range(count)
+    ])
+    return list(get_user_model().objects.filter(
+        email__startswith='employee'
+    ).order_by('id'))
+
+
+class PublicOrderApiTests(TestCase):
+    """Test the publicly available orders API"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_login_required(self):
+        """Test that login is required for placing orders"""
+        res = self.client.post(ORDERS_URL, {})
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class PrivateOrderApiTests(TestCase):
+    """Test the authorized orders API"""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            'employee@cornershop.cl',
+            'testpass'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_create_order_successful(self):
+        """Test placing an order for the authenticated user"""
+        menu = sample_menu()
+        payload = {
+            'menu': menu.id,
+            'option': menu.options.get().id,
+            'observation': 'No tomatoes in the salad',
+        }
+
+        res = self.client.post(ORDERS_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        order = Order.objects.get(id=res.data['id'])
+        self.assertEqual(order.user, self.user)
+        self.assertEqual(order.observation, payload['observation'])
+
+    def test_create_order_replaces_previous(self):
+        """Test ordering twice for a menu updates the first order"""
+        menu = sample_menu(options=('Corn pie', 'Chicken Nugget Rice'))
+        first, second = menu.options.order_by('id')
+        self.client.post(ORDERS_URL, {'menu': menu.id, 'option': first.id})
+
+        res = self.client.post(
+            ORDERS_URL,
+            {'menu': menu.id, 'option': second.id, 'observation': 'Spicy'}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        order = Order.objects.get(user=self.user, menu=menu)
+        self.assertEqual(order.id, res.data['id'])
+        self.assertEqual(order.option, second)
+        self.assertEqual(order.observation, 'Spicy')
+
+    def test_create_order_single_query(self):
+        """Test an order is checked and placed in a single statement"""
+        menu = sample_menu()
+        payload = {'menu': menu.id, 'option': menu.options.get().id}
+
+        with self.assertNumQueries(1):
+            res = self.client.post(ORDERS_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+    def test_create_order_without_upsert(self):
+        """Test orders are placed on databases without conditional upserts"""
+        menu = sample_menu()
+        closed = sample_menu(days=-1)
+
+        with mock.patch('order.placement.supports_conditional_upsert',
+                        return_value=False):
+            res = self.client.post(
+                ORDERS_URL,
+                {'menu': menu.id, 'option': menu.options.get().id}
+            )
+            closed_res = self.client.post(
+                ORDERS_URL,
+                {'menu': closed.id, 'option': closed.options.get().id}
+            )
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Order.objects.filter(id=res.data['id']).exists())
+        self.assertEqual(closed_res.status_code,
+                         status.HTTP_400_BAD_REQUEST)
+
+    def test_create_order_menu_cutoff_time(self):
+        """Test each menu may close orders at its own time"""
+        menu = sample_menu(days=0)
+        menu.cutoff_time = datetime.time(0, 0)
+        menu.save()
+
+        res = self.client.post(
+            ORDERS_URL, {'menu': menu.id, 'option': menu.options.get().id}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('non_field_errors', res.data)
+
+    def test_create_order_missing_menu(self):
+        """Test orders for unknown menus are rejected"""
+        menu = sample_menu()
+
+        res = self.client.post(
+            ORDERS_URL,
+            {'menu': menu.id + 1, 'option': menu.options.get().id}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('menu', res.data)
+
+    @override_settings(ORDER_SUMMARY_ENABLED=True)
+    def test_create_order_updates_summary(self):
+        """Test replacing an order moves it between summary rows"""
+        menu = sample_menu(options=('Corn pie', 'Chicken Nugget Rice'))
+        first, second = menu.options.order_by('id')
+        for option in (first, second):
+            self.client.post(
+                ORDERS_URL, {'menu': menu.id, 'option': option.id}
+            )
+
+        self.assertEqual(
+            list(OrderSummary.objects.filter(count__gt=0).values_list(
+                'option_id', 'count'
+            )),
+            [(second.id, 1)]
+        )
+
+    def test_create_order_after_cutoff(self):
+        """Test orders are rejected once the menu cutoff has passed"""
+        menu = sample_menu(days=-1)
+        payload = {'menu': menu.id, 'option': menu.options.get().id}
+
+        res = self.client.post(ORDERS_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Order.objects.exists())
+
+    def test_create_order_option_not_in_menu(self):
+        """Test the option must belong to the menu"""
+        menu = sample_menu()
+        other = Option.objects.create(description='Rice with hamburger')
+
+        res = self.client.post(
+            ORDERS_URL, {'menu': menu.id, 'option': other.id}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('option', res.data)
+
+    def test_batch_requires_staff(self):
+        """Test only staff users can place orders in batch"""
+        res = self.client.post(BATCH_URL, {'orders': []}, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class BatchOrderApiTests(TestCase):
+    """Test placing orders in batch"""
+
+    def setUp(self):
+        self.lead = get_user_model().objects.create_user(
+            'lead@cornershop.cl',
+            'testpass',
+            is_staff=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.lead)
+        self.menu = sample_menu(options=('Corn pie', 'Chicken Nugget Rice'))
+        self.option_ids = [o.id for o in self.menu.options.all()]
+
+    def test_batch_create(self):
+        """Test placing the orders of several employees at once"""
+        users = create_users(3)
+        payload = {'orders': [
+            {
+                'user': user.id,
+                'menu': self.menu.id,
+                'option': self.option_ids[i % 2],
+                'observation': 'No tomatoes in the salad',
+            }
+            for i, user in enumerate(users)
+        ]}
+
+        res = self.client.post(BATCH_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data['count'], 3)
+        self.assertEqual(Order.objects.filter(menu=self.menu).count(), 3)
+
+    def test_batch_upserts_orders(self):
+        """Test a batch replaces existing orders and keeps the last one"""
+        users = create_users(2)
+        Order.objects.create(
+            user=users[0], menu=self.menu, option_id=self.option_ids[0]
+        )
+        payload = {'orders': [
+            {'user': users[0].id, 'menu': self.menu.id,
+             'option': self.option_ids[1], 'observation': 'Updated'},
+            {'user': users[1].id, 'menu': self.menu.id,
+             'option': self.option_ids[0]},
+            {'user': users[1].id, 'menu': self.menu.id,
+             'option': self.option_ids[1]},
+        ]}
+
+        res = self.client.post(BATCH_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data['count'], 2)
+        orders = Order.objects.filter(menu=self.menu).order_by('user_id')
+        self.assertEqual(
+            list(orders.values_list('user_id', 'option_id', 'observation')),
+            [
+                (users[0].id, self.option_ids[1], 'Updated'),
+                (users[1].id, self.option_ids[1], ''),
+            ]
+        )
+
+    def test_batch_rejected_as_a_whole(self):
+        """Test one invalid order rejects the whole batch"""
+        users = create_users(2)
+        closed_menu = sample_menu(days=-1, options=('Premium chicken',))
+        payload = {'orders': [
+            {
+                'user': users[0].id,
+                'menu': self.menu.id,
+                'option': self.option_ids[0],
+            },
+            {
+                'user': users[1].id,
+                'menu': closed_menu.id,
+                'option': closed_menu.options.get().id,
+            },
+            {
+                'user': 0,
+                'menu': self.menu.id,
+                'option': closed_menu.options.get().id,
+            },
+        ]}
+
+        res = self.client.post(BATCH_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = res.data['orders']
+        self.assertEqual(errors[0], {})
+        self.assertIn('menu', errors[1])
+        self.assertIn('user', errors[2])
+        self.assertIn('option', errors[2])
+        self.assertFalse(Order.objects.exists())
+
+    def test_batch_closed_after_validation(self):
+        """Test a menu closing during the request rejects the batch"""
+        users = create_users(2)
+        Order.objects.create(
+            user=users[0], menu=self.menu, option_id=self.option_ids[0]
+        )
+        payload = {'orders': [
+            {'user': user.id, 'menu': self.menu.id,
+             'option': self.option_ids[1]}
+            for user in users
+        ]}
+        closed = self.menu.cutoff_at + datetime.timedelta(seconds=1)
+
+        with mock.patch('order.serializers.place_orders',
+                        side_effect=lambda orders: place_orders(
+                            orders, now=closed
+                        )):
+            res = self.client.post(BATCH_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data['orders'][1], {
+            'menu': ['Orders for this menu are closed'],
+        })
+        self.assertEqual(
+            list(Order.objects.values_list('option_id', flat=True)),
+            [self.option_ids[0]]
+        )
+
+    @override_settings(ORDER_SUMMARY_ENABLED=True)
+    def test_batch_updates_summaries(self):
+        """Test a batch keeps the order counts of each option"""
+        users = create_users(3)
+        Order.objects.create(
+            user=users[0], menu=self.menu, option_id=self.option_ids[0]
+        )
+        payload = {'orders': [
+            {'user': user.id, 'menu': self.menu.id,
+             'option': self.option_ids[1]}
+            for user in users[:2]
+        ] + [{'user': users[2].id, 'menu': self.menu.id,
+              'option': self.option_ids[0]}]}
+
+        res = self.client.post(BATCH_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        counts = dict(OrderSummary.objects.filter(
+            menu=self.menu
+        ).values_list('option_id', 'count'))
+        self.assertEqual(counts.get(self.option_ids[0], 0), 1)
+        self.assertEqual(counts[self.option_ids[1]], 2)
+
+    def test_batch_benchmark(self):
+        """Test a batch of 1,000 orders is validated and inserted fast"""
+        users = create_users(1000)
+        payload = {'orders': [
+            {
+                'user': user.id,
+                'menu': self.menu.id,
+                'option': self.option_ids[i % 2],
+            }
+            for i, user in enumerate(users)
+        ]}
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            res = self.client.post(BATCH_URL, payload, format='json')
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Order.objects.count(), 1000)
+        selects = [
+            q for q in queries.captured_queries
+            if q['sql'].startswith('SELECT')
+        ]
+        self.assertEqual(len(selects), 2)
+        self.assertLess(elapsed, 1.0)
@@ -0,0 +1,120 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Menu, Option, Order
+
+import csv
+import datetime
+import io
+import json
+import tracemalloc
+
+EXPORT_URL = reverse('order:order-export')
+
+
+def create_orders(date, count):
+    """Create a menu for a date with some orders"""
+    menu = Menu.objects.create(date=date, name=f'Menu {date}')
+    option = Option.objects.create(description=f'Corn pie {date}')
+    menu.options.add(option)
+    get_user_model().objects.bulk_create([
+        get_user_model()(email=f'{date}-{i}@cornershop.cl', name=f'E{i}')
+        for i in range(count)
+    ])
+    users = get_user_model().objects.filter(
+        email__startswith=f'{date}-'
+    )
+    Order.objects.bulk_create([
+        Order(user=user, menu=menu, option=option, observation='No salt')
+        for user in users
+    ])
+
+
+def peak_memory(response):
+    """Return the peak memory allocated while consuming a response"""
+    tracemalloc.start()
+    try:
+        for _ in response.streaming_content:
+            pass
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class OrderExportApiTests(TestCase):
+    """Test the streaming order export"""
+
+    def setUp(self):
+        self.nora = get_user_model().objects.create_user(
+            'nora@cornershop.cl', 'testpass', is_staff=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.nora)
+
+    def test_export_limited_to_staff(self):
+        """Test employees can not export orders"""
+        employee = get_user_model().objects.create_user(
+            'employee@cornershop.cl', 'testpass'
+        )
+        self.client.force_authenticate(employee)
+
+        res = self.client.get(EXPORT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_export_csv(self):
+        """Test a day of orders is exported as CSV"""
+        create_orders(datetime.date(2020, 12, 1), 3)
+        create_orders(datetime.date(2020, 12, 2), 2)
+
+        res = self.client.get(EXPORT_URL, {'start': '2020-12-01'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        self.assertEqual(res['Content-Type'], 'text/csv')
+        content = b''.join(res.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]['date'], '2020-12-01')
+        self.assertEqual(rows[0]['option'], 'Corn pie 2020-12-01')
+        self.assertEqual(rows[0]['observation'], 'No salt')
+
+    def test_export_ndjson_range(self):
+        """Test a date range is exported as NDJSON"""
+        create_orders(datetime.date(2020, 12, 1), 3)
+        create_orders(datetime.date(2020, 12, 2), 2)
+
+        res = self.client.get(EXPORT_URL, {
+            'start': '2020-12-01',
+            'end': '2020-12-31',
+            'output': 'ndjson',
+        })
+
+        lines = b''.join(res.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(json.loads(lines[-1])['date'], '2020-12-02')
+
+    def test_export_invalid_output(self):
+        """Test an unknown output format is rejected"""
+        res = self.client.get(EXPORT_URL, {'output': 'xlsx'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(ORDER_EXPORT_CHUNK_SIZE=100)
+    def test_export_memory_is_bounded(self):
+        """Test exporting ten times more rows does not grow memory"""
+        create_orders(datetime.date(2020, 12, 1), 200)
+        create_orders(datetime.date(2020, 12, 2), 2000)
+
+        small = peak_memory(self.client.get(EXPORT_URL, {
+            'start': '2020-12-01',
+        }))
+        large = peak_memory(self.client.get(EXPORT_URL, {
+            'start': '2020-12-02',
+        }))
+
+        self.assertLess(large, small * 2)
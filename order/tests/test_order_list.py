@@ -0,0 +1,191 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.cutoff import local_today
+from core.models import Menu, Option, Order
+
+import datetime
+
+ORDERS_URL = reverse('order:order-list')
+
+
+def detail_url(order_id):
+    """Return the order detail URL"""
+    return reverse('order:order-detail', args=[order_id])
+
+
+def sample_menu(days=1):
+    """Create and return a menu with one option some days from today"""
+    menu = Menu.objects.create(
+        date=local_today() + datetime.timedelta(days=days)
+    )
+    menu.options.add(Option.objects.intern('Corn pie'))
+    return menu
+
+
+def sample_order(user, menu, observation=''):
+    """Create and return an order for the menu's first option"""
+    return Order.objects.create(
+        user=user, menu=menu, option=menu.options.first(),
+        observation=observation
+    )
+
+
+class PublicOrderListApiTests(TestCase):
+    """Test the publicly available order listing"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_login_required(self):
+        """Test that login is required for listing orders"""
+        res = self.client.get(ORDERS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class PrivateOrderListApiTests(TestCase):
+    """Test the order listing for employees and staff"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.nora = get_user_model().objects.create_user(
+            'nora@cornershop.cl', 'testpass', is_staff=True
+        )
+        self.employee = get_user_model().objects.create_user(
+            'employee@cornershop.cl', 'testpass'
+        )
+        self.other = get_user_model().objects.create_user(
+            'other@cornershop.cl', 'testpass'
+        )
+        self.menu = sample_menu()
+        self.own = sample_order(self.employee, self.menu, 'No salt')
+        self.foreign = sample_order(self.other, self.menu)
+
+    def test_employee_sees_own_orders(self):
+        """Test that employees only list their own orders"""
+        self.client.force_authenticate(self.employee)
+
+        res = self.client.get(ORDERS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [order['id'] for order in res.data['results']], [self.own.id]
+        )
+        order = res.data['results'][0]
+        self.assertEqual(order['user_email'], 'employee@cornershop.cl')
+        self.assertEqual(order['menu_date'], self.menu.date.isoformat())
+        self.assertEqual(order['observation'], 'No salt')
+
+    def test_staff_sees_all_orders(self):
+        """Test that Nora lists every employee's orders"""
+        self.client.force_authenticate(self.nora)
+
+        res = self.client.get(ORDERS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [order['id'] for order in res.data['results']],
+            [self.foreign.id, self.own.id]
+        )
+
+    def test_employee_cannot_retrieve_foreign_order(self):
+        """Test that other employees' orders are not found"""
+        self.client.force_authenticate(self.employee)
+
+        res = self.client.get(detail_url(self.foreign.id))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_employee_retrieves_own_order(self):
+        """Test that employees can retrieve their own order"""
+        self.client.force_authenticate(self.employee)
+
+        res = self.client.get(detail_url(self.own.id))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['id'], self.own.id)
+
+    def test_staff_retrieves_any_order(self):
+        """Test that Nora can retrieve any order"""
+        self.client.force_authenticate(self.nora)
+
+        res = self.client.get(detail_url(self.foreign.id))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_filter_by_date_range(self):
+        """Test filtering orders by their menu date"""
+        later = sample_menu(days=5)
+        later_order = sample_order(self.other, later)
+        self.client.force_authenticate(self.nora)
+        start = later.date - datetime.timedelta(days=1)
+
+        res = self.client.get(ORDERS_URL, {'start': start.isoformat()})
+        self.assertEqual(
+            [order['id'] for order in res.data['results']], [later_order.id]
+        )
+
+        res = self.client.get(ORDERS_URL, {'end': start.isoformat()})
+        self.assertEqual(
+            [order['id'] for order in res.data['results']],
+            [self.foreign.id, self.own.id]
+        )
+
+    def test_filter_by_menu(self):
+        """Test filtering orders by menu"""
+        later = sample_menu(days=5)
+        later_order = sample_order(self.other, later)
+        self.client.force_authenticate(self.nora)
+
+        res = self.client.get(ORDERS_URL, {'menu': later.id})
+
+        self.assertEqual(
+            [order['id'] for order in res.data['results']], [later_order.id]
+        )
+
+    def test_invalid_filter(self):
+        """Test that invalid filters are rejected"""
+        self.client.force_authenticate(self.nora)
+
+        res = self.client.get(ORDERS_URL, {'start': 'yesterday'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_constant_queries(self):
+        """Test that the listing queries do not grow with the page size"""
+        for days in range(2, 12):
+            sample_order(self.employee, sample_menu(days=days))
+        self.client.force_authenticate(self.nora)
+
+        with self.assertNumQueries(1):
+            small = self.client.get(ORDERS_URL, {'page_size': 2})
+        with self.assertNumQueries(1):
+            large = self.client.get(ORDERS_URL, {'page_size': 50})
+
+        self.assertEqual(len(small.data['results']), 2)
+        self.assertEqual(len(large.data['results']), 12)
+
+    def test_cursor_pagination(self):
+        """Test paging through orders with the cursor"""
+        for days in range(2, 5):
+            sample_order(self.employee, sample_menu(days=days))
+        self.client.force_authenticate(self.nora)
+
+        seen = []
+        res = self.client.get(ORDERS_URL, {'page_size': 2})
+        while True:
+            seen += [order['id'] for order in res.data['results']]
+            if res.data['next'] is None:
+                break
+            res = self.client.get(res.data['next'])
+
+        self.assertEqual(
+            seen,
+            list(Order.objects.order_by('-created_at', '-id')
+                 .values_list('id', flat=True))
+        )
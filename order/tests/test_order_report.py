@@ -0,0 +1,140 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Menu, Option, Order, OrderSummary
+from order.summary import rebuild_summary
+
+import datetime
+import time
+
+REPORT_URL = reverse('order:order-report')
+
+
+def sample_menu(date, descriptions=('Corn pie', 'Chicken Nugget Rice')):
+    """Create and return a menu with some options"""
+    menu = Menu.objects.create(date=date)
+    menu.options.add(*[
+        Option.objects.intern(description)
+        for description in descriptions
+    ])
+    return menu
+
+
+def create_users(count, prefix='employee'):
+    """Create and return many users without hashing passwords"""
+    get_user_model().objects.bulk_create([
+        get_user_model()(email=f'{prefix}{i}@cornershop.cl', password='!')
+        for i in range(count)
+    ])
+    return list(get_user_model().objects.filter(
+        email__startswith=prefix
+    ).order_by('id'))
+
+
+class OrderReportApiTests(TestCase):
+    """Test the order report"""
+
+    def setUp(self):
+        self.nora = get_user_model().objects.create_user(
+            'nora@cornershop.cl', 'testpass', is_staff=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.nora)
+        self.date = datetime.date(2020, 12, 1)
+        self.menu = sample_menu(self.date)
+        self.corn, self.chicken = self.menu.options.order_by('id')
+        self.users = create_users(4)
+
+    def place_orders(self):
+        for user, option, observation in (
+            (self.users[0], self.corn, 'No tomatoes in the salad'),
+            (self.users[1], self.corn, 'No tomatoes in the salad'),
+            (self.users[2], self.corn, ''),
+            (self.users[3], self.chicken, 'Extra rice'),
+        ):
+            Order.objects.create(user=user, menu=self.menu, option=option,
+                                 observation=observation)
+
+    def test_report_limited_to_staff(self):
+        """Test employees can not see the report"""
+        self.client.force_authenticate(self.users[0])
+
+        res = self.client.get(REPORT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_report_counts(self):
+        """Test the report counts orders per option and observation"""
+        self.place_orders()
+
+        with self.assertNumQueries(1):
+            res = self.client.get(REPORT_URL, {'date': '2020-12-01'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        menu, = res.data['menus']
+        self.assertEqual(menu['orders'], 4)
+        corn, chicken = menu['options']
+        self.assertEqual(corn['orders'], 3)
+        self.assertEqual(corn['observations'], [
+            {'text': 'No tomatoes in the salad', 'count': 2},
+        ])
+        self.assertEqual(chicken['orders'], 1)
+
+    def test_report_invalid_date(self):
+        """Test an invalid date is rejected"""
+        res = self.client.get(REPORT_URL, {'date': 'yesterday'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(ORDER_SUMMARY_ENABLED=True)
+    def test_summary_refreshed_incrementally(self):
+        """Test the summary follows order creations, updates and deletes"""
+        self.place_orders()
+        order = Order.objects.get(user=self.users[3])
+        order.option = self.corn
+        order.save()
+        Order.objects.filter(user=self.users[2]).delete()
+
+        res = self.client.get(REPORT_URL, {'menu': self.menu.id})
+
+        corn, = res.data['menus'][0]['options']
+        self.assertEqual(corn['orders'], 3)
+        self.assertEqual(sorted(
+            (o['text'], o['count']) for o in corn['observations']
+        ), [('Extra rice', 1), ('No tomatoes in the salad', 2)])
+
+    def test_rebuild_summary(self):
+        """Test the summary can be rebuilt from the orders"""
+        self.place_orders()
+
+        rebuild_summary()
+
+        self.assertEqual(
+            sum(OrderSummary.objects.values_list('count', flat=True)), 4
+        )
+
+    def test_report_benchmark(self):
+        """Test the report stays fast over 100k historical orders"""
+        users = create_users(1000, prefix='history')
+        menus = [
+            sample_menu(self.date - datetime.timedelta(days=day))
+            for day in range(1, 101)
+        ]
+        for menu in menus:
+            option_ids = list(menu.options.values_list('id', flat=True))
+            Order.objects.bulk_create([
+                Order(user=user, menu=menu, option_id=option_ids[i % 2])
+                for i, user in enumerate(users)
+            ], batch_size=500)
+        self.place_orders()
+
+        start = time.perf_counter()
+        res = self.client.get(REPORT_URL, {'date': '2020-12-01'})
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(res.data['menus'][0]['orders'], 4)
+        self.assertLess(elapsed, 0.1)
@@ -0,0 +1,13 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+
+from . import views
+
+router = DefaultRouter()
+router.register('orders', views.OrderViewSet)
+
+app_name = 'order'
+
+urlpatterns = [
+    path('', include(router.urls))
+]
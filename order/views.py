@@ -0,0 +1,126 @@
+import datetime
+
+from django.http import StreamingHttpResponse
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+
+from core.cutoff import local_today
+from core.models import Order
+from user.authentication import CachedTokenAuthentication
+from . import serializers
+from .export import FORMATS, export_queryset, export_rows
+from .pagination import OrderPagination
+from .report import build_report, order_counts
+
+
+class OrderViewSet(viewsets.GenericViewSet,
+                   mixins.ListModelMixin,
+                   mixins.RetrieveModelMixin,
+                   mixins.CreateModelMixin):
+    """Manage orders in the database"""
+    authentication_classes = (CachedTokenAuthentication,)
+    permission_classes = (IsAuthenticated,)
+    queryset = Order.objects.all()
+    serializer_class = serializers.OrderSerializer
+    pagination_class = OrderPagination
+
+    def get_queryset(self):
+        """Return the orders the user may see, staff seeing them all"""
+        queryset = self.queryset
+        if self.action not in ('list', 'retrieve'):
+            return queryset
+
+        user = self.request.user
+        if not user.is_staff:
+            queryset = queryset.filter(user=user)
+
+        start = self._param(datetime.date.fromisoformat, 'start')
+        if start is not None:
+            queryset = queryset.filter(menu__date__gte=start)
+        end = self._param(datetime.date.fromisoformat, 'end')
+        if end is not None:
+            queryset = queryset.filter(menu__date__lte=end)
+        menu_id = self._param(int, 'menu')
+        if menu_id is not None:
+            queryset = queryset.filter(menu_id=menu_id)
+
+        return queryset.select_related('user', 'menu').only(
+            'id', 'user_id', 'menu_id', 'option_id', 'observation',
+            'created_at', 'user__email', 'menu__date'
+        )
+
+    def get_serializer_class(self):
+        """Return appropriate serializer class"""
+        if self.action == 'batch':
+            return serializers.OrderBatchSerializer
+        if self.action in ('list', 'retrieve'):
+            return serializers.OrderListSerializer
+
+        return self.serializer_class
+
+    def perform_create(self, serializer):
+        """Create a new order for the authenticated user"""
+        serializer.save(user=self.request.user)
+
+    @action(methods=['post'], detail=False,
+            permission_classes=(IsAdminUser,))
+    def batch(self, request):
+        """Place the orders of many employees at once"""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        orders = serializer.save()
+
+        return Response({'count': len(orders)},
+                        status=status.HTTP_201_CREATED)
+
+    @action(methods=['get'], detail=False,
+            permission_classes=(IsAdminUser,))
+    def report(self, request):
+        """Count the orders of a menu or a date per option"""
+        params = request.query_params
+        if 'menu' in params:
+            filters = {'menu_id': self._param(int, 'menu')}
+        elif 'date' in params:
+            date = self._param(datetime.date.fromisoformat, 'date')
+            filters = {'menu__date': date}
+        else:
+            filters = {'menu__date': local_today()}
+
+        rows = order_counts(**filters)
+        return Response({'menus': build_report(rows)})
+
+    @action(methods=['get'], detail=False,
+            permission_classes=(IsAdminUser,))
+    def export(self, request):
+        """Stream the orders of a date range as CSV or NDJSON"""
+        params = request.query_params
+        output = params.get('output', 'csv')
+        if output not in FORMATS:
+            raise ValidationError({'output': ['Must be csv or ndjson']})
+
+        start = self._param(
+            datetime.date.fromisoformat, 'start', local_today()
+        )
+        end = self._param(datetime.date.fromisoformat, 'end', start)
+
+        content_type, stream = FORMATS[output]
+        rows = export_rows(export_queryset(start, end))
+        response = StreamingHttpResponse(stream(rows),
+                                         content_type=content_type)
+        response['Content-Disposition'] = (
+            f'attachment; filename="orders-{start}-{end}.{output}"'
+        )
+        return response
+
+    def _param(self, convert, name, default=None):
+        """Convert a query parameter, rejecting invalid values"""
+        if name not in self.request.query_params:
+            return default
+
+        try:
+            return convert(self.request.query_params[name])
+        except ValueError:
+            raise ValidationError({name: ['Invalid value']})
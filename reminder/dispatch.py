@@ -0,0 +1,157 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+
+from core.models import Menu
+from .transport import TransportError, get_transport
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread safe token bucket limiting the rate of deliveries"""
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic,
+                 sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and take it"""
+        while True:
+            with self._lock:
+                now = self.clock()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+
+            self.sleep(wait)
+
+
+class ReminderStats:
+    """Outcome of a reminder fan-out"""
+
+    def __init__(self):
+        self.sent = 0
+        self.failed = 0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, delivered):
+        with self._lock:
+            if delivered:
+                self.sent += 1
+            else:
+                self.failed += 1
+
+    @property
+    def rate(self):
+        """Messages delivered per second"""
+        return self.sent / self.elapsed if self.elapsed else 0.0
+
+
+def render_message(menu):
+    """Render the reminder text of a menu"""
+    lines = ['Hello!', "I share with you today's menu :)", '']
+    options = menu.options.order_by('id').values_list(
+        'description', flat=True
+    )
+    for number, description in enumerate(options, start=1):
+        lines.append(f'Option {number}: {description}')
+
+    lines.extend([
+        '',
+        settings.PUBLIC_MENU_URL.format(uuid=menu.uuid),
+        '',
+        'Have a nice day!',
+    ])
+    return '\n'.join(lines)
+
+
+def deliver(transport, bucket, recipient, text):
+    """Send a message, retrying failures with exponential backoff"""
+    retries = settings.SLACK_RETRIES
+    for attempt in range(retries + 1):
+        bucket.acquire()
+        try:
+            transport.send(recipient, text)
+            return True
+        except TransportError as exc:
+            if attempt == retries or not exc.retryable:
+                logger.warning('Reminder to %s failed: %s', recipient, exc)
+                return False
+            delay = settings.SLACK_BACKOFF * 2 ** attempt
+            time.sleep(max(delay, exc.retry_after or 0))
+
+
+def send_menu_reminder(menu, transport=None):
+    """Send the reminder of a menu to every active user"""
+    # Recipients are streamed in chunks to a bounded pool of workers
+    transport = transport or get_transport()
+    workers = settings.SLACK_WORKERS
+    bucket = TokenBucket(settings.SLACK_RATE_LIMIT, settings.SLACK_BURST)
+    stats = ReminderStats()
+    text = render_message(menu)
+
+    recipients = get_user_model().objects.filter(
+        is_active=True
+    ).values_list('email', flat=True).iterator(
+        chunk_size=settings.SLACK_CHUNK_SIZE
+    )
+
+    slots = threading.BoundedSemaphore(workers * 2)
+
+    def done(future):
+        slots.release()
+        stats.record(future.exception() is None and future.result())
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for recipient in recipients:
+            slots.acquire()
+            future = pool.submit(deliver, transport, bucket, recipient, text)
+            future.add_done_callback(done)
+
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def _send_in_background(menu_id):
+    try:
+        menu = Menu.objects.get(pk=menu_id)
+        stats = send_menu_reminder(menu)
+        logger.info('Sent %s reminders for menu %s (%s failed)',
+                    stats.sent, menu_id, stats.failed)
+    except Exception:
+        logger.exception('Reminder for menu %s failed', menu_id)
+    finally:
+        connection.close()
+
+
+def send_menu_reminder_async(menu):
+    """Send the reminder of a menu from a background thread on commit"""
+    if not settings.SLACK_REMINDER_ENABLED:
+        return
+
+    def start():
+        threading.Thread(
+            target=_send_in_background, args=(menu.pk,), daemon=True
+        ).start()
+
+    transaction.on_commit(start)
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import Menu
+from reminder.dispatch import send_menu_reminder
+
+
+class Command(BaseCommand):
+    """Send the Slack reminder of a menu to every employee"""
+    help = "Send the Slack reminder with today's menu"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--menu', type=int, help='Menu id to send')
+
+    def handle(self, *args, **options):
+        if options['menu']:
+            menu = Menu.objects.filter(pk=options['menu']).first()
+        else:
+            menu = Menu.objects.for_today()
+
+        if menu is None:
+            raise CommandError('No menu to send')
+
+        stats = send_menu_reminder(menu)
+        self.stdout.write(
+            f'Sent {stats.sent} reminders ({stats.failed} failed) '
+            f'in {stats.elapsed:.2f}s, {stats.rate:.1f} messages/s'
+        )
@@ -0,0 +1,246 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from core.cutoff import local_today
+from core.models import Menu, Option
+from reminder import dispatch
+from reminder.transport import SlackTransport
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections import Counter
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import json
+import threading
+
+
+def slack_id(email):
+    """Return the Slack user id the stand-in gives an email"""
+    return 'U' + email.split('@')[0].upper()
+
+
+class SlackStandIn(ThreadingHTTPServer):
+    """Local HTTP server recording the messages posted to it"""
+
+    def __init__(self, failures=None, errors=None):
+        super().__init__(('127.0.0.1', 0), SlackHandler)
+        self.messages = []
+        self.lookups = []
+        self.attempts = Counter()
+        self.failures = dict(failures or {})
+        self.errors = dict(errors or {})
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}/'
+
+    def transport(self):
+        """Return a transport talking to this server"""
+        return SlackTransport(url=f'{self.url}chat.postMessage',
+                              lookup_url=f'{self.url}users.lookupByEmail')
+
+
+class SlackHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        email = parse_qs(urlsplit(self.path).query)['email'][0]
+        with self.server.lock:
+            self.server.lookups.append(email)
+        self.respond(200, {'ok': True, 'user': {'id': slack_id(email)}})
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        message = json.loads(self.rfile.read(length))
+        channel = message['channel']
+        with self.server.lock:
+            self.server.attempts[channel] += 1
+            failures = self.server.failures.get(channel, 0)
+            if failures:
+                self.server.failures[channel] = failures - 1
+            elif channel not in self.server.errors:
+                self.server.messages.append(message)
+
+        if channel in self.server.errors:
+            self.respond(200, {
+                'ok': False, 'error': self.server.errors[channel],
+            })
+        else:
+            self.respond(500 if failures else 200, {'ok': not failures})
+
+    def respond(self, status_code, payload):
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps(payload).encode())
+
+    def log_message(self, *args):
+        pass
+
+
+def sample_menu():
+    """Create and return today's menu"""
+    menu = Menu.objects.create(date=local_today())
+    menu.options.add(
+        Option.objects.create(description='Corn pie, Salad and Dessert'),
+        Option.objects.create(description='Premium chicken Salad')
+    )
+    return menu
+
+
+@override_settings(SLACK_BACKOFF=0.01, SLACK_RATE_LIMIT=1000,
+                   SLACK_BURST=1000, SLACK_CHUNK_SIZE=3)
+class ReminderDispatchTests(TestCase):
+    """Test the Slack reminder fan-out"""
+
+    def setUp(self):
+        cache.clear()
+        get_user_model().objects.bulk_create([
+            get_user_model()(email=f'employee{i}@cornershop.cl')
+            for i in range(10)
+        ])
+        get_user_model().objects.create_user(
+            'former@cornershop.cl', 'testpass', is_active=False
+        )
+        self.menu = sample_menu()
+
+    def start_server(self, **kwargs):
+        server = SlackStandIn(**kwargs)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_render_message(self):
+        """Test the reminder lists every option of the menu"""
+        text = dispatch.render_message(self.menu)
+
+        self.assertIn('Option 1: Corn pie, Salad and Dessert', text)
+        self.assertIn('Option 2: Premium chicken Salad', text)
+        self.assertIn(
+            f'https://nora.cornershop.io/menu/{self.menu.uuid}', text
+        )
+
+    def test_send_to_active_users(self):
+        """Test every active user receives the same message once"""
+        server = self.start_server()
+
+        stats = dispatch.send_menu_reminder(
+            self.menu, server.transport()
+        )
+
+        self.assertEqual(stats.sent, 10)
+        self.assertEqual(stats.failed, 0)
+        recipients = sorted(m['channel'] for m in server.messages)
+        self.assertEqual(len(set(recipients)), 10)
+        self.assertIn(slack_id('employee0@cornershop.cl'), recipients)
+        self.assertNotIn(slack_id('former@cornershop.cl'), recipients)
+        self.assertEqual(len({m['text'] for m in server.messages}), 1)
+
+    def test_failed_deliveries_retried(self):
+        """Test failed deliveries are retried until the retry budget"""
+        server = self.start_server(failures={
+            slack_id('employee1@cornershop.cl'): 2,
+            slack_id('employee2@cornershop.cl'): 10,
+        })
+
+        with override_settings(SLACK_RETRIES=2), \
+                self.assertLogs('reminder', 'WARNING') as logs:
+            stats = dispatch.send_menu_reminder(
+                self.menu, server.transport()
+            )
+
+        self.assertEqual(stats.sent, 9)
+        self.assertEqual(stats.failed, 1)
+        self.assertEqual(logs.output, [
+            'WARNING:reminder.dispatch:Reminder to employee2@cornershop.cl '
+            'failed: Slack responded 500',
+        ])
+        recipients = [m['channel'] for m in server.messages]
+        self.assertIn(slack_id('employee1@cornershop.cl'), recipients)
+        self.assertNotIn(slack_id('employee2@cornershop.cl'), recipients)
+        self.assertEqual(len(server.lookups), 10)
+
+    def test_permanent_errors_not_retried(self):
+        """Test deliveries Slack rejects for good fail at once"""
+        server = self.start_server(errors={
+            slack_id('employee3@cornershop.cl'): 'channel_not_found',
+        }, failures={
+            slack_id('employee4@cornershop.cl'): 1,
+        })
+
+        with self.assertLogs('reminder', 'WARNING') as logs:
+            stats = dispatch.send_menu_reminder(
+                self.menu, server.transport()
+            )
+
+        self.assertEqual((stats.sent, stats.failed), (9, 1))
+        self.assertEqual(logs.output, [
+            'WARNING:reminder.dispatch:Reminder to employee3@cornershop.cl '
+            'failed: channel_not_found',
+        ])
+        self.assertEqual(
+            server.attempts[slack_id('employee3@cornershop.cl')], 1
+        )
+        self.assertEqual(
+            server.attempts[slack_id('employee4@cornershop.cl')], 2
+        )
+
+    def test_user_ids_cached(self):
+        """Test each email is looked up once across reminders"""
+        server = self.start_server()
+
+        for _ in range(2):
+            dispatch.send_menu_reminder(self.menu, server.transport())
+
+        self.assertEqual(len(server.messages), 20)
+        self.assertEqual(len(server.lookups), 10)
+
+    def test_messages_per_second(self):
+        """Test the fan-out throughput is measured"""
+        server = self.start_server()
+
+        stats = dispatch.send_menu_reminder(
+            self.menu, server.transport()
+        )
+
+        self.assertGreater(stats.rate, 0)
+
+    @override_settings(SLACK_REMINDER_ENABLED=True)
+    def test_create_today_menu_triggers_reminder(self):
+        """Test creating today's menu schedules the reminder"""
+        client = APIClient()
+        with mock.patch('menu.views.send_menu_reminder_async') as send:
+            client.post(reverse('menu:menu-list'), {
+                'name': "Today's Menu",
+                'date': local_today(),
+            })
+
+        send.assert_called_once()
+
+
+class TokenBucketTests(TestCase):
+    """Test the token bucket rate limiter"""
+
+    def test_acquire_waits_for_refill(self):
+        """Test acquiring past the burst waits for new tokens"""
+        clock = mock.Mock(return_value=0.0)
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            clock.return_value += seconds
+
+        bucket = dispatch.TokenBucket(rate=10, capacity=2, clock=clock,
+                                      sleep=sleep)
+        for _ in range(4):
+            bucket.acquire()
+
+        self.assertEqual(len(sleeps), 2)
+        self.assertAlmostEqual(clock.return_value, 0.2)
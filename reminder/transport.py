@@ -0,0 +1,87 @@
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+
+# Slack errors worth retrying, the others fail the same way every time
+RETRYABLE_ERRORS = {'ratelimited', 'internal_error', 'service_unavailable',
+                    'request_timeout', 'fatal_error'}
+
+
+class TransportError(Exception):
+    """Raised when a message could not be delivered"""
+
+    def __init__(self, message, retry_after=None, retryable=True):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.retryable = retryable
+
+
+class BaseTransport:
+    """Deliver a text message to a single recipient"""
+
+    def send(self, recipient, text):
+        raise NotImplementedError
+
+
+class SlackTransport(BaseTransport):
+    """Deliver messages through the Slack Web API"""
+
+    def __init__(self, url=None, token=None, timeout=None,
+                 lookup_url=None):
+        self.url = url or settings.SLACK_API_URL
+        self.lookup_url = lookup_url or settings.SLACK_LOOKUP_URL
+        self.token = token or settings.SLACK_TOKEN
+        self.timeout = timeout or settings.SLACK_TIMEOUT
+
+    def send(self, recipient, text):
+        self.call(self.url, {'channel': self.user_id(recipient),
+                             'text': text})
+
+    def user_id(self, email):
+        """Return the Slack user id of an email address"""
+        key = f'slack-user:{email.lower()}'
+        user_id = cache.get(key)
+        if user_id is None:
+            query = urllib.parse.urlencode({'email': email})
+            payload = self.call(f'{self.lookup_url}?{query}')
+            user_id = payload['user']['id']
+            cache.set(key, user_id, settings.SLACK_USER_CACHE_TIMEOUT)
+        return user_id
+
+    def call(self, url, body=None):
+        """Call a Slack Web API method, posting a body when given"""
+        headers = {'Authorization': f'Bearer {self.token}'}
+        if body is not None:
+            body = json.dumps(body).encode()
+            headers['Content-Type'] = 'application/json; charset=utf-8'
+        request = urllib.request.Request(url, data=body, headers=headers)
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as res:
+                payload = json.loads(res.read() or b'{}')
+        except urllib.error.HTTPError as exc:
+            retry_after = exc.headers.get('Retry-After')
+            raise TransportError(
+                f'Slack responded {exc.code}',
+                retry_after=float(retry_after) if retry_after else None,
+                retryable=exc.code == 429 or exc.code >= 500
+            )
+        except (urllib.error.URLError, OSError, ValueError) as exc:
+            raise TransportError(str(exc))
+
+        if not payload.get('ok', True):
+            error = payload.get('error', 'Slack error')
+            raise TransportError(error,
+                                 retryable=error in RETRYABLE_ERRORS)
+        return payload
+
+
+def get_transport():
+    """Return an instance of the configured transport"""
+    return import_string(settings.SLACK_TRANSPORT)()
@@ -0,0 +1,105 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+
+class TokenCache:
+    """Thread safe LRU mapping of token keys to users with a TTL"""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """Return the cached user of a token, if still fresh"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            user, expires_at = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return user
+
+    def set(self, key, user):
+        """Cache the user of a token, evicting the least recently used"""
+        expires_at = self.clock() + settings.TOKEN_AUTH_CACHE_TTL
+        with self._lock:
+            self._entries[key] = (user, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > settings.TOKEN_AUTH_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys):
+        """Drop some tokens from the cache"""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = TokenCache()
+
+
+def shared_cache_key(key):
+    return f'auth:token:{key}'
+
+
+def get_shared_cache():
+    """Return the shared token cache, if one is configured"""
+    alias = settings.TOKEN_AUTH_SHARED_CACHE
+    return caches[alias] if alias else None
+
+
+def invalidate_tokens(keys):
+    """Drop some tokens from the local and shared caches"""
+    keys = list(keys)
+    token_cache.delete(*keys)
+    shared = get_shared_cache()
+    if shared is not None and keys:
+        shared.delete_many([shared_cache_key(key) for key in keys])
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Token authentication caching the user of each token"""
+
+    def authenticate_credentials(self, key):
+        # The shared cache is authoritative when configured, so a token
+        # revoked by another worker does not live on in the local LRU
+        shared = get_shared_cache()
+        if shared is not None:
+            user = shared.get(shared_cache_key(key))
+        else:
+            user = token_cache.get(key)
+
+        if user is None:
+            user = super().authenticate_credentials(key)[0]
+            if shared is not None:
+                shared.set(
+                    shared_cache_key(key), user, settings.TOKEN_AUTH_CACHE_TTL
+                )
+            else:
+                token_cache.set(key, user)
+        elif not user.is_active:
+            invalidate_tokens([key])
+            raise exceptions.AuthenticationFailed(
+                _('User inactive or deleted.')
+            )
+
+        return copy.copy(user), Token(key=key, user=user)
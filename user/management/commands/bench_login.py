@@ -0,0 +1,73 @@
+import json
+import multiprocessing
+import os
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import Client, override_settings
+from django.urls import reverse
+
+BENCH_EMAIL = 'bench-login@cornershop.cl'
+BENCH_PASSWORD = 'bench-password'
+
+
+def run_logins(count):
+    """Log in a number of times and return the elapsed seconds"""
+    client = Client(HTTP_HOST='localhost')
+    url = reverse('user:token')
+    payload = {'email': BENCH_EMAIL, 'password': BENCH_PASSWORD}
+
+    with override_settings(LOGIN_THROTTLE_RATE=None):
+        start = time.perf_counter()
+        for _ in range(count):
+            res = client.post(url, payload)
+            if res.status_code != 200:
+                raise RuntimeError(f'Login failed with {res.status_code}')
+        elapsed = time.perf_counter() - start
+
+    connections.close_all()
+    return elapsed
+
+
+class Command(BaseCommand):
+    """Benchmark the token endpoint with one process per core"""
+    help = 'Report logins per second per core on /api/user/token/'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=50,
+                            help='Logins made by each process')
+        parser.add_argument('--processes', type=int,
+                            default=os.cpu_count(),
+                            help='Number of processes to run')
+
+    def handle(self, *args, **options):
+        user_model = get_user_model()
+        user = user_model.objects.filter(email=BENCH_EMAIL).first()
+        if user is None:
+            user = user_model.objects.create_user(BENCH_EMAIL)
+        user.set_password(BENCH_PASSWORD)
+        user.save()
+
+        processes = options['processes']
+        logins = options['logins']
+        connections.close_all()
+
+        context = multiprocessing.get_context('fork')
+        start = time.perf_counter()
+        with context.Pool(processes) as pool:
+            elapsed = pool.map(run_logins, [logins] * processes)
+        wall = time.perf_counter() - start
+
+        total = logins * processes
+        self.stdout.write(json.dumps({
+            'hasher': user.password.split('$', 1)[0],
+            'processes': processes,
+            'logins': total,
+            'seconds': round(wall, 3),
+            'logins_per_second': round(total / wall, 2),
+            'logins_per_second_per_core': round(
+                sum(logins / seconds for seconds in elapsed) / processes, 2
+            ),
+        }, indent=2))
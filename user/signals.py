@@ -0,0 +1,22 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import invalidate_tokens
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def token_changed(sender, instance, **kwargs):
+    """Invalidate a token when it is regenerated or deleted"""
+    invalidate_tokens([instance.key])
+
+
+@receiver(post_save, sender=get_user_model())
+def user_changed(sender, instance, created, **kwargs):
+    """Invalidate the tokens of a user when it changes"""
+    if not created:
+        invalidate_tokens(Token.objects.filter(
+            user_id=instance.pk
+        ).values_list('key', flat=True))
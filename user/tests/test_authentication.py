@@ -0,0 +1,162 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import exceptions, status
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from user.authentication import (CachedTokenAuthentication, TokenCache,
+                                 token_cache)
+
+from unittest import mock
+
+import time
+
+ME_URL = reverse('user:me')
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    """Test the cached token authentication"""
+
+    def setUp(self):
+        token_cache.clear()
+        self.user = get_user_model().objects.create_user(
+            'employee@cornershop.cl', 'testpass', name='Employee'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.auth = CachedTokenAuthentication()
+
+    def test_repeated_authentication_skips_database(self):
+        """Test a cached token authenticates without queries"""
+        self.auth.authenticate_credentials(self.token.key)
+
+        with self.assertNumQueries(0):
+            user, token = self.auth.authenticate_credentials(self.token.key)
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(token.key, self.token.key)
+
+    def test_invalid_token(self):
+        """Test an unknown token is rejected"""
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials('unknown')
+
+    def test_deleted_token_invalidated(self):
+        """Test a deleted token stops authenticating"""
+        self.auth.authenticate_credentials(self.token.key)
+
+        self.token.delete()
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+
+    def test_deactivated_user_invalidated(self):
+        """Test deactivating a user stops its token from authenticating"""
+        self.auth.authenticate_credentials(self.token.key)
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+
+    def test_profile_update_visible(self):
+        """Test the profile served after an update is not stale"""
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        client.get(ME_URL)
+
+        client.patch(ME_URL, {'name': 'Renamed'})
+        res = client.get(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['name'], 'Renamed')
+
+    @override_settings(TOKEN_AUTH_SHARED_CACHE='default')
+    def test_shared_cache(self):
+        """Test a token cached by another process skips the database"""
+        self.auth.authenticate_credentials(self.token.key)
+        token_cache.clear()
+
+        with self.assertNumQueries(0):
+            user, _ = self.auth.authenticate_credentials(self.token.key)
+
+        self.assertEqual(user, self.user)
+
+    @override_settings(TOKEN_AUTH_SHARED_CACHE='default')
+    def test_shared_cache_revocation_seen_by_other_workers(self):
+        """Test a token revoked by another worker stops authenticating"""
+        self.auth.authenticate_credentials(self.token.key)
+
+        # Another worker handles the deletion with its own local cache
+        with mock.patch('user.authentication.token_cache', TokenCache()):
+            self.token.delete()
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+
+    @override_settings(TOKEN_AUTH_SHARED_CACHE='default')
+    def test_shared_cache_deactivation_seen_by_other_workers(self):
+        """Test a user deactivated by another worker is rejected"""
+        self.auth.authenticate_credentials(self.token.key)
+
+        with mock.patch('user.authentication.token_cache', TokenCache()):
+            self.user.is_active = False
+            self.user.save()
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+
+    def test_inactive_cached_user_rejected(self):
+        """Test a cached user found inactive is rejected and dropped"""
+        self.user.is_active = False
+        token_cache.set(self.token.key, self.user)
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+        self.assertIsNone(token_cache.get(self.token.key))
+
+    def test_benchmark_against_stock_class(self):
+        """Test cached authentication outperforms the stock class"""
+        iterations = 300
+        stock = TokenAuthentication()
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            stock.authenticate_credentials(self.token.key)
+        stock_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            self.auth.authenticate_credentials(self.token.key)
+        cached_elapsed = time.perf_counter() - start
+
+        self.assertLess(cached_elapsed * 5, stock_elapsed)
+
+
+@override_settings(TOKEN_AUTH_CACHE_SIZE=2, TOKEN_AUTH_CACHE_TTL=10)
+class TokenCacheTests(TestCase):
+    """Test the LRU token cache"""
+
+    def test_least_recently_used_evicted(self):
+        """Test the least recently used token is evicted first"""
+        cache = TokenCache()
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_entries_expire(self):
+        """Test entries are dropped once their TTL is over"""
+        clock = mock.Mock(return_value=0)
+        cache = TokenCache(clock=clock)
+        cache.set('a', 1)
+
+        clock.return_value = 10
+        self.assertIsNone(cache.get('a'))
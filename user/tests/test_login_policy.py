@@ -0,0 +1,77 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+TOKEN_URL = reverse('user:token')
+
+
+class LoginThrottleTests(TestCase):
+    """Test login attempts are limited per email address"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        get_user_model().objects.create_user('employee@cornershop.cl',
+                                             'testpass')
+
+    @override_settings(LOGIN_THROTTLE_RATE='2/minute')
+    def test_login_attempts_throttled_per_email(self):
+        """Test attempts over the rate are rejected for that email only"""
+        payload = {'email': 'employee@cornershop.cl', 'password': 'wrong'}
+        for _ in range(2):
+            self.client.post(TOKEN_URL, payload)
+
+        res = self.client.post(
+            TOKEN_URL, {**payload, 'email': 'Employee@Cornershop.cl'}
+        )
+        self.assertEqual(res.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        res = self.client.post(
+            TOKEN_URL, {'email': 'other@cornershop.cl', 'password': 'x'}
+        )
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_login_body_not_an_object(self):
+        """Test a login body that is not an object is a bad request"""
+        res = self.client.post(TOKEN_URL, ['employee@cornershop.cl'],
+                               format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class PasswordHasherPolicyTests(TestCase):
+    """Test the configurable password hashing policy"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    @override_settings(PASSWORD_PBKDF2_ITERATIONS=1000)
+    def test_configured_cost_used(self):
+        """Test new passwords use the configured cost"""
+        user = get_user_model().objects.create_user(
+            'employee@cornershop.cl', 'testpass'
+        )
+
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$1000$'))
+
+    def test_rehash_on_login(self):
+        """Test passwords are rehashed when the cost changes"""
+        with override_settings(PASSWORD_PBKDF2_ITERATIONS=1000):
+            user = get_user_model().objects.create_user(
+                'employee@cornershop.cl', 'testpass'
+            )
+
+        with override_settings(PASSWORD_PBKDF2_ITERATIONS=2000):
+            res = self.client.post(TOKEN_URL, {
+                'email': 'employee@cornershop.cl',
+                'password': 'testpass',
+            })
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$2000$'))
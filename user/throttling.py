@@ -0,0 +1,23 @@
+from collections.abc import Mapping
+
+from django.conf import settings
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class LoginRateThrottle(SimpleRateThrottle):
+    """Limit the login attempts made for each email address"""
+    scope = 'login'
+
+    def get_rate(self):
+        return settings.LOGIN_THROTTLE_RATE
+
+    def get_cache_key(self, request, view):
+        data = request.data if isinstance(request.data, Mapping) else {}
+        email = data.get('email')
+        if not email:
+            return None
+
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': str(email).strip().lower(),
+        }